@@ -1,5 +1,4 @@
 from typing import Callable
-import time
 
 from client.controllers.home_button_page_controller import HomeButtonPageController
 from client.model.account import Account
@@ -60,12 +59,10 @@ class CreateAccountPageController(HomeButtonPageController):
                 account, string_password
             )
             server_request.send()
-            start_time: float = time.time()
-            while server_request.is_response_success() is None:
-                if time.time() - start_time > self._CREATE_ACCOUNT_TIMEOUT_SEC:
-                    raise ConnectionError(
-                        "Server unresponsive. Account could not be created"
-                    )
+            if not server_request.wait_for_response(self._CREATE_ACCOUNT_TIMEOUT_SEC):
+                raise ConnectionError(
+                    "Server unresponsive. Account could not be created"
+                )
             if server_request.is_response_success() is False:
                 raise ConnectionError("Server could not properly create account")
             else:
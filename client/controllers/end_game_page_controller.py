@@ -1,5 +1,4 @@
 from typing import Callable, Optional
-import time
 
 from client.controllers.home_button_page_controller import HomeButtonPageController
 from client.model.account import Account
@@ -75,12 +74,10 @@ class EndGamePageController(HomeButtonPageController):
                     p1_id, p1_new_elo
                 )
                 server_request1.send()
-                start_time: float = time.time()
-                while server_request1.is_response_success() is None:
-                    if time.time() - start_time > self._SERVER_TIMEOUT_SEC:
-                        raise ConnectionError(
-                            "Server unresponsive. P1 ELO could not be updated"
-                        )
+                if not server_request1.wait_for_response(self._SERVER_TIMEOUT_SEC):
+                    raise ConnectionError(
+                        "Server unresponsive. P1 ELO could not be updated"
+                    )
                 if server_request1.is_response_success() is False:
                     raise ConnectionError("Server could not properly update P1 ELO")
                 # Update player 2's ELO
@@ -88,12 +85,10 @@ class EndGamePageController(HomeButtonPageController):
                     p2_id, p2_new_elo
                 )
                 server_request2.send()
-                start_time = time.time()
-                while server_request2.is_response_success() is None:
-                    if time.time() - start_time > self._SERVER_TIMEOUT_SEC:
-                        raise ConnectionError(
-                            "Server unresponsive. P2 ELO could not be updated"
-                        )
+                if not server_request2.wait_for_response(self._SERVER_TIMEOUT_SEC):
+                    raise ConnectionError(
+                        "Server unresponsive. P2 ELO could not be updated"
+                    )
                 if server_request2.is_response_success() is False:
                     raise ConnectionError("Server could not properly update P2 ELO")
             except ConnectionError as e:
@@ -133,12 +128,10 @@ class EndGamePageController(HomeButtonPageController):
                     game_manager=new_game_manager
                 )
                 server_request.send()
-                start_time: float = time.time()
-                while server_request.is_response_success() is None:
-                    if time.time() - start_time > self._SERVER_TIMEOUT_SEC:
-                        raise ConnectionError(
-                            "Server unresponsive. Game could not be created"
-                        )
+                if not server_request.wait_for_response(self._SERVER_TIMEOUT_SEC):
+                    raise ConnectionError(
+                        "Server unresponsive. Game could not be created"
+                    )
                 if server_request.is_response_success() is False:
                     raise ConnectionError("Server could not properly create game")
                 game_id: Optional[int] = server_request.get_game_id()
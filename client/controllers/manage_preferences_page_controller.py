@@ -1,4 +1,3 @@
-import time
 from typing import Callable
 
 from client.model.account import Account
@@ -80,12 +79,10 @@ class ManagePreferencesPageController(HomeButtonPageController):
                 account
             )
             server_request.send()
-            start_time: float = time.time()
-            while server_request.is_response_success() is None:
-                if time.time() - start_time > self._UPDATE_PREFERENCES_TIMEOUT_SEC:
-                    raise ConnectionError(
-                        "Server unresponsive. Game could not be created"
-                    )
+            if not server_request.wait_for_response(
+                self._UPDATE_PREFERENCES_TIMEOUT_SEC
+            ):
+                raise ConnectionError("Server unresponsive. Game could not be created")
             if server_request.is_response_success() is False:
                 raise ConnectionError("Server could not properly save preferences")
         except ConnectionError as e:
@@ -1,5 +1,4 @@
 import random
-import time
 from typing import Callable, Union, Optional
 
 from client.controllers.home_button_page_controller import HomeButtonPageController
@@ -101,8 +100,7 @@ class PickGamePageController(HomeButtonPageController):
         Create local single player game
         """
         self._view.destroy()
-        ai: AI = AI()
-        ai.difficulty = 0
+        ai: AI = GameManager.create_ai()
         game_manager = GameManager(
             Player(self._main_user),
             ai,
@@ -171,12 +169,8 @@ class PickGamePageController(HomeButtonPageController):
                 game_manager=game_manager
             )
             server_request.send()
-            start_time: float = time.time()
-            while server_request.is_response_success() is None:
-                if time.time() - start_time > self._CREATE_GAME_TIMEOUT_SEC:
-                    raise ConnectionError(
-                        "Server unresponsive. Game could not be created"
-                    )
+            if not server_request.wait_for_response(self._CREATE_GAME_TIMEOUT_SEC):
+                raise ConnectionError("Server unresponsive. Game could not be created")
             if server_request.is_response_success() is False:
                 raise ConnectionError("Server could not properly create game")
             game_id: Optional[int] = server_request.get_game_id()
@@ -195,12 +189,10 @@ class PickGamePageController(HomeButtonPageController):
                     self._main_user.id, True
                 )
                 server_request.send()
-                start_time: float = time.time()
-                while server_request.is_response_success() is None:
-                    if time.time() - start_time > self._CREATE_GAME_TIMEOUT_SEC:
-                        raise ConnectionError(
-                            "Server unresponsive. Game could not be retrieved"
-                        )
+                if not server_request.wait_for_response(self._CREATE_GAME_TIMEOUT_SEC):
+                    raise ConnectionError(
+                        "Server unresponsive. Game could not be retrieved"
+                    )
                 if server_request.is_response_success() is False:
                     raise ConnectionError("Server could not properly retrieve game")
                 else:
@@ -1,5 +1,5 @@
-import time
-from typing import Tuple, Callable
+import threading
+from typing import Tuple, Callable, Optional
 
 from client.controllers.base_page_controller import BasePageController
 from client.model.game import Game
@@ -26,6 +26,7 @@ class PlayGamePageController(BasePageController):
         super().__init__()
         self._task_execute_dict["place_tile"] = self.__execute_task_place_tile
         self._task_execute_dict["forfeit"] = self.__execute_task_forfeit
+        self._task_execute_dict["ai_moved"] = self.__execute_task_ai_moved
 
         self._end_game_callback: Callable[[GameManager], None] = end_game_callback
         self._game_manager: GameManager = game_manager
@@ -37,6 +38,8 @@ class PlayGamePageController(BasePageController):
             forfeit_cb=self.__handle_forfeit,
             preferences=self._main_user.get_preference(),
         )
+        # Thread searching for the AI's move, so this controller can keep handling tasks such as forfeit
+        self.__ai_move_thread: Optional[threading.Thread] = None
 
     def __handle_place_tile(self, coordinate: Tuple[int, int]) -> None:
         """
@@ -58,6 +61,9 @@ class PlayGamePageController(BasePageController):
 
         :param task_info: coordinate (see __handle_place_tile)
         """
+        # Clicks while the AI is thinking are not the user's move
+        if self.__ai_move_thread is not None:
+            return
         coordinate: Tuple[int, int] = task_info
         # Try placing tile. If tile placement doesn't work, don't do anything.
         # Having no action occur on a click is enough feedback to user that their click is invalid
@@ -79,18 +85,52 @@ class PlayGamePageController(BasePageController):
         if valid_placement:
             self._view.update_game(game=self._game)
         self._view.display()
+        if self._game_manager.is_ai_turn():
+            self.__ai_move_thread = threading.Thread(
+                target=self.__run_ai_move, daemon=True
+            )
+            self.__ai_move_thread.start()
+
+    def __run_ai_move(self) -> None:
+        """
+        Plays the AI's moves on the AI move thread, then reports back through the task queue
+        """
         self._game_manager.make_move()
+        self.queue(task_name="ai_moved")
+
+    def __execute_task_ai_moved(self) -> None:
+        """
+        Updates the view once the AI has moved
+        """
+        if self.__ai_move_thread is not None:
+            self.__ai_move_thread.join()
+            self.__ai_move_thread = None
         self._view.display()
         if self._game.is_game_over():
             self.__end_game()
             return
 
+    def __cancel_ai_move(self) -> None:
+        """
+        Stops the AI's search if it is still running and waits for the AI move thread to finish
+        """
+        if self.__ai_move_thread is not None:
+            self._game_manager.cancel_moves()
+            self.__ai_move_thread.join()
+            self.__ai_move_thread = None
+
     def __execute_task_forfeit(self) -> None:
         """
         Takes action on player forfeit by communicating with model and updating view
         """
+        self.__cancel_ai_move()
+        # An AI whose move was cut short did not press forfeit, the user did
+        forfeiting_player: int = self._game.curr_player
+        if self._game_manager.is_ai_turn():
+            forfeiting_player = 3 - forfeiting_player
+
         # Notify model who forfeited and notify parent game is over
-        self._game.forfeit(self._game.curr_player)
+        self._game.forfeit(forfeiting_player)
 
         # Save game and end
         self.__save_game()
@@ -100,6 +140,8 @@ class PlayGamePageController(BasePageController):
         """
         Performs actions needed to successfully end the game
         """
+        self.__cancel_ai_move()
+        self._game_manager.close()
         self._view.destroy()
         self._end_game_callback(self._game_manager)
 
@@ -110,12 +152,8 @@ class PlayGamePageController(BasePageController):
         try:
             server_request: SaveGameServerRequest = SaveGameServerRequest(self._game)
             server_request.send()
-            start_time: float = time.time()
-            while server_request.is_response_success() is None:
-                if time.time() - start_time > self._SAVE_GAME_TIMEOUT_SEC:
-                    raise ConnectionError(
-                        "Server unresponsive. Game could not be saved"
-                    )
+            if not server_request.wait_for_response(self._SAVE_GAME_TIMEOUT_SEC):
+                raise ConnectionError("Server unresponsive. Game could not be saved")
             if server_request.is_response_success() is False:
                 raise ConnectionError("Server could not properly save game")
         except ConnectionError:
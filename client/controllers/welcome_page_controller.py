@@ -1,4 +1,3 @@
-import time
 from typing import Callable, Tuple, List, Optional
 
 from random_word import RandomWords  # type: ignore
@@ -54,10 +53,7 @@ class WelcomePageController(BasePageController):
         server_request: GetTopELOsServerRequest = GetTopELOsServerRequest(num_elos=10)
         server_request.send()
         # Wait for request to finish
-        start_time = time.time()
-        while server_request.is_response_success() is None:
-            if time.time() - start_time > 5:
-                break
+        server_request.wait_for_response(5)
         elos: Optional[List[Tuple[str, int]]] = server_request.get_top_elos()
         if elos is None:
             return []
@@ -98,12 +94,10 @@ class WelcomePageController(BasePageController):
                 username=username
             )
             server_request.send()
-            start_time: float = time.time()
-            while server_request.is_response_success() is None:
-                if time.time() - start_time > self._CREDENTIAL_CHECK_TIMEOUT_SEC:
-                    raise ConnectionError(
-                        "Server unresponsive. Account could not be created"
-                    )
+            if not server_request.wait_for_response(self._CREDENTIAL_CHECK_TIMEOUT_SEC):
+                raise ConnectionError(
+                    "Server unresponsive. Account could not be created"
+                )
             if server_request.is_response_success() is False:
                 raise ConnectionError("Server could not properly create account")
             else:
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from client.model.board import Board
-from typing import Tuple
+from typing import Dict, List, Tuple
 
 
 class AbstractRule(ABC):
@@ -21,5 +21,31 @@ class AbstractRule(ABC):
         """
         pass
 
+    @staticmethod
+    @abstractmethod
+    def get_valid_moves(
+        plyr_num: int, brd: Board
+    ) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Finds every valid move for a player in a single sweep of the board, along with the disks each move flips
+
+        :param plyr_num: Player number of the player whose moves are being generated
+        :param brd: Current board
+        :return: Dictionary from each valid move to the positions of the disks that move flips
+        """
+        pass
+
+    @classmethod
+    def has_valid_move(cls, plyr_num: int, brd: Board) -> bool:
+        """
+        Determines if a player has any valid move. Rulesets can override this with something cheaper than
+        generating every move
+
+        :param plyr_num: Player number of the player being checked
+        :param brd: Current board
+        :return: Whether the player has a valid move, True, or not, False
+        """
+        return len(cls.get_valid_moves(plyr_num, brd)) > 0
+
     def __str__(self) -> str:
         return "AbstractRule"
@@ -1,14 +1,82 @@
-from typing import Tuple, List
+from dataclasses import dataclass
+from typing import Any, Tuple, List, Optional, Dict
 import copy
 import sys
+import threading
+import time
 
 from client.model.player import Player
-from client.model.game import Game
+from client.model.game import Game, MoveRecord
 from client.model.account import User
 from client.model.cell import CellState
+from client.model.endgame import EndgameSolver, SolverTimeout
+from client.model.evaluation import evaluate_masks
+from client.model.opening_book import BookEntry, OpeningBook, get_default_book
+from client.model.pattern_evaluation import PatternTables, get_default_tables
+from client.model.parallel_search import ParallelSearcher
+from client.model.transposition_table import Bound, TranspositionTable
+
+
+class _SearchTimeout(Exception):
+    """
+    Raised inside the search when the time budget for a move runs out
+    """
+
+    pass
+
+
+class SearchCancelled(Exception):
+    """
+    Raised by AI.get_move when AI.cancel is called from another thread during the search
+    """
+
+    pass
+
+
+@dataclass
+class SearchStats:
+    """
+    Counts of where the last search cut off, to measure how much each move ordering heuristic saves
+    """
+
+    # Positions whose search stopped early because a move was good enough for the opponent to avoid it
+    cutoffs: int = 0
+    # Cutoffs caused by the first move tried, which is what good ordering aims for
+    first_move_cutoffs: int = 0
+    # Positions answered straight from the transposition table without searching
+    table_cutoffs: int = 0
+    # Cutoffs by which heuristic put the move that caused them first in line
+    table_move_cutoffs: int = 0
+    corner_cutoffs: int = 0
+    killer_cutoffs: int = 0
+    history_cutoffs: int = 0
+    unordered_cutoffs: int = 0
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        """
+        :return: share of the cutoffs caused by the first move tried, or 0 if there were none
+        """
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+
+# Where a move's place in the search order came from, for SearchStats
+_TABLE_MOVE: int = 0
+_CORNER: int = 1
+_KILLER: int = 2
+_HISTORY: int = 3
+_UNORDERED: int = 4
 
 
 class AI(Player):
+    # Larger than any positional score so finished games always outweigh positions still in play
+    _WIN_SCORE: int = 1000000
+    _INFINITY: int = sys.maxsize
+    # Time budget for one move at each difficulty level shown in the game page, in seconds
+    LEVEL_TIME_LIMITS: Tuple[float, ...] = (0.05, 0.2, 0.5, 1.0, 2.0)
+    # Number of empty cells the AI starts solving the game exactly at, for each difficulty level
+    LEVEL_ENDGAME_EMPTIES: Tuple[int, ...] = (0, 6, 8, 10, 12)
+
     def __init__(self) -> None:
         """
         Create an AI that can play as a player
@@ -16,7 +84,49 @@ class AI(Player):
         user: User = User(username="AI")
         super().__init__(user)
         self._difficulty: int = 0
+        self._time_limit: Optional[float] = None
+        self._game_time: Optional[float] = None
+        self._clock_remaining: Optional[float] = None
+        # Plain minimax is kept as a reference for alpha-beta and can be selected by turning this off
+        self.alpha_beta: bool = True
+        self._nodes_searched: int = 0
+        self._last_score: int = 0
+        self._transposition_table: Optional[TranspositionTable] = TranspositionTable()
+        # With this many empty cells or fewer, the AI solves the rest of the game exactly
+        self.endgame_empties: int = 8
+        self.__endgame_solver: Optional[EndgameSolver] = None
+        self._workers: int = 1
+        # Play moves from the client's opening book for the board size while the game is still in it
+        self.use_opening_book: bool = True
+        # Score positions with the client's pattern tables for the board size when there are some, instead of
+        # cell weights
+        self.use_patterns: bool = True
+        self.__parallel_searcher: Optional[ParallelSearcher] = None
         self.__ai_player = 0
+        # The game the transposition table and clock belong to, so they are only reused within one game
+        self.__last_game: Optional[Game] = None
+        self.__deadline: Optional[float] = None
+        self.__root_best: Optional[Tuple[Tuple[int, int], int]] = None
+        # Move ordering heuristics of the alpha-beta search, which can be turned off one at a time to measure them
+        self.order_table_move: bool = True
+        self.order_corners: bool = True
+        self.order_killers: bool = True
+        self.order_history: bool = True
+        # Depth of a search that orders the moves the AI can make now before the real search starts, or 0 for none
+        self.root_ordering_depth: int = 0
+        self._search_stats: SearchStats = SearchStats()
+        # Per player and cell, how much moves there have caused cutoffs in this search
+        self.__history: List[List[int]] = [[], [], []]
+        # Per distance from the root, the last two moves that caused a cutoff there
+        self.__killers: List[List[Tuple[int, int]]] = []
+        # Search the opponent's likely replies while they think, when start_pondering is called
+        self.ponder: bool = True
+        self._ponder_hits: int = 0
+        self.__ponder_thread: Optional[threading.Thread] = None
+        # Set to make the pondering thread or a get_move in another thread give up its search
+        self.__stop_event: threading.Event = threading.Event()
+        # Move and score found while pondering, keyed by the hash of the position after each reply
+        self.__reply_cache: Dict[int, Tuple[Tuple[int, int], int]] = {}
 
     @property
     def difficulty(self) -> int:
@@ -30,177 +140,922 @@ class AI(Player):
     @difficulty.setter
     def difficulty(self, difficulty: int) -> None:
         """
-        Set the difficulty level of the AI
+        Set the difficulty level of the AI. The AI searches difficulty + 1 moves ahead.
 
         :param difficulty: Difficulty level (>0)
         """
         if difficulty >= 0:
             self._difficulty = difficulty
 
-    def place_tile(self, game: Game) -> None:
+    @property
+    def time_limit(self) -> Optional[float]:
+        """
+        Returns the time budget for one move in seconds
+
+        :return: time budget, or None if the search always finishes its full depth
+        """
+        return self._time_limit
+
+    @time_limit.setter
+    def time_limit(self, time_limit: Optional[float]) -> None:
+        """
+        Set the time budget for one move. With a budget the AI searches as deep as the time allows instead of
+        difficulty + 1 moves, and plays the best move found so far when it runs out.
+
+        :param time_limit: time budget in seconds (>0), or None for no budget
+        """
+        if time_limit is None or time_limit > 0:
+            self._time_limit = time_limit
+
+    @property
+    def game_time(self) -> Optional[float]:
+        """
+        Returns the total thinking time the AI has for all of its moves in one game
+
+        :return: time in seconds, or None if there is no game clock
+        """
+        return self._game_time
+
+    @game_time.setter
+    def game_time(self, game_time: Optional[float]) -> None:
+        """
+        Set a game clock. Each move gets a share of the time left on the clock, spread over the moves the AI
+        is still expected to make. If a time_limit is also set, a move never gets more than that. The clock
+        restarts with this value when this is set and when the AI starts a new game.
+
+        :param game_time: time in seconds (>0), or None for no game clock
+        """
+        if game_time is None or game_time > 0:
+            self._game_time = game_time
+            self._clock_remaining = game_time
+
+    @property
+    def clock_remaining(self) -> Optional[float]:
+        """
+        Returns the time left on the game clock
+
+        :return: time in seconds, or None if there is no game clock
+        """
+        return self._clock_remaining
+
+    def set_level(self, level: int) -> None:
+        """
+        Set the difficulty level shown to users. Each level is a time budget per move, so the AI never stalls
+        the game for longer than that, and a number of empty cells to start solving the game exactly at.
+
+        :param level: Difficulty level (>=0). Levels past the last one use the last one's settings
+        """
+        if level >= 0:
+            self.difficulty = level
+            self.time_limit = self.LEVEL_TIME_LIMITS[
+                min(level, len(self.LEVEL_TIME_LIMITS) - 1)
+            ]
+            self.endgame_empties = self.LEVEL_ENDGAME_EMPTIES[
+                min(level, len(self.LEVEL_ENDGAME_EMPTIES) - 1)
+            ]
+
+    @property
+    def transposition_table_size(self) -> int:
+        """
+        Returns the memory cap of the transposition table
+
+        :return: size in bytes, or 0 if the table is turned off
+        """
+        if self._transposition_table is None:
+            return 0
+        return self._transposition_table.max_bytes
+
+    @transposition_table_size.setter
+    def transposition_table_size(self, max_bytes: int) -> None:
+        """
+        Set the memory cap of the transposition table. This empties the table.
+
+        :param max_bytes: size in bytes (>=0). 0 turns the table off
+        """
+        if max_bytes == 0:
+            self._transposition_table = None
+        elif max_bytes > 0:
+            self._transposition_table = TranspositionTable(max_bytes)
+
+    @property
+    def workers(self) -> int:
+        """
+        Returns the number of processes the alpha-beta search is split across
+
+        :return: process count
+        """
+        return self._workers
+
+    @workers.setter
+    def workers(self, workers: int) -> None:
+        """
+        Set the number of processes to split the alpha-beta search across. With more than 1, the moves the AI
+        can make now are scored in a pool of worker processes. Call close() when the AI is no longer needed.
+
+        :param workers: process count (>0)
+        """
+        if workers > 0 and workers != self._workers:
+            self.close()
+            self._workers = workers
+
+    def close(self) -> None:
+        """
+        Stop pondering and any worker processes the AI started.
+        """
+        self.stop_pondering()
+        if self.__parallel_searcher is not None:
+            self.__parallel_searcher.shutdown()
+            self.__parallel_searcher = None
+
+    @property
+    def nodes_searched(self) -> int:
+        """
+        Returns the number of positions visited by the last search
+
+        :return: node count
+        """
+        return self._nodes_searched
+
+    @property
+    def ponder_hits(self) -> int:
+        """
+        Returns how many moves were answered from what the AI found while pondering
+
+        :return: hit count
+        """
+        return self._ponder_hits
+
+    @property
+    def is_pondering(self) -> bool:
+        """
+        Returns whether the AI is searching the opponent's replies in the background
+
+        :return: True while the pondering thread runs
+        """
+        return self.__ponder_thread is not None and self.__ponder_thread.is_alive()
+
+    @property
+    def search_stats(self) -> SearchStats:
+        """
+        Returns where the last search cut off the tree
+
+        :return: cutoff counts
+        """
+        return self._search_stats
+
+    @property
+    def last_score(self) -> int:
+        """
+        Returns the score the last search gave its chosen move, from the AI's point of view
+
+        :return: score of the last move
+        """
+        return self._last_score
+
+    def place_tile(self, game: Game, time_limit: Optional[float] = None) -> None:
         """
         This allows the AI to place a tile. (We had to add this functionality
         after adding the AI).
 
         param: game is the game object that the AI will place it's tile on.
+        param: time_limit is a time budget for this move only, in seconds. It replaces the AI's time_limit.
+        """
+        game.place_tile(self.get_move(game=game, time_limit=time_limit))
+
+    def get_move(
+        self, game: Game, time_limit: Optional[float] = None
+    ) -> Tuple[int, int]:
+        """
+        This function is used to return the AI's calculated next move without playing it.
+
+        param: game is the current game that the AI is playing. It is not changed.
+        param: time_limit is a time budget for this move only, in seconds. It replaces the AI's time_limit.
+        return Tuple[int, int] that represents the position that the AI will place a tile at.
+        raises SearchCancelled: when cancel is called before the move is found.
+        """
+        start_time: float = time.perf_counter()
+        self.stop_pondering()
+        self.__stop_event.clear()
+        if game is not self.__last_game:
+            # A new game: restart the clock and forget positions from the last game
+            self.__last_game = game
+            self._clock_remaining = self._game_time
+            self.__reply_cache = {}
+            if self._transposition_table is not None:
+                self._transposition_table.clear()
+        cached: Optional[Tuple[Tuple[int, int], int]] = self.__reply_cache.get(
+            game.get_hash()
+        )
+        self.__reply_cache = {}
+        if cached is not None and cached[0] in game.get_valid_move_flips():
+            # The opponent played a reply that was already searched
+            move: Tuple[int, int] = cached[0]
+            self._last_score = cached[1]
+            self._nodes_searched = 0
+            self._ponder_hits += 1
+        else:
+            move = self._find_move(game, time_limit, start_time)
+        if self._clock_remaining is not None:
+            self._clock_remaining = max(
+                0.0, self._clock_remaining - (time.perf_counter() - start_time)
+            )
+        if self.__stop_event.is_set():
+            # The search gave up early, so its move cannot be trusted
+            self.__stop_event.clear()
+            raise SearchCancelled()
+        return move
+
+    def cancel(self) -> None:
+        """
+        Make a get_move running in another thread give up its search and raise SearchCancelled, and stop
+        pondering.
+        """
+        self.__stop_event.set()
+
+    def _find_move(
+        self, game: Game, time_limit: Optional[float], start_time: float
+    ) -> Tuple[int, int]:
+        """
+        Chooses the next move. Subclasses with other ways of choosing moves override this.
+
+        param: game is the current game that the AI is playing. It is not changed.
+        param: time_limit is a time budget for this move only, in seconds. It replaces the AI's time_limit.
+        param: start_time is the time.perf_counter() value get_move was called at.
+        return Tuple[int, int] that represents the position that the AI will place a tile at.
+        """
+        self.__start_search(game)
+        if not self.alpha_beta:
+            return self.__get_minimax_move(copy.deepcopy(game), self._difficulty + 1)
+        if self.use_opening_book:
+            book: Optional[OpeningBook] = get_default_book(game.board.size)
+            book_move: Optional[Tuple[Tuple[int, int], BookEntry]] = (
+                None if book is None else book.lookup(game)
+            )
+            if book_move is not None and book_move[0] in game.get_valid_move_flips():
+                self._last_score = book_move[1].score
+                return book_move[0]
+        # Copy once so the search can make and unmake moves without touching the game being displayed
+        search_game: Game = copy.deepcopy(game)
+
+        time_budget: Optional[float] = self.allocate_time(game, time_limit)
+        num_empty: int = game.board.get_num_type(CellState.empty)
+        move: Optional[Tuple[int, int]] = None
+        if num_empty <= self.endgame_empties:
+            move = self.__solve_endgame(
+                game, None if time_budget is None else start_time + time_budget
+            )
+        if move is None:
+            if time_budget is None:
+                move = self.__iterative_deepening(
+                    search_game, self._difficulty + 1, None
+                )
+            else:
+                # With a time budget the depth is only limited by the moves left in the game. If the endgame
+                # solver ran out of time, this gets whatever is left
+                move = self.__iterative_deepening(
+                    search_game,
+                    num_empty,
+                    max(0.0, time_budget - (time.perf_counter() - start_time)),
+                )
+        return move
+
+    def start_pondering(self, game: Game) -> None:
+        """
+        Start searching the opponent's replies in a background thread, most likely reply first, so the AI can
+        answer at once if the opponent plays one of them. Call this after the AI has moved. The search stops by
+        itself when the AI is asked for its next move.
+
+        param: game is the current game, with the opponent to move. It is not changed.
+        """
+        self.stop_pondering()
+        if not self.ponder or game.is_game_over():
+            return
+        predicted: Optional[Tuple[int, int]] = None
+        if self._transposition_table is not None:
+            # The AI's own search found the opponent's best reply
+            entry = self._transposition_table.probe(game.get_hash())
+            if entry is not None:
+                predicted = entry.best_move
+        self.__ponder_thread = threading.Thread(
+            target=self.__ponder,
+            args=(copy.deepcopy(game), 3 - game.curr_player, predicted),
+            daemon=True,
+        )
+        self.__ponder_thread.start()
+
+    def stop_pondering(self) -> None:
+        """
+        Stop searching the opponent's replies. Replies already searched are kept for the next move.
+        """
+        if self.__ponder_thread is not None:
+            self.__stop_event.set()
+            self.__ponder_thread.join()
+            self.__ponder_thread = None
+            self.__stop_event.clear()
+
+    def _is_stopped(self) -> bool:
+        """
+        Whether the search should give up because pondering was stopped or the search was cancelled. Subclasses
+        with their own search loops check this.
+
+        return: True if the search should stop.
+        """
+        return self.__stop_event.is_set()
+
+    def __ponder(
+        self, game: Game, ai_player: int, predicted: Optional[Tuple[int, int]]
+    ) -> None:
+        """
+        Finds the AI's move after each of the opponent's replies, until all are searched or pondering is stopped.
+
+        param: game is a copy of the game with the opponent to move, for this thread only.
+        param: ai_player is the player number of the AI.
+        param: predicted is the reply the opponent is expected to play, to search first.
+        """
+        replies: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]] = list(
+            game.get_valid_move_flips().items()
+        )
+        replies.sort(key=lambda reply: reply[0] != predicted)
+        for posn, flips in replies:
+            record: Optional[MoveRecord] = game.make_move(posn, flips)
+            if record is None:
+                continue
+            if game.curr_player == ai_player and not game.is_game_over():
+                move: Tuple[int, int] = self._find_move(game, None, time.perf_counter())
+                if self._is_stopped():
+                    # The search gave up early, so its move cannot be trusted
+                    return
+                self.__reply_cache[game.get_hash()] = (move, self._last_score)
+            game.unmake_move(record)
+
+    def __start_search(self, game: Game) -> None:
+        """
+        Resets the counters and move ordering tables before searching for a move.
+
+        param: game is the game about to be searched.
         """
         self.__ai_player = game.curr_player
-        game.place_tile(self.__get_move(game=game))
-
-    @staticmethod
-    def __apply_weight_to_pos(row: int, col: int, board_size: int) -> int:
-        board_edge: int = board_size - 1
-        half: int = int(board_size / 2)
-        if (row == 0 or row == board_edge) and (col == 0 or col == board_edge):
-            # position is located in the corner.
-            position_weight = 1000
-        elif (row >= board_edge - 1 or row <= 1) and (
-            row >= board_edge - 1 or col <= 1
-        ):
-            # position is located next to a corner. This is THE WORST POSITION.
-            position_weight = -1000
-        elif (((row == 0) or (row == board_edge)) and (2 >= col < board_edge - 1)) or (
-            ((col == 0) or (col == board_edge)) and (2 >= row < board_edge - 1)
+        self._nodes_searched = 0
+        self._search_stats = SearchStats()
+        num_cells: int = game.board.size * game.board.size
+        self.__history = [[0] * num_cells for _ in range(3)]
+        self.__killers = []
+        if self._transposition_table is not None:
+            self._transposition_table.new_search()
+
+    def allocate_time(
+        self, game: Game, time_limit: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Work out how long the AI may think about its next move.
+
+        param: game is the current game that the AI is playing.
+        param: time_limit is a time budget for this move only, in seconds. It replaces the AI's time_limit.
+        return: the time budget in seconds, or None if the search should finish its full depth instead.
+        """
+        time_budget: Optional[float] = (
+            time_limit if time_limit is not None else self._time_limit
+        )
+        if self._clock_remaining is None:
+            return time_budget
+        # Each player fills about half of the empty cells, so spread the clock over that many moves
+        moves_left: int = max(1, (game.board.get_num_type(CellState.empty) + 1) // 2)
+        clock_share: float = self._clock_remaining / moves_left
+        if time_budget is None:
+            return clock_share
+        return min(time_budget, clock_share)
+
+    def __solve_endgame(
+        self, game: Game, deadline: Optional[float]
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Finds the move that ends the game with the best disk difference, assuming perfect play from both sides.
+
+        param: game is the current game that the AI is playing. It is not changed.
+        param: deadline is the time.perf_counter() value to give up at, or None to always finish.
+        return: the best move, or None if the solver ran out of time or the AI has to pass.
+        """
+        if (
+            self.__endgame_solver is None
+            or self.__endgame_solver.size != game.board.size
         ):
-            # position is located on an edge. It is not a corner and is not next to a corner.
-            position_weight = 50
-        elif (half - 1 <= row <= half) and (half - 1 <= col <= half):
-            # position is located in the 4 middle cells in the center of the board.
-            position_weight = 20
+            self.__endgame_solver = EndgameSolver(game.board.size)
+        try:
+            disk_difference, move = self.__endgame_solver.solve(
+                game, deadline=deadline, stop=self.__stop_event
+            )
+        except SolverTimeout:
+            return None
+        finally:
+            self._nodes_searched += self.__endgame_solver.nodes_searched
+        if disk_difference > 0:
+            self._last_score = self._WIN_SCORE + disk_difference
+        elif disk_difference < 0:
+            self._last_score = -self._WIN_SCORE + disk_difference
         else:
-            # position is located somewhere else on the board.
-            position_weight = 1
-        return position_weight
+            self._last_score = 0
+        return move
 
-    def __weight_pos(self, row: int, col: int, game: Game) -> int:
+    def __evaluate(self, game: Game) -> int:
         """
         This function is used to weight the end node of the tree.
 
-        param: row is the row of the position that the user wants to weight.
-        param: col is the column of the position that the user wants to weight.
-        param: game is the game object that the user would like to get the position's weight for.
-        return: an integer number that represents the weight of the position.
+        param: game is the game object whose position should be weighted.
+        return: an integer number that represents the weight of the position for the AI.
         """
-
-        board_size = game.board.size
-        # position_weight: weight of the position chosen as a result of its location on the board
-        board_state: List[List[CellState]] = game.board.get_state()
-        position_weight: int = self.__apply_weight_to_pos(
-            row=row, col=col, board_size=board_size
-        )
-        cs_state_1: CellState = (
+        ai_state: CellState = (
             CellState.player1 if self.__ai_player == 1 else CellState.player2
         )
-        cs_state_2: CellState = (
-            CellState.player2 if self.__ai_player == 1 else CellState.player1
+        if game.is_game_over():
+            # Exact result: any win beats any position, and bigger wins beat smaller ones
+            ai_score, opp_score = game.get_score()
+            if ai_state == CellState.player2:
+                ai_score, opp_score = opp_score, ai_score
+            if ai_score > opp_score:
+                return self._WIN_SCORE + ai_score - opp_score
+            elif ai_score < opp_score:
+                return -self._WIN_SCORE + ai_score - opp_score
+            return 0
+
+        own: int = game.board.get_discs(self.__ai_player)
+        opp: int = game.board.get_discs(3 - self.__ai_player)
+        if self.use_patterns:
+            tables: Optional[PatternTables] = get_default_tables(game.board.size)
+            if tables is not None:
+                return tables.evaluate(own, opp)
+        # Weighted by a table precomputed per board size, one bit count per class of cell
+        return evaluate_masks(own, opp, game.board.size)
+
+    def __count_node(self) -> None:
+        """
+        Counts a visited position and stops the search if the time budget has run out, pondering was stopped or
+        the search was cancelled.
+
+        :raises _SearchTimeout: when the deadline has passed or the search was stopped
+        """
+        self._nodes_searched += 1
+        if (
+            self.__deadline is not None and time.perf_counter() > self.__deadline
+        ) or self.__stop_event.is_set():
+            raise _SearchTimeout()
+
+    def __iterative_deepening(
+        self, game: Game, max_depth: int, time_budget: Optional[float]
+    ) -> Tuple[int, int]:
+        """
+        Runs alpha-beta searches one move deeper at a time until max_depth or the time budget is reached.
+        Each search tries the previous best move first, which makes it cut off much more of the tree.
+
+        param: game is the copy of the game to search.
+        param: max_depth is the number of moves to look ahead in the final search.
+        param: time_budget is the time the search may take in seconds, or None to always reach max_depth.
+        return: the best move from the deepest search that finished in time.
+        """
+        root_moves: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]] = list(
+            game.get_valid_move_flips().items()
         )
-        for row2 in range(0, board_size):
-            for col2 in range(0, board_size):
-                if board_state[row][col] == cs_state_1:
-                    position_weight += self.__apply_weight_to_pos(
-                        row=row2, col=col2, board_size=board_size
+        if len(root_moves) == 0:
+            return 0, 0
+        if len(root_moves) == 1 and time_budget is not None:
+            # Nothing to choose between, so save the time for later moves
+            return root_moves[0][0]
+        best_move: Tuple[int, int] = root_moves[0][0]
+        root_key: int = game.get_hash()
+        table_move: Optional[Tuple[int, int]] = None
+        if self._transposition_table is not None:
+            entry = self._transposition_table.probe(root_key)
+            if entry is not None:
+                table_move = entry.best_move
+        start_time: float = time.perf_counter()
+        self.__deadline = None if time_budget is None else start_time + time_budget
+        try:
+            if self.root_ordering_depth > 0 and len(root_moves) > 1:
+                self.__order_root_moves(game, root_moves)
+            # Start from the move an earlier search of this position found best
+            root_moves.sort(key=lambda move: move[0] != table_move)
+            best_move = root_moves[0][0]
+            for depth in range(1, max_depth + 1):
+                if (
+                    time_budget is not None
+                    and time.perf_counter() - start_time > time_budget / 2
+                ):
+                    # The next search takes several times longer than the last, so it would not finish in time
+                    break
+                self.__root_best = None
+                if self._workers > 1 and len(root_moves) > 1:
+                    best_move, self._last_score = self.__parallel_search_root(
+                        game, depth, root_moves
                     )
-                elif board_state[row][col] == cs_state_2:
-                    position_weight -= self.__apply_weight_to_pos(
-                        row=row2, col=col2, board_size=board_size
+                else:
+                    best_move, self._last_score = self.__search_root(
+                        game, depth, root_moves
                     )
-        # This is in case we want to add the score as additional weight to the position:
-        # This variable is in case we need to scale the position_weight:
-        # position_weight = position_weight * 10
-        # score = game.get_score()
-        # weighted_score = score[0] - score[1]
-        # position_weight = position_weight + weighted_score
-        # print("position_weight: " + str(position_weight))
-        return position_weight
+                # Search the best move first in the next iteration
+                root_moves.sort(key=lambda move: move[0] != best_move)
+                if self._transposition_table is not None:
+                    self._transposition_table.store(
+                        root_key, depth, Bound.exact, self._last_score, best_move
+                    )
+        except _SearchTimeout:
+            # The previous best move is always searched first, so any move that beat it in the unfinished
+            # search is at least as good
+            if self.__root_best is not None:
+                best_move, self._last_score = self.__root_best
+        finally:
+            self.__deadline = None
+        return best_move
 
-    def __get_move(self, game: Game) -> Tuple[int, int]:
+    def __order_root_moves(
+        self,
+        game: Game,
+        root_moves: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]],
+    ) -> None:
         """
-        This function is used to return the AI's calculated next move.
+        Sorts the moves the AI can make now by the score of a shallow search of each, best first.
 
-        param: game is the current game that the AI is playing.
+        param: game is the copy of the game to search.
+        param: root_moves are the AI's valid moves and their flips. They are sorted in place.
+        """
+        scores: Dict[Tuple[int, int], int] = {}
+        for posn, flips in root_moves:
+            scores[posn] = self.__search_child(
+                game,
+                posn,
+                flips,
+                self.root_ordering_depth,
+                -self._INFINITY,
+                self._INFINITY,
+                1,
+            )
+        root_moves.sort(key=lambda move: -scores[move[0]])
+
+    def __search_root(
+        self,
+        game: Game,
+        depth: int,
+        root_moves: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]],
+    ) -> Tuple[Tuple[int, int], int]:
+        """
+        Alpha-beta search of every move the AI can make now.
+
+        param: game is the copy of the game to search.
+        param: depth is the number of moves to look ahead.
+        param: root_moves are the AI's valid moves and their flips, in the order to search them.
+        return: the best move and its score.
+        """
+        alpha: int = -self._INFINITY
+        best_move: Tuple[int, int] = root_moves[0][0]
+        for posn, flips in root_moves:
+            score: int = self.__search_child(
+                game, posn, flips, depth, alpha, self._INFINITY, 1
+            )
+            if score > alpha:
+                alpha = score
+                best_move = posn
+            self.__root_best = (best_move, alpha)
+        return best_move, alpha
+
+    def __parallel_search_root(
+        self,
+        game: Game,
+        depth: int,
+        root_moves: List[Tuple[Tuple[int, int], List[Tuple[int, int]]]],
+    ) -> Tuple[Tuple[int, int], int]:
+        """
+        Alpha-beta search of every move the AI can make now, split across worker processes. The first move is
+        searched here to get a good alpha bound, then the rest are searched in parallel.
+
+        param: game is the copy of the game to search.
+        param: depth is the number of moves to look ahead.
+        param: root_moves are the AI's valid moves and their flips, in the order to search them.
+        return: the best move and its score.
+        """
+        settings: Dict[str, Any] = self.__worker_settings()
+        # Workers keep the settings they were started with, so start new ones when the settings change
+        if (
+            self.__parallel_searcher is not None
+            and self.__parallel_searcher.settings != settings
+        ):
+            self.__parallel_searcher.shutdown()
+            self.__parallel_searcher = None
+        if self.__parallel_searcher is None:
+            self.__parallel_searcher = ParallelSearcher(self._workers, settings)
+        first_posn, first_flips = root_moves[0]
+        best_move: Tuple[int, int] = first_posn
+        alpha: int = self.__search_child(
+            game, first_posn, first_flips, depth, -self._INFINITY, self._INFINITY, 1
+        )
+        self.__root_best = (best_move, alpha)
+        time_limit: Optional[float] = (
+            None if self.__deadline is None else self.__deadline - time.perf_counter()
+        )
+        results: List[Tuple[Optional[int], int, int]] = self.__parallel_searcher.search(
+            game, [posn for posn, _ in root_moves[1:]], depth, alpha, time_limit
+        )
+        timed_out: bool = False
+        for (posn, _), (score, move_alpha, nodes) in zip(root_moves[1:], results):
+            self._nodes_searched += nodes
+            if score is None:
+                timed_out = True
+            elif score > move_alpha and score > alpha:
+                # A score no greater than the alpha it was searched with is only an upper bound
+                alpha = score
+                best_move = posn
+                self.__root_best = (best_move, alpha)
+        if timed_out:
+            raise _SearchTimeout()
+        return best_move, alpha
+
+    def __worker_settings(self) -> Dict[str, Any]:
+        """
+        The settings a worker process's AI needs to score moves the way this AI would.
+
+        return: AI attribute values by name.
+        """
+        return {
+            "difficulty": self._difficulty,
+            "endgame_empties": self.endgame_empties,
+            "use_patterns": self.use_patterns,
+            "order_table_move": self.order_table_move,
+            "order_corners": self.order_corners,
+            "order_killers": self.order_killers,
+            "order_history": self.order_history,
+            "transposition_table_size": self.transposition_table_size,
+        }
+
+    def search_move(
+        self,
+        game: Game,
+        posn: Tuple[int, int],
+        depth: int,
+        alpha: int,
+        time_limit: Optional[float] = None,
+    ) -> Optional[int]:
+        """
+        Score one move the player to move can make, for a worker process of a parallel search.
+
+        param: game is the game to search. It is restored before this returns, unless the time runs out.
+        param: posn is the move to score.
+        param: depth is the number of moves to look ahead, including this one.
+        param: alpha is a score the player to move is already guaranteed. If the move is no better, the score
+               returned is only an upper bound.
+        param: time_limit is the time the search may take in seconds, or None to always finish.
+        return: the score of the move for the player to move, or None if the time ran out.
+        """
+        self.__start_search(game)
+        self.__deadline = (
+            None if time_limit is None else time.perf_counter() + time_limit
+        )
+        flips: List[Tuple[int, int]] = game.get_valid_move_flips()[posn]
+        try:
+            return self.__search_child(
+                game, posn, flips, depth, alpha, self._INFINITY, 1
+            )
+        except _SearchTimeout:
+            return None
+        finally:
+            self.__deadline = None
+
+    def __search_child(
+        self,
+        game: Game,
+        posn: Tuple[int, int],
+        flips: List[Tuple[int, int]],
+        depth: int,
+        alpha: int,
+        beta: int,
+        ply: int,
+    ) -> int:
+        """
+        Makes a move, searches the position after it and unmakes the move.
+
+        param: game is the copy of the game to search.
+        param: posn is the move to make.
+        param: flips are the disks the move flips.
+        param: depth is the number of moves to look ahead, including this one.
+        param: alpha is the score the player making the move is already guaranteed.
+        param: beta is the score the opponent is already guaranteed, as a score for the player making the move.
+        param: ply is the number of moves from the root to the position after this move.
+        return: the score of the move for the player making it.
+        """
+        player: int = game.curr_player
+        record: Optional[MoveRecord] = game.make_move(posn, flips)
+        if record is None:
+            return -self._INFINITY
+        if game.curr_player == player:
+            # The opponent had to pass, so the same player moves again
+            score = self.__alpha_beta(game, depth - 1, alpha, beta, ply)
+        else:
+            score = -self.__alpha_beta(game, depth - 1, -beta, -alpha, ply)
+        game.unmake_move(record)
+        return score
+
+    def __order_moves(
+        self,
+        game: Game,
+        moves: Dict[Tuple[int, int], List[Tuple[int, int]]],
+        tt_move: Optional[Tuple[int, int]],
+        ply: int,
+    ) -> List[Tuple[Tuple[int, int], List[Tuple[int, int]], int]]:
+        """
+        Puts the moves most likely to cause a cutoff first: the best move from an earlier search of the position,
+        then corners, then the killer moves that caused cutoffs at the same ply, then moves by history score.
+
+        param: game is the copy of the game being searched.
+        param: moves are the valid moves of the player to move and their flips.
+        param: tt_move is the best move the transposition table has for the position, if any.
+        param: ply is the number of moves from the root to the position.
+        return: (move, flips, heuristic that placed it) for every move, in the order to search them.
+        """
+        edge: int = game.board.size - 1
+        size: int = game.board.size
+        history: List[int] = self.__history[game.curr_player]
+        killers: List[Tuple[int, int]] = (
+            self.__killers[ply]
+            if self.order_killers and ply < len(self.__killers)
+            else []
+        )
+        keyed_moves: List[Tuple[int, int, Tuple[int, int], List[Tuple[int, int]]]] = []
+        for posn, flips in moves.items():
+            if self.order_table_move and posn == tt_move:
+                key: Tuple[int, int] = (_TABLE_MOVE, 0)
+            elif self.order_corners and posn[0] in (0, edge) and posn[1] in (0, edge):
+                key = (_CORNER, 0)
+            elif posn in killers:
+                key = (_KILLER, killers.index(posn))
+            elif self.order_history and history[posn[0] * size + posn[1]] > 0:
+                key = (_HISTORY, -history[posn[0] * size + posn[1]])
+            else:
+                key = (_UNORDERED, 0)
+            keyed_moves.append((key[0], key[1], posn, flips))
+        # Stable, so moves no heuristic tells apart keep the order they were generated in
+        keyed_moves.sort(key=lambda move: (move[0], move[1]))
+        return [(posn, flips, source) for source, _, posn, flips in keyed_moves]
+
+    def __record_cutoff(
+        self,
+        game: Game,
+        posn: Tuple[int, int],
+        depth: int,
+        ply: int,
+        source: int,
+        index: int,
+    ) -> None:
+        """
+        Updates the killer moves, history table and search stats after a move caused a cutoff.
+
+        param: game is the copy of the game being searched, at the position the move was made from.
+        param: posn is the move that caused the cutoff.
+        param: depth is the number of moves that were left to look ahead from the position.
+        param: ply is the number of moves from the root to the position.
+        param: source is the heuristic that placed the move in the search order.
+        param: index is the move's place in the search order.
+        """
+        stats: SearchStats = self._search_stats
+        stats.cutoffs += 1
+        if index == 0:
+            stats.first_move_cutoffs += 1
+        if source == _TABLE_MOVE:
+            stats.table_move_cutoffs += 1
+        elif source == _CORNER:
+            stats.corner_cutoffs += 1
+        elif source == _KILLER:
+            stats.killer_cutoffs += 1
+        elif source == _HISTORY:
+            stats.history_cutoffs += 1
+        else:
+            stats.unordered_cutoffs += 1
+
+        while len(self.__killers) <= ply:
+            self.__killers.append([])
+        killers: List[Tuple[int, int]] = self.__killers[ply]
+        if posn not in killers:
+            killers.insert(0, posn)
+            del killers[2:]
+        # Deeper searches are more reliable, so their cutoffs count for more
+        self.__history[game.curr_player][posn[0] * game.board.size + posn[1]] += (
+            depth * depth
+        )
+
+    def __alpha_beta(
+        self, game: Game, depth: int, alpha: int, beta: int, ply: int
+    ) -> int:
+        """
+        This function is used to operate the alpha-beta algorithm (in negamax form) on a copy of the game.
+        Branches that cannot change the result are skipped, and positions already in the transposition table
+        are not searched again.
+
+        param: game represents the copy of the game object that the algorithm uses to calculate its next move.
+        param: depth is the number of moves left to look ahead.
+        param: alpha is the score the player to move is already guaranteed.
+        param: beta is the score the opponent is already guaranteed, as a score for the player to move.
+        param: ply is the number of moves from the root to this position.
+        returns: an integer that represents the score of the position for the player to move.
+        """
+        self.__count_node()
+        moves: Dict[Tuple[int, int], List[Tuple[int, int]]] = (
+            game.get_valid_move_flips() if depth > 0 else {}
+        )
+        if len(moves) == 0:
+            # Either out of depth or out of moves, in which case the game is over
+            score: int = self.__evaluate(game)
+            return score if game.curr_player == self.__ai_player else -score
+
+        table: Optional[TranspositionTable] = self._transposition_table
+        key: int = 0
+        tt_move: Optional[Tuple[int, int]] = None
+        if table is not None:
+            key = game.get_hash()
+            entry = table.probe(key)
+            if entry is not None:
+                if entry.depth >= depth and (
+                    entry.bound == Bound.exact
+                    or (entry.bound == Bound.lower and entry.score >= beta)
+                    or (entry.bound == Bound.upper and entry.score <= alpha)
+                ):
+                    self._search_stats.table_cutoffs += 1
+                    return entry.score
+                tt_move = entry.best_move
+
+        alpha_orig: int = alpha
+        best_score: int = -self._INFINITY
+        best_move: Optional[Tuple[int, int]] = None
+        for index, (posn, flips, source) in enumerate(
+            self.__order_moves(game, moves, tt_move, ply)
+        ):
+            score = self.__search_child(game, posn, flips, depth, alpha, beta, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = posn
+            if best_score > alpha:
+                alpha = best_score
+            if alpha >= beta:
+                self.__record_cutoff(game, posn, depth, ply, source, index)
+                break
+
+        if table is not None:
+            if best_score <= alpha_orig:
+                bound: Bound = Bound.upper
+            elif best_score >= beta:
+                bound = Bound.lower
+            else:
+                bound = Bound.exact
+            table.store(key, depth, bound, best_score, best_move)
+        return best_score
+
+    def __get_minimax_move(self, game: Game, depth: int) -> Tuple[int, int]:
+        """
+        Searches every move the AI can make now with plain minimax.
+
+        param: game is the copy of the game to search.
+        param: depth is the number of moves to look ahead.
         return Tuple[int, int] that represents the position that the AI will place a tile at.
         """
-        best_score = -int(sys.maxsize)
-        board_state: List[List[CellState]] = game.board.get_state()
-        valid_moves: List[List[bool]] = game.get_valid_moves()
+        best_score = -self._INFINITY
         move: Tuple[int, int] = (0, 0)
-        for row in range(0, game.board.size):
-            for col in range(0, game.board.size):
-                if (board_state[row][col] == CellState.empty) and valid_moves[row][col]:
-                    copied_game = copy.deepcopy(game)
-                    copied_game.place_tile((row, col))
-                    score = self.__minimax(copied_game, self._difficulty, False)
-                    if score > best_score:
-                        best_score = score
-                        move = (row, col)
+        for posn, flips in game.get_valid_move_flips().items():
+            record: Optional[MoveRecord] = game.make_move(posn, flips)
+            if record is None:
+                continue
+            score = self.__minimax(game, depth - 1)
+            game.unmake_move(record)
+            if score > best_score:
+                best_score = score
+                move = posn
+        self._last_score = best_score
         return move
 
-    def __minimax(self, game: Game, depth: int, is_maximizing: bool) -> int:
+    def __minimax(self, game: Game, depth: int) -> int:
         """
         This function is used to operate the minimax algorithm on a copy of the game.
         This function will recursively call itself to iterate through the different branches.
+        Moves are made and unmade on the one game, so the game is unchanged when this returns.
 
         param: game represents the copy of the game object that the algorithm uses to calculate its next move.
-        param: depth the current location in the branches.
-        param: is_maximizing is a boolean that is true if it is calculating the AI's move, false if it is
-        calculating the human player's move.
-        returns: an integer that represents the score of the end node.
+        param: depth is the number of moves left to look ahead.
+        returns: an integer that represents the score of the position for the AI.
         """
+        self.__count_node()
+        moves: Dict[Tuple[int, int], List[Tuple[int, int]]] = (
+            game.get_valid_move_flips() if depth > 0 else {}
+        )
+        if len(moves) == 0:
+            return self.__evaluate(game)
 
-        if game.is_game_over():
-            if game.get_winner() == 1:
-                return -int(sys.maxsize)
-            elif game.get_winner() == 2:
-                return int(sys.maxsize)
+        # The AI maximizes its score and the opponent minimizes it
+        is_maximizing: bool = game.curr_player == self.__ai_player
+        best_score = -self._INFINITY if is_maximizing else self._INFINITY
+        for posn, flips in moves.items():
+            record: Optional[MoveRecord] = game.make_move(posn, flips)
+            if record is None:
+                continue
+            score = self.__minimax(game, depth - 1)
+            game.unmake_move(record)
+            if is_maximizing:
+                best_score = max(score, best_score)
             else:
-                return 0
-
-        board_state: List[List[CellState]] = game.board.get_state()
-        valid_moves: List[List[bool]] = game.get_valid_moves()
-
-        if is_maximizing:
-            best_score = -int(sys.maxsize)
-            for row in range(0, game.board.size):
-                for col in range(0, game.board.size):
-                    # Is the spot available?
-                    if (
-                        (board_state[row][col] == CellState.empty)
-                        and valid_moves[row][col]
-                        and (depth < self._difficulty)
-                    ):
-                        copied_game = copy.deepcopy(game)
-                        copied_game.place_tile((row, col))
-                        score = self.__minimax(copied_game, depth + 1, False)
-                        best_score = max(score, best_score)
-                    elif (board_state[row][col] == CellState.empty) and valid_moves[
-                        row
-                    ][col]:
-                        # we're at the terminal point that we want to go to.
-                        score = self.__weight_pos(row=row, col=col, game=game)
-                        best_score = max(score, best_score)
-            return best_score
-        else:
-            best_score = int(sys.maxsize)
-            for row in range(0, game.board.size):
-                for col in range(0, game.board.size):
-                    # Is the spot available?
-                    if (
-                        (board_state[row][col] == CellState.empty)
-                        and valid_moves[row][col]
-                        and (depth < self._difficulty)
-                    ):
-                        copied_game = copy.deepcopy(game)
-                        copied_game.place_tile((row, col))
-                        score = self.__minimax(copied_game, depth + 1, True)
-                        best_score = min(score, best_score)
-                    elif (board_state[row][col] == CellState.empty) and valid_moves[
-                        row
-                    ][col]:
-                        # we're at the terminal point that we want to go to.
-                        # Negative was put here on purpose:
-                        score = self.__weight_pos(row=row, col=col, game=game)
-                        best_score = min(score, best_score)
-            return best_score
+                best_score = min(score, best_score)
+        return best_score
 
 
 # AI Weight class
@@ -0,0 +1,376 @@
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from client.model.board import Board
+from client.model.cell import Cell, CellState
+
+
+@lru_cache(maxsize=None)
+def get_directions(size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Get the shift amount and wrap-around mask for each of the 8 directions on a board of the given size.
+    Bit index of a cell is x * size + y, so moving one step in direction (dx, dy) is a shift by dx * size + dy.
+
+    :param size: the length of one side of the board
+    :return: a tuple of (shift, mask) pairs. Positive shifts move left, negative shifts move right
+    """
+    full_mask: int = (1 << (size * size)) - 1
+    first_col: int = 0
+    last_col: int = 0
+    for x in range(size):
+        first_col |= 1 << (x * size)
+        last_col |= 1 << (x * size + size - 1)
+    directions: List[Tuple[int, int]] = []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            if dx == 0 and dy == 0:
+                continue
+            # Stepping right must never land in the first column (that would be a wrap from the previous row),
+            # and stepping left must never land in the last column
+            mask: int = full_mask
+            if dy == 1:
+                mask &= ~first_col
+            elif dy == -1:
+                mask &= ~last_col
+            directions.append((dx * size + dy, mask))
+    return tuple(directions)
+
+
+def _shift(bits: int, shift: int, mask: int) -> int:
+    """
+    Shift every bit of the given mask one step in a direction.
+
+    :param bits: the bits to shift
+    :param shift: shift amount from get_directions
+    :param mask: wrap-around mask from get_directions
+    :return: the shifted bits
+    """
+    if shift > 0:
+        return (bits << shift) & mask
+    return (bits >> -shift) & mask
+
+
+def find_moves(own: int, opp: int, size: int) -> int:
+    """
+    Get every valid move at once using shift-and-mask move generation.
+
+    :param own: disk mask of the player to move
+    :param opp: disk mask of the opponent
+    :param size: the length of one side of the board
+    :return: bit mask with a bit set for every cell the player can place a disk on
+    """
+    moves: int = 0
+    run_length: range = range(size - 3)
+    # The shifts are written out rather than calling _shift, since this runs at every node of a search
+    for shift, mask in get_directions(size):
+        opp_masked: int = opp & mask
+        run: int
+        # Grow runs of opponent disks out from the player's disks, at most size - 2 long
+        if shift > 0:
+            run = (own << shift) & opp_masked
+            for _ in run_length:
+                run |= (run << shift) & opp_masked
+            moves |= (run << shift) & mask
+        else:
+            shift = -shift
+            run = (own >> shift) & opp_masked
+            for _ in run_length:
+                run |= (run >> shift) & opp_masked
+            moves |= (run >> shift) & mask
+    return moves & ~(own | opp) & ((1 << (size * size)) - 1)
+
+
+def find_flips(own: int, opp: int, move: int, size: int) -> int:
+    """
+    Get the opponent disks a move would flip.
+
+    :param own: disk mask of the player to move
+    :param opp: disk mask of the opponent
+    :param move: mask with only the bit of the cell to place a disk on set
+    :param size: the length of one side of the board
+    :return: bit mask of the disks to flip, 0 if the move flips nothing
+    """
+    flips: int = 0
+    for shift, mask in get_directions(size):
+        line: int = 0
+        cursor: int = _shift(move, shift, mask)
+        while cursor & opp:
+            line |= cursor
+            cursor = _shift(cursor, shift, mask)
+        if cursor & own:
+            flips |= line
+    return flips
+
+
+class _BitCell(Cell):
+    __slots__ = ("_board", "_x", "_y")
+
+    def __init__(self, board: "BitBoard", x: int, y: int) -> None:
+        """
+        Cell that reads and writes its state straight from a BitBoard, so code written against
+        Board.cells keeps working with BitBoard.
+
+        :param board: the BitBoard holding the state
+        :param x: the x coordinate of the cell
+        :param y: the y coordinate of the cell
+        """
+        self._board: BitBoard = board
+        self._x: int = x
+        self._y: int = y
+
+    @property
+    def state(self) -> CellState:
+        return self._board.get_cell_state(self._x, self._y)
+
+    @state.setter
+    def state(self, state: CellState) -> None:
+        self._board.set_cell_state(self._x, self._y, state)
+
+
+class BitBoard(Board):
+    __slots__ = ("_full_mask", "_discs")
+
+    def __init__(
+        self, size: int, saved_state: Optional[List[List[int]]] = None
+    ) -> None:
+        """
+        Board that stores the position as one bit mask per player instead of a grid of Cells.
+        Bit x * size + y of a player's mask is set when that player has a disk at cells[x][y].
+
+        :param size: the length of one side of the board
+        :param saved_state: optional board state to load, in the same format as Board
+        """
+        self.size: int = size
+        self._full_mask: int = (1 << (size * size)) - 1
+        # Disk masks indexed by player number. Index 0 is unused so players can index directly
+        self._discs: List[int] = [0, 0, 0]
+        # Number of cells in each CellState, indexed by the state's value
+        self._counts: List[int] = [size * size, 0, 0]
+        self.zobrist_hash: int = 0
+        self._cells: Optional[List[List[Cell]]] = None
+        if saved_state is None:
+            # initialize the four starting disks at the center of the board
+            self.set_cell_state(size // 2, size // 2 - 1, CellState.player1)
+            self.set_cell_state(size // 2 - 1, size // 2, CellState.player1)
+            self.set_cell_state(size // 2 - 1, size // 2 - 1, CellState.player2)
+            self.set_cell_state(size // 2, size // 2, CellState.player2)
+        else:
+            for x in range(size):
+                for y in range(size):
+                    self.set_cell_state(x, y, CellState(saved_state[x][y]))
+
+    @classmethod
+    def from_discs(
+        cls, size: int, player1_discs: int, player2_discs: int
+    ) -> "BitBoard":
+        """
+        Create a board straight from the disk masks of both players.
+
+        :param size: the length of one side of the board
+        :param player1_discs: disk mask of player 1
+        :param player2_discs: disk mask of player 2
+        :return: the board
+        """
+        board: BitBoard = cls(size)
+        board._discs = [0, player1_discs, player2_discs]
+        board._count_discs()
+        board.zobrist_hash = board.compute_hash()
+        return board
+
+    def _make_cells(self) -> List[List[Cell]]:
+        return [
+            [_BitCell(self, x, y) for y in range(self.size)] for x in range(self.size)
+        ]
+
+    def get_state(self) -> List[List[CellState]]:
+        """
+        Get the current state of the board, the cells field.
+
+        :return: cells
+        """
+        return [
+            [self.get_cell_state(x, y) for y in range(self.size)]
+            for x in range(self.size)
+        ]
+
+    def get_num_type(self, cell_state: CellState) -> int:
+        """
+        Get the number of cells in the board that are of the given Cell type.
+
+        :param cell_state: the type of CellState to count
+        :return: the number of the given Cell type cells in the board
+        """
+        return self._counts[cell_state.value]
+
+    def get_empty_posns(self) -> List[Tuple[int, int]]:
+        """
+        Get the positions of the empty cells, so move generation only has to look at those.
+
+        :return: list of x,y positions in row-major order
+        """
+        return self.mask_to_posns(self.get_empty_mask())
+
+    def _count_discs(self) -> None:
+        """
+        Recount the cells in each CellState after the disk masks were set directly.
+        """
+        player1: int = bin(self._discs[1]).count("1")
+        player2: int = bin(self._discs[2]).count("1")
+        self._counts = [self.size * self.size - player1 - player2, player1, player2]
+
+    def get_cell_state(self, x: int, y: int) -> CellState:
+        """
+        Get the state of a single cell.
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: the CellState at x,y
+        """
+        bit: int = 1 << (x * self.size + y)
+        if self._discs[1] & bit:
+            return CellState.player1
+        if self._discs[2] & bit:
+            return CellState.player2
+        return CellState.empty
+
+    def _get_value(self, index: int) -> int:
+        bit: int = 1 << index
+        if self._discs[1] & bit:
+            return 1
+        if self._discs[2] & bit:
+            return 2
+        return 0
+
+    def _set_state(self, index: int, value: int) -> None:
+        """
+        Set the state of a cell in the disk masks, keeping the disk counts up to date. Callers keep zobrist_hash
+        up to date.
+
+        :param index: the index of the cell, x * size + y
+        :param value: the value of the cell's new CellState
+        """
+        bit: int = 1 << index
+        self._counts[self._get_value(index)] -= 1
+        self._counts[value] += 1
+        self._discs[1] &= ~bit
+        self._discs[2] &= ~bit
+        if value:
+            self._discs[value] |= bit
+
+    def get_discs(self, player: int) -> int:
+        """
+        Get the disk mask of a player.
+
+        :param player: the player number, either 1 or 2
+        :return: bit mask with a bit set for every disk of the player
+        """
+        return self._discs[player]
+
+    def get_empty_mask(self) -> int:
+        """
+        Get the mask of empty cells.
+
+        :return: bit mask with a bit set for every empty cell
+        """
+        return ~(self._discs[1] | self._discs[2]) & self._full_mask
+
+    def get_move_mask(self, player: int) -> int:
+        """
+        Get every valid move of a player at once using shift-and-mask move generation.
+
+        :param player: the player number, either 1 or 2
+        :return: bit mask with a bit set for every cell the player can place a disk on
+        """
+        return find_moves(self._discs[player], self._discs[3 - player], self.size)
+
+    def get_flip_mask(self, player: int, x: int, y: int) -> int:
+        """
+        Get the opponent disks that would be flipped if the player placed a disk at x,y.
+
+        :param player: the player number, either 1 or 2
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: bit mask of the disks to flip, 0 if the move flips nothing
+        """
+        return find_flips(
+            self._discs[player],
+            self._discs[3 - player],
+            1 << (x * self.size + y),
+            self.size,
+        )
+
+    def is_legal_move(self, player: int, x: int, y: int) -> bool:
+        """
+        Checks if the player can place a disk at x,y under the standard rules.
+
+        :param player: the player number, either 1 or 2
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: True if the cell is empty and placing there flips at least one disk, else False
+        """
+        if not self.get_empty_mask() & (1 << (x * self.size + y)):
+            return False
+        return self.get_flip_mask(player, x, y) != 0
+
+    def apply_move(
+        self, player: int, posn: Tuple[int, int], flips: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Place a disk for the player at the given position and flip the given disks.
+        Does not check the move is valid.
+
+        :param player: the player placing the disk, either 1 or 2
+        :param posn: the position to place the disk
+        :param flips: the positions of the opponent disks to flip
+        """
+        flip_mask: int = self.posns_to_mask(flips)
+        self._discs[player] |= flip_mask | (1 << (posn[0] * self.size + posn[1]))
+        self._discs[3 - player] &= ~flip_mask
+        self._counts[0] -= 1
+        self._counts[player] += len(flips) + 1
+        self._counts[3 - player] -= len(flips)
+        self.zobrist_hash ^= self._get_move_hash(player, posn, flips)
+
+    def undo_move(
+        self, player: int, posn: Tuple[int, int], flips: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Take back a move made with apply_move.
+
+        :param player: the player who placed the disk, either 1 or 2
+        :param posn: the position the disk was placed at
+        :param flips: the positions of the disks that were flipped
+        """
+        flip_mask: int = self.posns_to_mask(flips)
+        self._discs[player] &= ~(flip_mask | (1 << (posn[0] * self.size + posn[1])))
+        self._discs[3 - player] |= flip_mask
+        self._counts[0] += 1
+        self._counts[player] -= len(flips) + 1
+        self._counts[3 - player] += len(flips)
+        self.zobrist_hash ^= self._get_move_hash(player, posn, flips)
+
+    def mask_to_posns(self, mask: int) -> List[Tuple[int, int]]:
+        """
+        Convert a bit mask into the list of positions of its set bits, in row-major order.
+
+        :param mask: the bit mask to convert
+        :return: list of x,y positions
+        """
+        posns: List[Tuple[int, int]] = []
+        while mask:
+            low_bit: int = mask & -mask
+            posns.append(divmod(low_bit.bit_length() - 1, self.size))
+            mask ^= low_bit
+        return posns
+
+    def posns_to_mask(self, posns: List[Tuple[int, int]]) -> int:
+        """
+        Convert a list of positions into a bit mask.
+
+        :param posns: list of x,y positions
+        :return: bit mask with a bit set for every position
+        """
+        mask: int = 0
+        for x, y in posns:
+            mask |= 1 << (x * self.size + y)
+        return mask
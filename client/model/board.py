@@ -1,27 +1,102 @@
-from typing import List, Optional
+from array import array
+from bisect import bisect_left, insort
+from typing import List, Optional, Tuple
 
-from client.model.cell import Cell, CellState
+from client.model.cell import CELL_STATES, Cell, CellState
+from client.model.symmetry import get_canonical_form
+from client.model.zobrist import ZobristKeys, get_zobrist_keys
+
+# Per player, a bytes.translate table that turns the cell states into b"1" for the player's disks and b"0" for
+# every other cell, so a disk mask can be parsed straight from the state bytes
+_DISC_DIGITS: Tuple[bytes, ...] = tuple(
+    bytes(ord("1") if value == player else ord("0") for value in range(256))
+    for player in range(3)
+)
+
+
+class _BoardCell(Cell):
+    __slots__ = ("_board", "_index")
+
+    def __init__(self, board: "Board", index: int) -> None:
+        """
+        Cell that reads and writes its state straight from a Board's state bytes. These are only made when
+        Board.cells is asked for.
+
+        :param board: the board holding the state
+        :param index: the index of the cell, x * size + y
+        """
+        self._board: Board = board
+        self._index: int = index
+
+    @property
+    def state(self) -> CellState:
+        return CELL_STATES[self._board._states[self._index]]
+
+    @state.setter
+    def state(self, state: CellState) -> None:
+        self._board._set_hashed_state(self._index, state.value)
 
 
 class Board:
+    __slots__ = ("size", "zobrist_hash", "_states", "_counts", "_empty", "_cells")
+
     def __init__(
         self, size: int, saved_state: Optional[List[List[int]]] = None
     ) -> None:
+        """
+        Board that stores the state of each cell as one byte, at index x * size + y.
+
+        :param size: the length of one side of the board
+        :param saved_state: optional board state to load, as the value of each cell's CellState
+        """
         self.size: int = size
+        self._states: bytearray = bytearray(size * size)
+        # Number of cells in each CellState, indexed by the state's value
+        self._counts: List[int] = [size * size, 0, 0]
+        # Indexes of the empty cells in increasing order
+        self._empty: array = array("H", range(size * size))
+        # Empty cells add nothing to the hash
+        self.zobrist_hash: int = 0
+        self._cells: Optional[List[List[Cell]]] = None
         if saved_state is None:
-            self.cells: List[List[Cell]] = [
-                [Cell(CellState.empty) for _ in range(size)] for _ in range(size)
-            ]
             # initialize the four starting disks at the center of the board
-            self.cells[size // 2][size // 2 - 1].state = CellState.player1
-            self.cells[size // 2 - 1][size // 2].state = CellState.player1
-            self.cells[size // 2 - 1][size // 2 - 1].state = CellState.player2
-            self.cells[size // 2][size // 2].state = CellState.player2
+            self.set_cell_state(size // 2, size // 2 - 1, CellState.player1)
+            self.set_cell_state(size // 2 - 1, size // 2, CellState.player1)
+            self.set_cell_state(size // 2 - 1, size // 2 - 1, CellState.player2)
+            self.set_cell_state(size // 2, size // 2, CellState.player2)
         else:
-            self.cells = [
-                [Cell(CellState(saved_state[j][i])) for i in range(self.size)]
-                for j in range(self.size)
-            ]
+            for x in range(size):
+                for y in range(size):
+                    self.set_cell_state(x, y, CellState(saved_state[x][y]))
+
+    @property
+    def cells(self) -> List[List[Cell]]:
+        """
+        View of the board as a grid of Cells. Changing a Cell changes the board.
+
+        :return: cells
+        """
+        # The cells read and write through to the board, so the grid is only built the first time
+        if self._cells is None:
+            self._cells = self._make_cells()
+        return self._cells
+
+    @cells.setter
+    def cells(self, cells: List[List[Cell]]) -> None:
+        for x in range(self.size):
+            for y in range(self.size):
+                self.set_cell_state(x, y, cells[x][y].state)
+
+    def _make_cells(self) -> List[List[Cell]]:
+        """
+        Build the grid of Cells returned by cells.
+
+        :return: cells
+        """
+        return [
+            [_BoardCell(self, x * self.size + y) for y in range(self.size)]
+            for x in range(self.size)
+        ]
 
     def get_state(self) -> List[List[CellState]]:
         """
@@ -29,7 +104,14 @@ class Board:
 
         :return: cells
         """
-        return [[cell.state for cell in row] for row in self.cells]
+        states: bytearray = self._states
+        return [
+            [
+                CELL_STATES[value]
+                for value in states[x * self.size : (x + 1) * self.size]
+            ]
+            for x in range(self.size)
+        ]
 
     def get_num_type(self, cell_state: CellState) -> int:
         """
@@ -38,12 +120,76 @@ class Board:
         :param cell_state: the type of CellState to count
         :return: the number of the given Cell type cells in the board
         """
-        count = 0
-        for i in range(self.size):
-            for j in range(self.size):
-                if self.cells[i][j].state == cell_state:
-                    count += 1
-        return count
+        return self._counts[cell_state.value]
+
+    def get_empty_posns(self) -> List[Tuple[int, int]]:
+        """
+        Get the positions of the empty cells, so move generation only has to look at those.
+
+        :return: list of x,y positions in row-major order
+        """
+        return [divmod(index, self.size) for index in self._empty]
+
+    def get_cell_state(self, x: int, y: int) -> CellState:
+        """
+        Get the state of a single cell.
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :return: the CellState at x,y
+        """
+        return CELL_STATES[self._states[x * self.size + y]]
+
+    def set_cell_state(self, x: int, y: int, state: CellState) -> None:
+        """
+        Set the state of a single cell.
+
+        :param x: the x coordinate
+        :param y: the y coordinate
+        :param state: the new CellState at x,y
+        """
+        self._set_hashed_state(x * self.size + y, state.value)
+
+    def _set_hashed_state(self, index: int, value: int) -> None:
+        """
+        Set the state of a cell, keeping zobrist_hash up to date as well.
+
+        :param index: the index of the cell, x * size + y
+        :param value: the value of the cell's new CellState
+        """
+        disk_keys: Tuple[Tuple[int, ...], ...] = get_zobrist_keys(self.size).disk_keys
+        self.zobrist_hash ^= (
+            disk_keys[self._get_value(index)][index] ^ disk_keys[value][index]
+        )
+        self._set_state(index, value)
+
+    def _get_value(self, index: int) -> int:
+        """
+        Get the value of a cell's CellState.
+
+        :param index: the index of the cell, x * size + y
+        :return: the value
+        """
+        return self._states[index]
+
+    def _set_state(self, index: int, value: int) -> None:
+        """
+        Set the state of a cell, keeping the disk counts and the list of empty cells up to date. Callers keep
+        zobrist_hash up to date.
+
+        :param index: the index of the cell, x * size + y
+        :param value: the value of the cell's new CellState
+        """
+        old_value: int = self._states[index]
+        if value == old_value:
+            return
+        self._states[index] = value
+        self._counts[old_value] -= 1
+        self._counts[value] += 1
+        if old_value == 0:
+            del self._empty[bisect_left(self._empty, index)]
+        elif value == 0:
+            insort(self._empty, index)
 
     def is_valid_posn(self, x: int, y: int) -> bool:
         """
@@ -54,3 +200,84 @@ class Board:
         :return: True if the x,y coordinate is on the board, else False
         """
         return (x in range(self.size)) and (y in range(self.size))
+
+    def get_discs(self, player: int) -> int:
+        """
+        Get the disk mask of a player, with bit x * size + y set for a disk at x,y.
+
+        :param player: the player number, either 1 or 2
+        :return: bit mask with a bit set for every disk of the player
+        """
+        # Cell 0 is the lowest bit, so it has to be the last binary digit
+        return int(self._states.translate(_DISC_DIGITS[player])[::-1], 2)
+
+    def get_canonical_form(self) -> Tuple[int, int, int]:
+        """
+        Get the disk masks of the board turned into the form that all 8 of its symmetric versions share.
+
+        :return: the player 1 and player 2 disk masks of the canonical form, and which symmetry from
+                 get_symmetries turns the board into it
+        """
+        return get_canonical_form(self.get_discs(1), self.get_discs(2), self.size)
+
+    def compute_hash(self) -> int:
+        """
+        Compute the Zobrist hash of the board from scratch. Every change to the board keeps zobrist_hash up to
+        date without calling this.
+
+        :return: the Zobrist hash of the disks on the board
+        """
+        keys: ZobristKeys = get_zobrist_keys(self.size)
+        zobrist_hash: int = 0
+        for x, row in enumerate(self.get_state()):
+            for y, state in enumerate(row):
+                zobrist_hash ^= keys.disk_keys[state.value][x * self.size + y]
+        return zobrist_hash
+
+    def apply_move(
+        self, player: int, posn: Tuple[int, int], flips: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Place a disk for the player at the given position and flip the given disks.
+        Does not check the move is valid.
+
+        :param player: the player placing the disk, either 1 or 2
+        :param posn: the position to place the disk
+        :param flips: the positions of the opponent disks to flip
+        """
+        self._set_state(posn[0] * self.size + posn[1], player)
+        for x, y in flips:
+            self._set_state(x * self.size + y, player)
+        self.zobrist_hash ^= self._get_move_hash(player, posn, flips)
+
+    def undo_move(
+        self, player: int, posn: Tuple[int, int], flips: List[Tuple[int, int]]
+    ) -> None:
+        """
+        Take back a move made with apply_move.
+
+        :param player: the player who placed the disk, either 1 or 2
+        :param posn: the position the disk was placed at
+        :param flips: the positions of the disks that were flipped
+        """
+        self._set_state(posn[0] * self.size + posn[1], 0)
+        for x, y in flips:
+            self._set_state(x * self.size + y, 3 - player)
+        self.zobrist_hash ^= self._get_move_hash(player, posn, flips)
+
+    def _get_move_hash(
+        self, player: int, posn: Tuple[int, int], flips: List[Tuple[int, int]]
+    ) -> int:
+        """
+        Get the value a move XORs into the Zobrist hash. XORing it in again takes the move back out.
+
+        :param player: the player placing the disk, either 1 or 2
+        :param posn: the position of the disk
+        :param flips: the positions of the flipped disks
+        :return: the hash difference the move makes
+        """
+        keys: ZobristKeys = get_zobrist_keys(self.size)
+        move_hash: int = keys.disk_keys[player][posn[0] * self.size + posn[1]]
+        for x, y in flips:
+            move_hash ^= keys.flip_keys[x * self.size + y]
+        return move_hash
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Tuple
 
 
 class CellState(Enum):
@@ -7,7 +8,17 @@ class CellState(Enum):
     player2 = 2
 
 
+# Every CellState indexed by its value, to turn stored ints back into states without an Enum lookup
+CELL_STATES: Tuple[CellState, CellState, CellState] = (
+    CellState.empty,
+    CellState.player1,
+    CellState.player2,
+)
+
+
 class Cell:
+    __slots__ = ("state",)
+
     def __init__(self, state: CellState):
         self.state = state
 
@@ -15,9 +26,10 @@ class Cell:
         """
         Flip the Cell state from 1 to 2 or 2 to 1. If the cell is empty, don't change it.
         """
-        if self.state.value == 1:
+        state: CellState = self.state
+        if state is CellState.player1:
             self.state = CellState.player2
-        elif self.state.value == 2:
+        elif state is CellState.player2:
             self.state = CellState.player1
 
     def fill(self, curr_player: int) -> None:
@@ -26,5 +38,5 @@ class Cell:
 
         :param curr_player: the player whose turn is in progress, either 1 or 2
         """
-        if self.state.value == 0:
-            self.state = CellState(curr_player)
+        if self.state is CellState.empty:
+            self.state = CELL_STATES[curr_player]
@@ -0,0 +1,284 @@
+import sys
+import time
+from threading import Event
+from typing import Dict, List, Optional, Tuple
+
+from client.model.bit_board import find_flips, find_moves
+from client.model.game import Game
+from client.model.transposition_table import TranspositionTable
+
+
+class SolverTimeout(Exception):
+    """
+    Raised by EndgameSolver when its deadline passes or it is stopped before the position is solved
+    """
+
+    pass
+
+
+def _count(bits: int) -> int:
+    """
+    :param bits: a bit mask
+    :return: number of set bits
+    """
+    return bin(bits).count("1")
+
+
+class EndgameSolver:
+    # Below this many empty cells, moves are only ordered by parity because counting mobility costs more than
+    # it saves
+    _MOBILITY_ORDER_EMPTIES: int = 7
+    # Positions with at least this many empty cells are kept in the solver's table
+    _TABLE_EMPTIES: int = 6
+    # Rough size of one position in the table: the dict slot and the key and value tuples with their ints
+    _ENTRY_BYTES: int = 320
+    _INFINITY: int = sys.maxsize
+
+    def __init__(
+        self, size: int, max_bytes: int = TranspositionTable.DEFAULT_MAX_BYTES
+    ) -> None:
+        """
+        Searches positions near the end of the game to the very end, scoring them by the exact final disk
+        difference instead of a heuristic. Works straight on disk masks, so it does not change the game.
+
+        :param size: the length of one side of the boards it will solve
+        :param max_bytes: approximate memory cap for the table of solved positions
+        """
+        self.size: int = size
+        self.max_bytes: int = max_bytes
+        # The table is emptied when it reaches this many positions
+        self._max_table_size: int = max(1, max_bytes // self._ENTRY_BYTES)
+        self.nodes_searched: int = 0
+        self._deadline: Optional[float] = None
+        self._stop: Optional[Event] = None
+        # Lower bound, upper bound and best move bit of solved positions, keyed by the disk masks of the player to
+        # move and the opponent. Bounds stay true between solves, so the table is kept
+        self._table: Dict[Tuple[int, int], Tuple[int, int, int]] = {}
+        # The board split into quadrants. Playing into a quadrant with an odd number of empty cells tends to
+        # leave the opponent without the last move there
+        half: int = (size + 1) // 2
+        self._regions: List[int] = []
+        for x_range in (range(0, half), range(half, size)):
+            for y_range in (range(0, half), range(half, size)):
+                region: int = 0
+                for x in x_range:
+                    for y in y_range:
+                        region |= 1 << (x * size + y)
+                if region:
+                    self._regions.append(region)
+
+    def solve(
+        self,
+        game: Game,
+        exact: bool = True,
+        deadline: Optional[float] = None,
+        stop: Optional[Event] = None,
+    ) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """
+        Find the best move and its result with perfect play from both players.
+
+        :param game: the game to solve. It is not changed
+        :param exact: True to find the exact final disk difference, False to only find whether the player to
+                      move wins, loses or draws, which is much faster
+        :param deadline: time.perf_counter() value to give up at, or None to always finish
+        :param stop: event another thread can set to make the solver give up
+        :return: the result for the player to move and the move that gets it, or None if the player cannot move.
+                 The result is their final disk count minus the opponent's, or 1, 0 or -1 for a win, draw or loss
+                 when exact is False
+        :raises SolverTimeout: when the deadline passes or the stop event is set first
+        """
+        own: int = game.board.get_discs(game.curr_player)
+        opp: int = game.board.get_discs(3 - game.curr_player)
+        self.nodes_searched = 0
+        self._deadline = deadline
+        self._stop = stop
+        alpha, beta = (-self._INFINITY, self._INFINITY) if exact else (-1, 1)
+        best_move: Optional[Tuple[int, int]] = None
+        best_score: int = -self._INFINITY
+        empty: int = ~(own | opp) & ((1 << (self.size * self.size)) - 1)
+        for move, flips in self.__order_moves(own, opp, empty):
+            score: int = -self.__search(
+                opp & ~flips, own | flips | move, empty ^ move, -beta, -alpha, False
+            )
+            if score > best_score:
+                best_score = score
+                best_move = divmod(move.bit_length() - 1, self.size)
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        if best_move is None:
+            # The player to move has to pass
+            best_score = self.__search(own, opp, empty, alpha, beta, False)
+        if not exact:
+            best_score = (best_score > 0) - (best_score < 0)
+        return best_score, best_move
+
+    def __order_moves(
+        self, own: int, opp: int, empty: int, first_move: int = 0
+    ) -> List[Tuple[int, int]]:
+        """
+        Get the moves of the player to move, most promising first: moves leaving the opponent the fewest
+        replies, then moves into regions with an odd number of empty cells.
+
+        :param own: disk mask of the player to move
+        :param opp: disk mask of the opponent
+        :param empty: mask of the empty cells
+        :param first_move: bit of a move to put before all others, such as the best move of an earlier search
+        :return: list of (move bit, flip mask) pairs
+        """
+        size: int = self.size
+        moves: int = find_moves(own, opp, size)
+        use_mobility: bool = _count(empty) > self._MOBILITY_ORDER_EMPTIES
+        odd_regions: int = 0
+        for region in self._regions:
+            if _count(region & empty) & 1:
+                odd_regions |= region
+        keyed_moves: List[Tuple[int, int, int, int]] = []
+        while moves:
+            move: int = moves & -moves
+            moves ^= move
+            flips: int = find_flips(own, opp, move, size)
+            mobility: int = (
+                _count(find_moves(opp & ~flips, own | flips | move, size))
+                if use_mobility
+                else 0
+            )
+            if move == first_move:
+                mobility = -1
+            keyed_moves.append((mobility, not (move & odd_regions), move, flips))
+        keyed_moves.sort()
+        return [(move, flips) for _, _, move, flips in keyed_moves]
+
+    def __search(
+        self, own: int, opp: int, empty: int, alpha: int, beta: int, passed: bool
+    ) -> int:
+        """
+        Alpha-beta search (in negamax form) to the end of the game.
+
+        :param own: disk mask of the player to move
+        :param opp: disk mask of the opponent
+        :param empty: mask of the empty cells
+        :param alpha: the score the player to move is already guaranteed
+        :param beta: the score the opponent is already guaranteed, as a score for the player to move
+        :param passed: whether the opponent just passed
+        :return: the final disk difference for the player to move
+        """
+        self.nodes_searched += 1
+        if self.nodes_searched & 1023 == 0 and (
+            (self._deadline is not None and time.perf_counter() > self._deadline)
+            or (self._stop is not None and self._stop.is_set())
+        ):
+            raise SolverTimeout()
+        if empty & (empty - 1) == 0:
+            # At most one empty cell left
+            return self.__solve_last(own, opp, empty)
+        rest: int = empty & (empty - 1)
+        if rest & (rest - 1) == 0:
+            # Two empty cells: trying both in each order is cheaper than generating moves
+            return self.__solve_last_two(own, opp, empty, alpha, beta)
+        use_table: bool = _count(empty) >= self._TABLE_EMPTIES
+        lower: int = -self._INFINITY
+        upper: int = self._INFINITY
+        table_move: int = 0
+        if use_table:
+            entry: Optional[Tuple[int, int, int]] = self._table.get((own, opp))
+            if entry is not None:
+                lower, upper, table_move = entry
+                if lower >= beta:
+                    return lower
+                if upper <= alpha:
+                    return upper
+                if lower == upper:
+                    return lower
+                alpha = max(alpha, lower)
+                beta = min(beta, upper)
+        moves: List[Tuple[int, int]] = self.__order_moves(own, opp, empty, table_move)
+        if len(moves) == 0:
+            if passed or find_moves(opp, own, self.size) == 0:
+                return _count(own) - _count(opp)
+            return -self.__search(opp, own, empty, -beta, -alpha, True)
+
+        alpha_orig: int = alpha
+        best_score: int = -self._INFINITY
+        best_move: int = 0
+        for move, flips in moves:
+            score: int = -self.__search(
+                opp & ~flips, own | flips | move, empty ^ move, -beta, -alpha, False
+            )
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+        if use_table:
+            # Narrow the bounds already known with what this search proved
+            if best_score <= alpha_orig:
+                upper = best_score
+            elif best_score >= beta:
+                lower = best_score
+            else:
+                lower = upper = best_score
+            if len(self._table) >= self._max_table_size:
+                self._table.clear()
+            self._table[(own, opp)] = (lower, upper, best_move)
+        return best_score
+
+    def __solve_last(self, own: int, opp: int, empty: int) -> int:
+        """
+        Final disk difference when at most one cell is left.
+
+        :param own: disk mask of the player to move
+        :param opp: disk mask of the opponent
+        :param empty: mask of the empty cell, or 0 if the board is full
+        :return: the final disk difference for the player to move
+        """
+        if empty:
+            flips: int = find_flips(own, opp, empty, self.size)
+            if flips:
+                return _count(own | flips | empty) - _count(opp & ~flips)
+            flips = find_flips(opp, own, empty, self.size)
+            if flips:
+                return _count(own & ~flips) - _count(opp | flips | empty)
+        return _count(own) - _count(opp)
+
+    def __solve_last_two(
+        self, own: int, opp: int, empty: int, alpha: int, beta: int
+    ) -> int:
+        """
+        Final disk difference when exactly two cells are left.
+
+        :param own: disk mask of the player to move
+        :param opp: disk mask of the opponent
+        :param empty: mask of the two empty cells
+        :param alpha: the score the player to move is already guaranteed
+        :param beta: the score the opponent is already guaranteed, as a score for the player to move
+        :return: the final disk difference for the player to move
+        """
+        first: int = empty & -empty
+        second: int = empty ^ first
+        best_score: int = -self._INFINITY
+        for move, other in ((first, second), (second, first)):
+            flips: int = find_flips(own, opp, move, self.size)
+            if flips:
+                score: int = -self.__solve_last(opp & ~flips, own | flips | move, other)
+                if score > best_score:
+                    best_score = score
+                    if score >= beta:
+                        return best_score
+        if best_score != -self._INFINITY:
+            return best_score
+        # The player to move has to pass
+        for move, other in ((first, second), (second, first)):
+            flips = find_flips(opp, own, move, self.size)
+            if flips:
+                score = self.__solve_last(own & ~flips, opp | flips | move, other)
+                if score < alpha:
+                    return score
+                if best_score == -self._INFINITY or score < best_score:
+                    best_score = score
+        if best_score != -self._INFINITY:
+            return best_score
+        return _count(own) - _count(opp)
@@ -0,0 +1,129 @@
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+CORNER_WEIGHT: int = 1000
+# Cells touching a corner give the opponent a way to take it
+NEXT_TO_CORNER_WEIGHT: int = -1000
+EDGE_WEIGHT: int = 50
+CENTER_WEIGHT: int = 20
+OTHER_WEIGHT: int = 1
+
+
+def _get_cell_weight(row: int, col: int, size: int) -> int:
+    """
+    Get the weight of holding a disk on one cell.
+
+    :param row: the x coordinate
+    :param col: the y coordinate
+    :param size: the length of one side of the board
+    :return: the weight of the cell
+    """
+    edge: int = size - 1
+    half: int = size // 2
+    on_row_edge: bool = row == 0 or row == edge
+    on_col_edge: bool = col == 0 or col == edge
+    if on_row_edge and on_col_edge:
+        return CORNER_WEIGHT
+    # Cells within one step of a corner in both directions
+    if min(row, edge - row) <= 1 and min(col, edge - col) <= 1:
+        return NEXT_TO_CORNER_WEIGHT
+    if on_row_edge or on_col_edge:
+        return EDGE_WEIGHT
+    if half - 1 <= row <= half and half - 1 <= col <= half:
+        return CENTER_WEIGHT
+    return OTHER_WEIGHT
+
+
+@lru_cache(maxsize=None)
+def get_weight_table(size: int) -> Tuple[int, ...]:
+    """
+    Get the weight of every cell of a board size, computed once per size.
+
+    :param size: the length of one side of the board
+    :return: the weights, indexed by x * size + y like BitBoard bits
+    """
+    return tuple(_get_cell_weight(x, y, size) for x in range(size) for y in range(size))
+
+
+@lru_cache(maxsize=None)
+def get_weight_classes(size: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Group the cells of a board size by weight, so a board can be scored with one bit count per weight.
+
+    :param size: the length of one side of the board
+    :return: a tuple of (weight, mask of the cells with that weight) pairs
+    """
+    masks: Dict[int, int] = {}
+    for index, weight in enumerate(get_weight_table(size)):
+        masks[weight] = masks.get(weight, 0) | (1 << index)
+    return tuple(sorted(masks.items()))
+
+
+@lru_cache(maxsize=None)
+def _get_weight_vector(size: int) -> np.ndarray:
+    """
+    :param size: the length of one side of the board
+    :return: the weight table as a NumPy vector, padded with zeros to a whole number of bytes
+    """
+    num_bits: int = _get_num_bytes(size) * 8
+    vector: np.ndarray = np.zeros(num_bits, dtype=np.int64)
+    vector[: size * size] = get_weight_table(size)
+    return vector
+
+
+def _get_num_bytes(size: int) -> int:
+    """
+    :param size: the length of one side of the board
+    :return: number of bytes a disk mask of that board size fits in
+    """
+    return (size * size + 7) // 8
+
+
+def evaluate_masks(own: int, opp: int, size: int) -> int:
+    """
+    Score a position by the weights of the cells each player holds.
+
+    :param own: disk mask of the player to score for
+    :param opp: disk mask of the opponent
+    :param size: the length of one side of the board
+    :return: the weight of own disks minus the weight of opponent disks
+    """
+    score: int = 0
+    for weight, mask in get_weight_classes(size):
+        score += weight * (bin(own & mask).count("1") - bin(opp & mask).count("1"))
+    return score
+
+
+def masks_to_bits(masks: Sequence[int], size: int) -> np.ndarray:
+    """
+    Unpack disk masks into a 0/1 array, one row per mask.
+
+    :param masks: the disk masks
+    :param size: the length of one side of the board
+    :return: uint8 array of shape (len(masks), number of cells rounded up to a whole byte)
+    """
+    num_bytes: int = _get_num_bytes(size)
+    packed: np.ndarray = np.frombuffer(
+        b"".join(mask.to_bytes(num_bytes, "little") for mask in masks),
+        dtype=np.uint8,
+    ).reshape(len(masks), num_bytes)
+    return np.unpackbits(packed, axis=1, bitorder="little")
+
+
+def evaluate_batch(own: Sequence[int], opp: Sequence[int], size: int) -> np.ndarray:
+    """
+    Score many positions at once with evaluate_masks' weights, as one matrix product.
+
+    :param own: disk mask of the player to score for, one per position
+    :param opp: disk mask of the opponent, one per position
+    :param size: the length of one side of the board
+    :return: int64 array of scores, one per position
+    """
+    if len(own) == 0:
+        return np.zeros(0, dtype=np.int64)
+    difference: np.ndarray = masks_to_bits(own, size).astype(np.int64) - masks_to_bits(
+        opp, size
+    )
+    return difference @ _get_weight_vector(size)
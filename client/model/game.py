@@ -1,9 +1,16 @@
+import random
 from dataclasses import dataclass
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from client.model.abstract_rule import AbstractRule
+from client.model.bit_board import BitBoard
 from client.model.board import Board
 from client.model.cell import CellState
+from client.model.symmetry import get_canonical_hash
+from client.model.zobrist import get_zobrist_keys
+
+# Compact picklable encoding of a position: board size, player 1 disk mask, player 2 disk mask and the player to move
+Position = Tuple[int, int, int, int]
 
 
 @dataclass
@@ -12,6 +19,14 @@ class UpdatedGameInfo:
     next_turn: int
 
 
+@dataclass
+class MoveRecord:
+    posn: Tuple[int, int]
+    flips: List[Tuple[int, int]]
+    prev_player: int
+    passed: bool
+
+
 class Game:
     def __init__(
         self,
@@ -29,27 +44,28 @@ class Game:
         """
         self._id: Optional[int] = None
         # Use the size and rule preference of active user, since both users must use the same size and rules
-        self.board: Board = Board(board_size)
+        self.board: Board = BitBoard(board_size)
         self.rules: AbstractRule = rules
         self.save: bool = save
         self.curr_player: int = 1 if p1_first_move else 2
         self._forfeited_player: Optional[int] = None
+        self._move_history: List[MoveRecord] = []
 
     def is_game_over(self) -> bool:
         """
-        Check if the board has no empty spaces, no player1 disks, no player2 disks, or current player has no valid moves
+        Check if the current player has no valid moves or a player has forfeited.
         These are the states in which the game ends.
+        A full board or a board without one player's disks leaves no valid moves. The board keeps count of its
+        empty cells, so a full board is checked first without generating moves.
         If current player has no valid moves, then no valid moves exist for either player since turn would
         have been ceded to opponent already.
 
         :return: true if the game is over (no more turns can be made by one or both players), otherwise false
         """
         return (
-            (self.board.get_num_type(CellState.empty) == 0)
-            or (self.board.get_num_type(CellState.player1) == 0)
-            or (self.board.get_num_type(CellState.player2) == 0)
-            or (not self.valid_moves_exist())
-            or self._forfeited_player is not None
+            self._forfeited_player is not None
+            or self.board.get_num_type(CellState.empty) == 0
+            or not self.valid_moves_exist()
         )
 
     def place_tile(self, posn: Tuple[int, int]) -> bool:
@@ -61,67 +77,142 @@ class Game:
         :raises Exception: Thrown when the given position is not on the board
         :return: True if the move was successfully completed, or false if it was invalid
         """
+        return self.make_move(posn) is not None
+
+    def play_random_moves(
+        self, rng: random.Random, num_moves: Optional[int] = None, num_empty: int = 0
+    ) -> None:
+        """
+        Play seeded random moves, so the same positions can be built every run. Stops early if the game ends.
+
+        :param rng: source of the moves. Each move is chosen from the valid moves in sorted order
+        :param num_moves: the number of moves to play, or None for no limit
+        :param num_empty: stop once the board has no more than this many empty cells
+        """
+        moves_played: int = 0
+        while (
+            (num_moves is None or moves_played < num_moves)
+            and self.board.get_num_type(CellState.empty) > num_empty
+            and not self.is_game_over()
+        ):
+            self.place_tile(rng.choice(sorted(self.get_valid_move_flips())))
+            moves_played += 1
+
+    def make_move(
+        self,
+        posn: Tuple[int, int],
+        flips: Optional[List[Tuple[int, int]]] = None,
+    ) -> Optional[MoveRecord]:
+        """
+        Play a move in place for the currently active player and push it onto the undo stack.
+
+        :param posn: the position on the board to place a disk
+        :param flips: the disks the move flips, if already known from get_valid_move_flips. Must be correct if given
+        :raises Exception: Thrown when the given position is not on the board
+        :return: record that undoes the move when given to unmake_move, or None if the move was invalid
+        """
         if not self.board.is_valid_posn(posn[0], posn[1]):
             raise Exception("out-of bounds move attempted")
-        if not self.rules.is_valid_move(self.curr_player, posn, self.board):
-            return False
-        self.board.cells[posn[0]][posn[1]].fill(self.curr_player)
-
-        # Flip all Cells that are between this posn and any other curr_player disks
-        self.__flip_opponents_tiles(posn)
+        if flips is None:
+            flips = self.get_valid_move_flips().get(posn)
+            if flips is None:
+                return None
+        record: MoveRecord = MoveRecord(
+            posn=posn, flips=flips, prev_player=self.curr_player, passed=False
+        )
+        # Place the disk and flip all Cells that are between this posn and any other curr_player disks
+        self.board.apply_move(self.curr_player, posn, flips)
 
         # Set next player if they have a valid move
         self.curr_player = 2 if self.curr_player == 1 else 1
         if not self.valid_moves_exist():
             self.curr_player = 2 if self.curr_player == 1 else 1
-        return True
+            record.passed = True
+        self._move_history.append(record)
+        return record
 
-    def __flip_opponents_tiles(self, posn: Tuple[int, int]) -> None:
+    def unmake_move(self, record: MoveRecord) -> None:
         """
-        Check for opponent disks around the given Tuple and flip any opponent cells that are between the given Tuple
-        and any other curr_player disks.
+        Restore the position from before a move made with make_move. Moves must be undone in reverse order.
 
-        :param posn: the curr_player disk that may cause opponent tiles to be flipped
+        :param record: the record returned by make_move for the most recent move
+        :raises Exception: Thrown when the record is not for the most recent move
         """
-        # check every cell around posn
-        for x_offset, y_offset in (
-            [1, 1],
-            [1, -1],
-            [-1, 1],
-            [-1, -1],
-            [0, 1],
-            [0, -1],
-            [1, 0],
-            [-1, 0],
-        ):
-            x, y = posn
-            x += x_offset
-            y += y_offset
-            # make sure the cell is on the board and is filled with opponent's disk
-            if self.board.is_valid_posn(x, y) and not (
-                self.board.cells[x][y].state.value
-                in [CellState.empty.value, self.curr_player]
-            ):
-                # Iterate through all cells on the board in this direction that are filled with opponent's disk
-                while self.board.is_valid_posn(x, y) and not (
-                    self.board.cells[x][y].state.value
-                    in [CellState.empty.value, self.curr_player]
-                ):
-                    x += x_offset
-                    y += y_offset
-                # if the adjacent cell is not on the board, skip to next offset direction
-                if not self.board.is_valid_posn(x, y):
-                    continue
-                # If we have found another curr_player disk, move backwards toward original posn,
-                # flipping opponent disks as we go
-                if self.board.cells[x][y].state.value == self.curr_player:
-                    # Move back once at beginning
-                    x -= x_offset
-                    y -= y_offset
-                    while (x, y) != posn:
-                        self.board.cells[x][y].flip()
-                        x -= x_offset
-                        y -= y_offset
+        if not self._move_history or self._move_history[-1] is not record:
+            raise Exception("only the most recent move can be unmade")
+        self._move_history.pop()
+        self.board.undo_move(record.prev_player, record.posn, record.flips)
+        self.curr_player = record.prev_player
+
+    def get_move_history(self) -> List[MoveRecord]:
+        """
+        Get the undo stack of moves made on this game, oldest first.
+
+        :return: list of move records
+        """
+        return self._move_history
+
+    def get_position(self) -> Position:
+        """
+        Get a compact encoding of the position that is cheap to pickle, e.g. to send to another process.
+
+        :return: the board size, the disk masks of player 1 and player 2, and the player to move
+        """
+        return (
+            self.board.size,
+            self.board.get_discs(1),
+            self.board.get_discs(2),
+            self.curr_player,
+        )
+
+    @classmethod
+    def from_position(cls, position: Position, rules: AbstractRule) -> "Game":
+        """
+        Create a game from an encoding made by get_position. The game has no move history.
+
+        :param position: the encoded position
+        :param rules: The set of rules the game will be running on
+        :return: the game
+        """
+        size, player1_discs, player2_discs, curr_player = position
+        game: Game = cls(size, rules, p1_first_move=curr_player == 1)
+        game.board = BitBoard.from_discs(size, player1_discs, player2_discs)
+        return game
+
+    def get_hash(self) -> int:
+        """
+        Get the Zobrist hash of the position, covering the disks on the board and the player to move.
+
+        :return: the hash of the position
+        """
+        if self.curr_player == 2:
+            return (
+                self.board.zobrist_hash
+                ^ get_zobrist_keys(self.board.size).player2_to_move
+            )
+        return self.board.zobrist_hash
+
+    def get_canonical_hash(self) -> Tuple[int, int]:
+        """
+        Get a hash of the position that is the same for all 8 symmetric versions of it, for caches and
+        books that should share what they know between mirrored and rotated positions.
+
+        :return: the hash, and which symmetry from get_symmetries turns the position into its canonical form
+        """
+        return get_canonical_hash(
+            self.board.get_discs(1),
+            self.board.get_discs(2),
+            self.curr_player == 2,
+            self.board.size,
+        )
+
+    def get_valid_move_flips(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Get every valid move for the currently active player along with the disks each move would flip.
+
+        :return: a dictionary from each valid move to the positions of the disks it flips
+        """
+        return self.rules.get_valid_moves(self.curr_player, self.board)
 
     def get_valid_moves(self) -> List[List[bool]]:
         """
@@ -133,11 +224,8 @@ class Game:
         valid_moves: List[List[bool]] = [
             [False for _ in range(self.board.size)] for _ in range(self.board.size)
         ]
-        for i in range(self.board.size):
-            for j in range(self.board.size):
-                valid_moves[i][j] = self.rules.is_valid_move(
-                    self.curr_player, (i, j), self.board
-                )
+        for x, y in self.get_valid_move_flips():
+            valid_moves[x][y] = True
         return valid_moves
 
     def valid_moves_exist(self) -> bool:
@@ -146,9 +234,7 @@ class Game:
 
         :return: Moves exist (true) or not (false)
         """
-        return any(
-            [any([cell is True for cell in row]) for row in self.get_valid_moves()]
-        )
+        return self.rules.has_valid_move(self.curr_player, self.board)
 
     def get_winner(self) -> int:
         """
@@ -1,5 +1,6 @@
-from typing import Tuple, Optional
-from client.model.ai import AI
+from typing import Dict, Tuple, Optional, Type
+from client.model.ai import AI, SearchCancelled
+from client.model.mcts_ai import MCTSAI
 from client.model.player import Player
 from client.model.game import Game
 from client.model.abstract_rule import AbstractRule
@@ -7,6 +8,9 @@ from client.model.user import User
 
 
 class GameManager:
+    # AI engines a game can be played against, by name
+    AI_ENGINES: Dict[str, Type[AI]] = {"alpha_beta": AI, "mcts": MCTSAI}
+
     def __init__(
         self,
         player1: Player,
@@ -22,6 +26,8 @@ class GameManager:
         :param main_user is the player1 user
         """
         self.__players: Tuple[Player, Player] = (player1, player2)
+        # Set from another thread to stop make_move from playing AI moves
+        self.__cancelled: bool = False
         self.main_user: User = main_user
         self.__board_size: int = self.main_user.get_preference().get_board_size()
         self.__rules: AbstractRule = self.main_user.get_preference().get_rule()
@@ -37,13 +43,88 @@ class GameManager:
         ):
             self.make_move()
 
-    def make_move(self) -> None:
-        self.__players[self.game.get_curr_player() - 1].place_tile(self.game)
-        while (
-            isinstance(self.__players[self.game.get_curr_player() - 1], AI)
-            and not self.game.is_game_over()
-        ):
-            self.__players[self.game.get_curr_player() - 1].place_tile(self.game)
+    @classmethod
+    def create_ai(cls, engine: str = "alpha_beta", level: int = 0) -> AI:
+        """
+        Create an AI player
+        :param engine: name of the AI engine in AI_ENGINES
+        :param level: difficulty level of the AI
+        :raises KeyError: when there is no engine with the given name
+        :return: the AI
+        """
+        ai: AI = cls.AI_ENGINES[engine]()
+        ai.set_level(level)
+        return ai
+
+    def make_move(self, time_limit: Optional[float] = None) -> None:
+        """
+        Plays the current player's move, then the moves of any AI players whose turn comes next.
+        Returns early without playing the move being searched if cancel_moves is called from another thread
+        :param time_limit: time budget in seconds for each AI move, replacing the AIs' own time limits
+        """
+        if self.__cancelled:
+            return
+        try:
+            self.__place_tile(time_limit)
+            while (
+                self.is_ai_turn()
+                and not self.game.is_game_over()
+                and not self.__cancelled
+            ):
+                self.__place_tile(time_limit)
+        except SearchCancelled:
+            return
+        if self.__cancelled:
+            return
+        # Let the AI think about its next move while the other player chooses theirs
+        waiting_player: Player = self.__players[2 - self.game.get_curr_player()]
+        if isinstance(waiting_player, AI):
+            waiting_player.start_pondering(self.game)
+
+    def is_ai_turn(self) -> bool:
+        """
+        Whether the player to move is an AI
+        :return: True if make_move would search for the next move
+        """
+        return isinstance(self.__players[self.game.get_curr_player() - 1], AI)
+
+    def cancel_moves(self) -> None:
+        """
+        Makes a make_move running in another thread give up the AI move it is searching for and return. No more
+        AI moves are played by make_move afterwards, so this is for when the game is ending
+        """
+        self.__cancelled = True
+        for player in self.__players:
+            if isinstance(player, AI):
+                player.cancel()
+
+    def stop_pondering(self) -> None:
+        """
+        Stops any AI players from thinking in the background, such as when the game ends
+        """
+        for player in self.__players:
+            if isinstance(player, AI):
+                player.stop_pondering()
+
+    def close(self) -> None:
+        """
+        Stops any AI players from thinking in the background and shuts down the worker processes they started, for
+        when the game has ended. An AI starts new ones if it plays another game
+        """
+        for player in self.__players:
+            if isinstance(player, AI):
+                player.close()
+
+    def __place_tile(self, time_limit: Optional[float]) -> None:
+        """
+        Has the current player place a tile
+        :param time_limit: time budget in seconds if the current player is an AI
+        """
+        player: Player = self.__players[self.game.get_curr_player() - 1]
+        if isinstance(player, AI):
+            player.place_tile(self.game, time_limit=time_limit)
+        else:
+            player.place_tile(self.game)
 
     # def set_move(self, posn: Tuple[int, int]) -> None:
     #
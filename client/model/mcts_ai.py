@@ -0,0 +1,408 @@
+import math
+import random
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from client.model.ai import AI
+from client.model.bit_board import find_flips, find_moves, get_directions
+from client.model.game import Game
+
+
+def random_playout(
+    player1_discs: int, player2_discs: int, player: int, size: int, rng: random.Random
+) -> int:
+    """
+    Play random moves to the end of the game on disk masks.
+
+    :param player1_discs: disk mask of player 1
+    :param player2_discs: disk mask of player 2
+    :param player: the player to move, either 1 or 2
+    :param size: the length of one side of the board
+    :param rng: random number generator to pick moves with
+    :return: player 1's final disk count minus player 2's
+    """
+    own, opp = (
+        (player1_discs, player2_discs)
+        if player == 1
+        else (player2_discs, player1_discs)
+    )
+    passed: bool = False
+    while True:
+        moves: int = find_moves(own, opp, size)
+        if moves:
+            passed = False
+            # Pick a random set bit
+            for _ in range(rng.randrange(bin(moves).count("1"))):
+                moves &= moves - 1
+            move: int = moves & -moves
+            flips: int = find_flips(own, opp, move, size)
+            own, opp = opp & ~flips, own | flips | move
+        elif passed:
+            break
+        else:
+            passed = True
+            own, opp = opp, own
+        player = 3 - player
+    player1_discs, player2_discs = (own, opp) if player == 1 else (opp, own)
+    return bin(player1_discs).count("1") - bin(player2_discs).count("1")
+
+
+def _shift_array(bits: np.ndarray, shift: int, mask: np.uint64) -> np.ndarray:
+    """
+    :param bits: uint64 disk masks
+    :param shift: shift amount from get_directions
+    :param mask: wrap-around mask from get_directions
+    :return: the masks with every bit moved one step in the direction
+    """
+    if shift > 0:
+        return (bits << np.uint64(shift)) & mask
+    return (bits >> np.uint64(-shift)) & mask
+
+
+def _count_array(bits: np.ndarray) -> np.ndarray:
+    """
+    :param bits: uint64 disk masks
+    :return: the number of set bits of each mask
+    """
+    return (
+        np.unpackbits(bits.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1)
+        .sum(axis=1)
+        .astype(np.int64)
+    )
+
+
+def batch_playouts(
+    player1_discs: int,
+    player2_discs: int,
+    player: int,
+    size: int,
+    count: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Play many random games to the end at once from one position, with every board in one NumPy array.
+    Only boards up to 8x8 fit the uint64 masks this uses.
+
+    :param player1_discs: disk mask of player 1
+    :param player2_discs: disk mask of player 2
+    :param player: the player to move, either 1 or 2
+    :param size: the length of one side of the board (at most 8)
+    :param count: number of games to play
+    :param rng: random number generator to pick moves with
+    :return: int64 array of player 1's final disk count minus player 2's, one per game
+    """
+    directions: List[Tuple[int, np.uint64]] = [
+        (shift, np.uint64(mask)) for shift, mask in get_directions(size)
+    ]
+    full_mask: np.uint64 = np.uint64((1 << (size * size)) - 1)
+    own: np.ndarray = np.full(
+        count, player1_discs if player == 1 else player2_discs, dtype=np.uint64
+    )
+    opp: np.ndarray = np.full(
+        count, player2_discs if player == 1 else player1_discs, dtype=np.uint64
+    )
+    passes: np.ndarray = np.zeros(count, dtype=np.int8)
+    zero: np.uint64 = np.uint64(0)
+    one: np.uint64 = np.uint64(1)
+    while np.any(passes < 2):
+        empty: np.ndarray = ~(own | opp) & full_mask
+        moves: np.ndarray = np.zeros(count, dtype=np.uint64)
+        for shift, mask in directions:
+            run: np.ndarray = _shift_array(own, shift, mask) & opp
+            for _ in range(size - 3):
+                run |= _shift_array(run, shift, mask) & opp
+            moves |= _shift_array(run, shift, mask) & empty
+        # Finished games make no more moves
+        moves[passes >= 2] = zero
+        has_move: np.ndarray = moves != zero
+        # Pick a random set bit of each board by giving every legal cell a random priority
+        move_bits: np.ndarray = np.unpackbits(
+            moves.astype("<u8").view(np.uint8).reshape(-1, 8), axis=1, bitorder="little"
+        )
+        choice: np.ndarray = np.argmax(
+            move_bits * rng.random((count, 64)), axis=1
+        ).astype(np.uint64)
+        move: np.ndarray = np.where(has_move, one << choice, zero)
+        flips: np.ndarray = np.zeros(count, dtype=np.uint64)
+        for shift, mask in directions:
+            line: np.ndarray = _shift_array(move, shift, mask) & opp
+            for _ in range(size - 3):
+                line |= _shift_array(line, shift, mask) & opp
+            bounded: np.ndarray = (_shift_array(line, shift, mask) & own) != zero
+            flips |= np.where(bounded, line, zero)
+        passes = np.where(has_move, 0, passes + 1).astype(np.int8)
+        # Boards without a move pass, which is the same swap with nothing placed or flipped
+        own, opp = opp & ~flips, own | flips | move
+        player = 3 - player
+    # Every board made the same number of swaps, so all are on the same player
+    player1: np.ndarray = own if player == 1 else opp
+    player2: np.ndarray = opp if player == 1 else own
+    return _count_array(player1) - _count_array(player2)
+
+
+class _Node:
+    __slots__ = (
+        "player1_discs",
+        "player2_discs",
+        "player",
+        "move",
+        "parent",
+        "children",
+        "untried_moves",
+        "visits",
+        "wins",
+    )
+
+    def __init__(
+        self,
+        player1_discs: int,
+        player2_discs: int,
+        player: int,
+        move: int,
+        parent: Optional["_Node"],
+        size: int,
+    ) -> None:
+        """
+        A position in the search tree.
+
+        :param player1_discs: disk mask of player 1
+        :param player2_discs: disk mask of player 2
+        :param player: the player to move
+        :param move: bit of the move that led here, or 0 for a pass or the root
+        :param parent: the position before the move, or None for the root
+        :param size: the length of one side of the board
+        """
+        self.player1_discs: int = player1_discs
+        self.player2_discs: int = player2_discs
+        self.player: int = player
+        self.move: int = move
+        self.parent: Optional[_Node] = parent
+        self.children: List[_Node] = []
+        self.visits: int = 0
+        # Results of the playouts through this node for the player who made the move, 1 per win and 0.5 per draw
+        self.wins: float = 0.0
+        own, opp = (
+            (player1_discs, player2_discs)
+            if player == 1
+            else (player2_discs, player1_discs)
+        )
+        moves: int = find_moves(own, opp, size)
+        self.untried_moves: List[int] = []
+        while moves:
+            low_bit: int = moves & -moves
+            self.untried_moves.append(low_bit)
+            moves ^= low_bit
+        if not self.untried_moves and find_moves(opp, own, size):
+            # The only move is to pass
+            self.untried_moves.append(0)
+
+
+class MCTSAI(AI):
+    # Exploration constant of the UCT formula
+    _EXPLORATION: float = math.sqrt(2)
+    DEFAULT_PLAYOUTS: int = 2000
+
+    def __init__(self) -> None:
+        """
+        Create an AI that chooses moves by Monte Carlo tree search (UCT) with random playouts
+        instead of alpha-beta search. It stops at a playout budget or the time budget from AI.
+        """
+        super().__init__()
+        self._playouts: Optional[int] = None
+        # Number of playouts run at once from each new leaf. Above 1, boards up to 8x8 run them in one NumPy batch
+        self._batch_size: int = 1
+        self.playouts_run: int = 0
+        self._rng: random.Random = random.Random()
+        self._np_rng: np.random.Generator = np.random.default_rng()
+
+    @property
+    def playouts(self) -> Optional[int]:
+        """
+        Returns the playout budget for one move
+
+        :return: playout count, or None to use DEFAULT_PLAYOUTS when there is no time budget
+        """
+        return self._playouts
+
+    @playouts.setter
+    def playouts(self, playouts: Optional[int]) -> None:
+        """
+        Set the playout budget for one move. With a time budget as well, the search stops at whichever runs out
+        first.
+
+        :param playouts: playout count (>0), or None
+        """
+        if playouts is None or playouts > 0:
+            self._playouts = playouts
+
+    @property
+    def batch_size(self) -> int:
+        """
+        Returns the number of playouts run at once from each new leaf
+
+        :return: playouts per leaf
+        """
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, batch_size: int) -> None:
+        """
+        Set the number of playouts run at once from each new leaf.
+
+        :param batch_size: playouts per leaf (>0)
+        """
+        if batch_size > 0:
+            self._batch_size = batch_size
+
+    def seed(self, seed: int) -> None:
+        """
+        Seed the random playouts, so searches can be repeated.
+
+        :param seed: the seed
+        """
+        self._rng.seed(seed)
+        self._np_rng = np.random.default_rng(seed)
+
+    def _find_move(
+        self, game: Game, time_limit: Optional[float], start_time: float
+    ) -> Tuple[int, int]:
+        """
+        Runs playouts from the current position until the playout or time budget runs out.
+
+        param: game is the current game that the AI is playing. It is not changed.
+        param: time_limit is a time budget for this move only, in seconds. It replaces the AI's time_limit.
+        param: start_time is the time.perf_counter() value get_move was called at.
+        return Tuple[int, int] that represents the position that the AI will place a tile at.
+        """
+        size: int = game.board.size
+        root: _Node = _Node(
+            game.board.get_discs(1),
+            game.board.get_discs(2),
+            game.curr_player,
+            0,
+            None,
+            size,
+        )
+        self.playouts_run = 0
+        # Forced moves and passes are not searched, so no count from the last search is reported for them
+        self._nodes_searched = 0
+        if not root.untried_moves or root.untried_moves == [0]:
+            return 0, 0
+        if len(root.untried_moves) == 1:
+            return divmod(root.untried_moves[0].bit_length() - 1, size)
+        time_budget: Optional[float] = self.allocate_time(game, time_limit)
+        deadline: Optional[float] = (
+            None if time_budget is None else start_time + time_budget
+        )
+        playout_budget: Optional[int] = self._playouts
+        if playout_budget is None and deadline is None:
+            playout_budget = self.DEFAULT_PLAYOUTS
+        while (
+            (playout_budget is None or self.playouts_run < playout_budget)
+            and (deadline is None or time.perf_counter() < deadline)
+            and not self._is_stopped()
+        ):
+            node: _Node = self.__select(root)
+            if node.untried_moves:
+                node = self.__expand(node, size)
+            results: List[int] = self.__simulate(node, size)
+            self.playouts_run += len(results)
+            self.__backpropagate(node, results)
+        if not root.children:
+            # Stopped before the first playout
+            return divmod(root.untried_moves[0].bit_length() - 1, size)
+        best: _Node = max(root.children, key=lambda child: child.visits)
+        self._nodes_searched = self.playouts_run
+        self._last_score = round(1000 * best.wins / best.visits)
+        return divmod(best.move.bit_length() - 1, size)
+
+    def __select(self, node: "_Node") -> "_Node":
+        """
+        Walk down the tree to a node that still has untried moves or ends the game, picking the child with the
+        best UCT score at each step.
+
+        :param node: the root
+        :return: the node to expand
+        """
+        while not node.untried_moves and node.children:
+            log_visits: float = math.log(node.visits)
+            node = max(
+                node.children,
+                key=lambda child: child.wins / child.visits
+                + self._EXPLORATION * math.sqrt(log_visits / child.visits),
+            )
+        return node
+
+    def __expand(self, node: "_Node", size: int) -> "_Node":
+        """
+        Add a child for one untried move, chosen at random.
+
+        :param node: the node to expand
+        :param size: the length of one side of the board
+        :return: the new child
+        """
+        move: int = node.untried_moves.pop(self._rng.randrange(len(node.untried_moves)))
+        player1_discs: int = node.player1_discs
+        player2_discs: int = node.player2_discs
+        if move:
+            if node.player == 1:
+                flips: int = find_flips(player1_discs, player2_discs, move, size)
+                player1_discs |= flips | move
+                player2_discs &= ~flips
+            else:
+                flips = find_flips(player2_discs, player1_discs, move, size)
+                player2_discs |= flips | move
+                player1_discs &= ~flips
+        child: _Node = _Node(
+            player1_discs, player2_discs, 3 - node.player, move, node, size
+        )
+        node.children.append(child)
+        return child
+
+    def __simulate(self, node: "_Node", size: int) -> List[int]:
+        """
+        Play random games to the end from a node.
+
+        :param node: the node to play from
+        :param size: the length of one side of the board
+        :return: player 1's final disk count minus player 2's for each game
+        """
+        if self._batch_size > 1 and size <= 8:
+            return batch_playouts(
+                node.player1_discs,
+                node.player2_discs,
+                node.player,
+                size,
+                self._batch_size,
+                self._np_rng,
+            ).tolist()
+        return [
+            random_playout(
+                node.player1_discs, node.player2_discs, node.player, size, self._rng
+            )
+            for _ in range(self._batch_size)
+        ]
+
+    @staticmethod
+    def __backpropagate(node: Optional["_Node"], results: List[int]) -> None:
+        """
+        Add playout results to a node and every node above it.
+
+        :param node: the node the playouts started from
+        :param results: player 1's final disk count minus player 2's for each playout
+        """
+        player1_wins: float = sum(
+            1.0 if result > 0 else 0.5 if result == 0 else 0.0 for result in results
+        )
+        while node is not None:
+            node.visits += len(results)
+            if node.parent is not None:
+                # Credit the player who made the move into this node
+                node.wins += (
+                    player1_wins
+                    if node.parent.player == 1
+                    else len(results) - player1_wins
+                )
+            node = node.parent
@@ -0,0 +1,195 @@
+import argparse
+import mmap
+import os
+import struct
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from client.model.game import Game
+from client.model.symmetry import transform_cell, untransform_cell
+
+# File layout: a header, then entries sorted by key so lookups can binary search the memory-mapped file
+_HEADER: struct.Struct = struct.Struct("<4sBBH")
+_ENTRY: struct.Struct = struct.Struct("<QHBh")
+_MAGIC: bytes = b"RVBK"
+_VERSION: int = 1
+_DEFAULT_PATH: str = os.path.join(
+    os.path.dirname(__file__), "data", "opening_book_{size}.bin"
+)
+
+
+class BookEntry(NamedTuple):
+    # Cell index (x * size + y) of the best move, in the orientation of the canonical position
+    move: int
+    # How many moves ahead the move was searched
+    depth: int
+    # Search score of the move for the player to move, clamped to 16 bits
+    score: int
+
+
+@lru_cache(maxsize=None)
+def get_default_book(size: int) -> Optional["OpeningBook"]:
+    """
+    Get the opening book shipped with the client for a board size, opening it the first time it is needed.
+
+    :param size: the length of one side of the board
+    :return: the book, or None if there is no book for that size
+    """
+    path: str = _DEFAULT_PATH.format(size=size)
+    if not os.path.exists(path):
+        return None
+    return OpeningBook(path)
+
+
+class OpeningBook:
+    def __init__(self, path: str) -> None:
+        """
+        Read-only opening book backed by a memory-mapped file, so only the pages a lookup touches are loaded.
+
+        :param path: the book file, as written by write_book
+        :raises ValueError: when the file is not an opening book
+        """
+        self._file = open(path, "rb")
+        self._map: mmap.mmap = mmap.mmap(
+            self._file.fileno(), 0, access=mmap.ACCESS_READ
+        )
+        magic, version, self.size, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {_VERSION} opening book")
+        self._num_entries: int = (len(self._map) - _HEADER.size) // _ENTRY.size
+
+    def __len__(self) -> int:
+        """
+        :return: number of positions in the book
+        """
+        return self._num_entries
+
+    def close(self) -> None:
+        """
+        Close the book file.
+        """
+        self._map.close()
+        self._file.close()
+
+    def get_entry(self, key: int) -> Optional[BookEntry]:
+        """
+        Look up a canonical position hash.
+
+        :param key: hash from Game.get_canonical_hash
+        :return: the entry, or None if the position is not in the book
+        """
+        low: int = 0
+        high: int = self._num_entries
+        while low < high:
+            middle: int = (low + high) // 2
+            entry_key, move, depth, score = _ENTRY.unpack_from(
+                self._map, _HEADER.size + middle * _ENTRY.size
+            )
+            if entry_key == key:
+                return BookEntry(move, depth, score)
+            if entry_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return None
+
+    def lookup(self, game: Game) -> Optional[Tuple[Tuple[int, int], BookEntry]]:
+        """
+        Find the book move for the player to move.
+
+        :param game: the game to look up. It is not changed
+        :return: the move in the game's own orientation and its book entry, or None if the position is not in
+                 the book
+        """
+        if game.board.size != self.size:
+            return None
+        key, symmetry = game.get_canonical_hash()
+        entry: Optional[BookEntry] = self.get_entry(key)
+        if entry is None:
+            return None
+        # Undo the symmetry that made the position canonical
+        index: int = untransform_cell(entry.move, symmetry, self.size)
+        return divmod(index, self.size), entry
+
+
+def write_book(path: str, size: int, entries: Dict[int, BookEntry]) -> None:
+    """
+    Write an opening book file.
+
+    :param path: the file to write
+    :param size: the board size the book is for
+    :param entries: book entries keyed by canonical position hash
+    """
+    with open(path, "wb") as book_file:
+        book_file.write(_HEADER.pack(_MAGIC, _VERSION, size, 0))
+        for key in sorted(entries):
+            entry: BookEntry = entries[key]
+            score: int = max(-32768, min(32767, entry.score))
+            book_file.write(_ENTRY.pack(key, entry.move, entry.depth, score))
+
+
+def build_book(size: int, num_moves: int, difficulty: int) -> Dict[int, BookEntry]:
+    """
+    Search every position reachable in the first moves of a game, once per set of symmetric positions.
+
+    :param size: the length of one side of the board
+    :param num_moves: how many moves into the game the book covers
+    :param difficulty: AI difficulty to search each position at
+    :return: book entries keyed by canonical position hash
+    """
+    # Imported here since the AI module imports this one
+    from client.model.ai import AI
+    from client.model.standard_rule import StandardRule
+
+    ai: AI = AI()
+    ai.difficulty = difficulty
+    # Only searches decide book moves
+    ai.use_opening_book = False
+    ai.endgame_empties = 0
+    entries: Dict[int, BookEntry] = {}
+    positions: List[Game] = [Game(size, StandardRule())]
+    for _ in range(num_moves):
+        next_positions: List[Game] = []
+        for game in positions:
+            key, symmetry = game.get_canonical_hash()
+            if key in entries or game.is_game_over():
+                continue
+            posn: Tuple[int, int] = ai.get_move(game)
+            entries[key] = BookEntry(
+                transform_cell(posn[0] * size + posn[1], symmetry, size),
+                difficulty + 1,
+                ai.last_score,
+            )
+            for move in game.get_valid_move_flips():
+                next_game: Game = Game.from_position(game.get_position(), game.rules)
+                next_game.place_tile(move)
+                next_positions.append(next_game)
+        positions = next_positions
+    return entries
+
+
+def main() -> None:
+    """
+    Generate an opening book from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Generate a Reversi opening book")
+    parser.add_argument("--size", type=int, default=8, help="board size")
+    parser.add_argument(
+        "--moves", type=int, default=7, help="number of moves into the game to cover"
+    )
+    parser.add_argument(
+        "--difficulty", type=int, default=4, help="AI difficulty to search with"
+    )
+    parser.add_argument(
+        "--output", help="file to write, defaults to the book the client loads"
+    )
+    args = parser.parse_args()
+    path: str = args.output or _DEFAULT_PATH.format(size=args.size)
+    entries: Dict[int, BookEntry] = build_book(args.size, args.moves, args.difficulty)
+    write_book(path, args.size, entries)
+    print(f"Wrote {len(entries)} positions to {path}")
+
+
+if __name__ == "__main__":
+    main()
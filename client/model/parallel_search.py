@@ -0,0 +1,123 @@
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from client.model.abstract_rule import AbstractRule
+from client.model.game import Game, Position
+
+# Set in each worker process by _init_worker
+_shared_alpha: Any = None
+_worker_ai: Any = None
+
+
+def _init_worker(shared_alpha: Any, settings: Dict[str, Any]) -> None:
+    """
+    Runs once in each worker process.
+
+    :param shared_alpha: the best root score found so far by any process
+    :param settings: AI attributes to set on the worker's AI, so it searches like the AI that started it
+    """
+    global _shared_alpha, _worker_ai
+    # Imported here since the AI module imports this one
+    from client.model.ai import AI
+
+    _shared_alpha = shared_alpha
+    _worker_ai = AI()
+    for name, value in settings.items():
+        setattr(_worker_ai, name, value)
+
+
+def _search_move(
+    position: Position,
+    rules_type: Type[AbstractRule],
+    posn: Tuple[int, int],
+    depth: int,
+    deadline: Optional[float],
+) -> Tuple[Optional[int], int, int]:
+    """
+    Scores one root move in a worker process, starting from the best root score any process has found so far.
+
+    :param position: the position to search, from Game.get_position
+    :param rules_type: the rules class of the game
+    :param posn: the root move to score
+    :param depth: the number of moves to look ahead, including this one
+    :param deadline: time.time() value to give up at, or None to always finish
+    :return: the score of the move (None if it ran out of time), the alpha it was searched with, and the
+             number of positions visited
+    """
+    alpha: int = _shared_alpha.value
+    time_limit: Optional[float] = None
+    if deadline is not None:
+        time_limit = deadline - time.time()
+        if time_limit <= 0:
+            return None, alpha, 0
+    game: Game = Game.from_position(position, rules_type())
+    score: Optional[int] = _worker_ai.search_move(game, posn, depth, alpha, time_limit)
+    if score is not None and score > alpha:
+        with _shared_alpha.get_lock():
+            if score > _shared_alpha.value:
+                _shared_alpha.value = score
+    return score, alpha, _worker_ai.nodes_searched
+
+
+class ParallelSearcher:
+    def __init__(self, workers: int, settings: Dict[str, Any]) -> None:
+        """
+        Process pool that scores root moves in parallel. The best score found so far is shared between the
+        processes, so each move is searched with the tightest alpha bound available when it starts.
+
+        :param workers: number of worker processes
+        :param settings: AI attributes to set on each worker's AI, such as its evaluation and move ordering
+        """
+        self.workers: int = workers
+        self.settings: Dict[str, Any] = dict(settings)
+        # Forking a process with threads running, such as the GUI's and the server connection's, can deadlock
+        # the child, so workers start from a fresh interpreter
+        context: Any = multiprocessing.get_context("spawn")
+        self._shared_alpha: Any = context.Value("q", 0)
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self._shared_alpha, self.settings),
+        )
+
+    def search(
+        self,
+        game: Game,
+        moves: List[Tuple[int, int]],
+        depth: int,
+        alpha: int,
+        time_limit: Optional[float],
+    ) -> List[Tuple[Optional[int], int, int]]:
+        """
+        Score root moves across the worker processes.
+
+        :param game: the game to search. It is not changed
+        :param moves: the root moves to score, most promising first
+        :param depth: the number of moves to look ahead, including the root move
+        :param alpha: a score the player to move is already guaranteed
+        :param time_limit: seconds before giving up, or None to always finish
+        :return: for each move in order, its score (None if it ran out of time), the alpha it was searched with
+                 and the number of positions visited. A score no greater than its alpha is only an upper bound
+        """
+        self._shared_alpha.value = alpha
+        position: Position = game.get_position()
+        # Processes do not share a perf_counter clock, so the deadline goes by wall time
+        deadline: Optional[float] = (
+            None if time_limit is None else time.time() + time_limit
+        )
+        futures: List[Future] = [
+            self._executor.submit(
+                _search_move, position, type(game.rules), posn, depth, deadline
+            )
+            for posn in moves
+        ]
+        return [future.result() for future in futures]
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes.
+        """
+        self._executor.shutdown()
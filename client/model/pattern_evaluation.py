@@ -0,0 +1,388 @@
+import argparse
+import os
+import random
+import struct
+import sys
+from array import array
+from functools import lru_cache
+from itertools import chain, product
+from operator import itemgetter
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from client.model.game import Game
+from client.model.symmetry import get_symmetries
+
+# File layout: a header, then one little-endian int16 weight per pattern configuration, phase by phase
+_HEADER: struct.Struct = struct.Struct("<4sBBBB")
+_MAGIC: bytes = b"RVPT"
+_VERSION: int = 1
+_DEFAULT_PATH: str = os.path.join(
+    os.path.dirname(__file__), "data", "patterns_{size}.bin"
+)
+# Game stages with their own tables, split evenly by the number of disks on the board
+NUM_PHASES: int = 4
+# Table weights are stored in 1/SCALE disks so they fit in 16 bits
+SCALE: int = 64
+# Longest line of cells a pattern covers, so tables stay small on large boards
+_MAX_LINE: int = 8
+
+
+@lru_cache(maxsize=None)
+def get_pattern_shapes(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Get the cells of each kind of pattern, anchored at the corner (0, 0): the 3x3 corner region, the edge, the
+    row next to the edge and the diagonal.
+
+    :param size: the length of one side of the board
+    :return: for each kind of pattern, its cell indexes (x * size + y)
+    """
+    line: int = min(size, _MAX_LINE)
+    return (
+        tuple(x * size + y for x in range(3) for y in range(3)),
+        tuple(y for y in range(line)),
+        tuple(size + y for y in range(line)),
+        tuple(i * size + i for i in range(line)),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_patterns(size: int) -> Tuple[Tuple[int, Tuple[int, ...]], ...]:
+    """
+    Get every place on the board a pattern is scored, by turning each pattern shape with the 8 symmetries of
+    the board. A place covering the same cells as another is only scored once.
+
+    :param size: the length of one side of the board
+    :return: (index of the pattern shape, cell indexes in the order of the base-3 digits) pairs
+    """
+    patterns: List[Tuple[int, Tuple[int, ...]]] = []
+    seen: set = set()
+    for shape_index, shape in enumerate(get_pattern_shapes(size)):
+        for permutation in get_symmetries(size):
+            cells: Tuple[int, ...] = tuple(permutation[cell] for cell in shape)
+            if frozenset(cells) not in seen:
+                seen.add(frozenset(cells))
+                patterns.append((shape_index, cells))
+    return tuple(patterns)
+
+
+def get_table_sizes(size: int) -> Tuple[int, ...]:
+    """
+    :param size: the length of one side of the board
+    :return: number of configurations of each pattern shape, one weight each per phase
+    """
+    return tuple(3 ** len(shape) for shape in get_pattern_shapes(size))
+
+
+def get_phase(own: int, opp: int, size: int) -> int:
+    """
+    :param own: disk mask of one player
+    :param opp: disk mask of the other player
+    :param size: the length of one side of the board
+    :return: the game stage of the position, from 0 to NUM_PHASES - 1
+    """
+    num_disks: int = bin(own | opp).count("1")
+    return min(NUM_PHASES - 1, max(0, num_disks - 4) * NUM_PHASES // (size * size - 4))
+
+
+# Base-3 number with a 1 digit for each set bit of a byte
+_BYTE_CODES: Tuple[int, ...] = tuple(
+    sum(3**bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+)
+# The 8 base-3 digits of each number below 3 ** 8, lowest first
+_CODE_DIGITS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(code // 3**digit % 3 for digit in range(8)) for code in range(3**8)
+)
+
+
+def _get_digits(own: int, opp: int, size: int) -> Tuple[int, ...]:
+    """
+    :param own: disk mask of the player to score for
+    :param opp: disk mask of the opponent
+    :param size: the length of one side of the board
+    :return: per cell, 0 if empty, 1 for an own disk and 2 for an opponent disk, padded with 0s to a whole
+             number of bytes
+    """
+    num_bytes: int = (size * size + 7) // 8
+    # A byte of cells at a time, since own and opp never share a cell
+    return tuple(
+        chain.from_iterable(
+            [
+                _CODE_DIGITS[_BYTE_CODES[own_byte] + 2 * _BYTE_CODES[opp_byte]]
+                for own_byte, opp_byte in zip(
+                    own.to_bytes(num_bytes, "little"), opp.to_bytes(num_bytes, "little")
+                )
+            ]
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_pattern_getters(size: int) -> Tuple[Tuple[int, Callable], ...]:
+    """
+    :param size: the length of one side of the board
+    :return: per pattern, its shape index and a function picking its cells' digits out of a digit tuple
+    """
+    return tuple(
+        (shape_index, itemgetter(*cells)) for shape_index, cells in get_patterns(size)
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_index_lookup(size: int) -> Dict[Tuple[int, ...], int]:
+    """
+    :param size: the length of one side of the board
+    :return: the base-3 number of every tuple of digits a pattern of the board size can have. A lookup is
+             several times faster than working it out
+    """
+    lookup: Dict[Tuple[int, ...], int] = {}
+    for length in {len(shape) for shape in get_pattern_shapes(size)}:
+        for index, digits in enumerate(product(range(3), repeat=length)):
+            # product counts up from the first digit, so reverse to make it the lowest
+            lookup[digits[::-1]] = index
+    return lookup
+
+
+def get_pattern_indexes(own: int, opp: int, size: int) -> List[int]:
+    """
+    Get the configuration of every pattern on the board as a base-3 number, the first cell of the pattern being
+    the lowest digit.
+
+    :param own: disk mask of the player to score for
+    :param opp: disk mask of the opponent
+    :param size: the length of one side of the board
+    :return: one index per pattern from get_patterns, in the same order
+    """
+    digits: Tuple[int, ...] = _get_digits(own, opp, size)
+    lookup: Dict[Tuple[int, ...], int] = _get_index_lookup(size)
+    return [lookup[getter(digits)] for _, getter in _get_pattern_getters(size)]
+
+
+@lru_cache(maxsize=None)
+def get_default_tables(size: int) -> Optional["PatternTables"]:
+    """
+    Get the pattern tables shipped with the client for a board size, loading them the first time they are
+    needed.
+
+    :param size: the length of one side of the board
+    :return: the tables, or None if there are none for that size
+    """
+    path: str = _DEFAULT_PATH.format(size=size)
+    if not os.path.exists(path):
+        return None
+    return PatternTables.load(path)
+
+
+class PatternTables:
+    def __init__(self, size: int, weights: Sequence[int]) -> None:
+        """
+        Scores positions by looking up the configuration of each edge, corner region and diagonal in tables of
+        weights per game stage.
+
+        :param size: the length of one side of the board
+        :param weights: all weights in 1/SCALE disks, phase by phase and within a phase shape by shape, as
+                        written by write_tables
+        :raises ValueError: when the number of weights does not match the board size
+        """
+        self.size: int = size
+        table_sizes: Tuple[int, ...] = get_table_sizes(size)
+        if len(weights) != NUM_PHASES * sum(table_sizes):
+            raise ValueError(f"Wrong number of pattern weights for size {size}")
+        # Lists index faster than arrays
+        self._tables: List[List[List[int]]] = []
+        offset: int = 0
+        for _ in range(NUM_PHASES):
+            phase_tables: List[List[int]] = []
+            for table_size in table_sizes:
+                phase_tables.append(list(weights[offset : offset + table_size]))
+                offset += table_size
+            self._tables.append(phase_tables)
+
+    @classmethod
+    def load(cls, path: str) -> "PatternTables":
+        """
+        Read pattern tables from a file.
+
+        :param path: the file, as written by write_tables
+        :raises ValueError: when the file is not a pattern table file
+        :return: the tables
+        """
+        with open(path, "rb") as table_file:
+            data: bytes = table_file.read()
+        magic, version, size, num_phases, _ = _HEADER.unpack_from(data, 0)
+        if magic != _MAGIC or version != _VERSION or num_phases != NUM_PHASES:
+            raise ValueError(f"{path} is not a version {_VERSION} pattern table file")
+        weights: array = array("h")
+        weights.frombytes(data[_HEADER.size :])
+        if sys.byteorder == "big":
+            weights.byteswap()
+        return cls(size, weights)
+
+    def evaluate(self, own: int, opp: int) -> int:
+        """
+        Score a position by the weights of its patterns.
+
+        :param own: disk mask of the player to score for
+        :param opp: disk mask of the opponent
+        :return: the expected final disk difference for the player, in 1/SCALE disks
+        """
+        tables: List[List[int]] = self._tables[get_phase(own, opp, self.size)]
+        digits: Tuple[int, ...] = _get_digits(own, opp, self.size)
+        lookup: Dict[Tuple[int, ...], int] = _get_index_lookup(self.size)
+        score: int = 0
+        for shape_index, getter in _get_pattern_getters(self.size):
+            score += tables[shape_index][lookup[getter(digits)]]
+        return score
+
+
+def write_tables(path: str, size: int, weights: Sequence[int]) -> None:
+    """
+    Write a pattern table file.
+
+    :param path: the file to write
+    :param size: the board size the tables are for
+    :param weights: all weights in 1/SCALE disks, phase by phase and within a phase shape by shape
+    """
+    clamped: array = array("h", (max(-32768, min(32767, w)) for w in weights))
+    if sys.byteorder == "big":
+        clamped.byteswap()
+    with open(path, "wb") as table_file:
+        table_file.write(_HEADER.pack(_MAGIC, _VERSION, size, NUM_PHASES, 0))
+        table_file.write(clamped.tobytes())
+
+
+def play_corpus(
+    size: int, num_games: int, difficulty: int, random_moves: int, seed: int
+) -> List[Tuple[List[Tuple[int, int]], int]]:
+    """
+    Play games of the AI against itself to fit pattern weights to. The first moves of each game are random so
+    the games differ. The AI scores positions with the current default tables if there are any, so fitting to
+    its games again gives better tables each time.
+
+    :param size: the length of one side of the board
+    :param num_games: number of games to play
+    :param difficulty: AI difficulty to play at
+    :param random_moves: number of random moves at the start of each game
+    :param seed: seed of the random moves
+    :return: per game, the (player 1 disk mask, player 2 disk mask) of every position played through, and the
+             final disk count of player 1 minus player 2
+    """
+    # Imported here since the AI module imports this one
+    from client.model.ai import AI
+    from client.model.standard_rule import StandardRule
+
+    rng: random.Random = random.Random(seed)
+    ai: AI = AI()
+    ai.difficulty = difficulty
+    ai.use_opening_book = False
+    ai.ponder = False
+    corpus: List[Tuple[List[Tuple[int, int]], int]] = []
+    for _ in range(num_games):
+        game: Game = Game(size, StandardRule())
+        positions: List[Tuple[int, int]] = []
+        while not game.is_game_over():
+            positions.append((game.board.get_discs(1), game.board.get_discs(2)))
+            if len(positions) <= random_moves:
+                game.place_tile(rng.choice(sorted(game.get_valid_move_flips())))
+            else:
+                ai.place_tile(game)
+        player1_score, player2_score = game.get_score()
+        corpus.append((positions, player1_score - player2_score))
+    return corpus
+
+
+def fit_tables(
+    size: int,
+    corpus: List[Tuple[List[Tuple[int, int]], int]],
+    epochs: int = 100,
+    regularization: float = 2.0,
+) -> List[int]:
+    """
+    Fit pattern weights so each position's score predicts the final disk difference of its game. Every
+    position is used from both players' points of view.
+
+    :param size: the length of one side of the board
+    :param corpus: games from play_corpus
+    :param epochs: number of passes of gradient descent
+    :param regularization: how strongly weights seen in few positions are pulled to 0
+    :return: the weights in 1/SCALE disks, in the order write_tables takes them
+    """
+    table_sizes: Tuple[int, ...] = get_table_sizes(size)
+    phase_size: int = sum(table_sizes)
+    shape_offsets: List[int] = [sum(table_sizes[:i]) for i in range(len(table_sizes))]
+    features: List[List[int]] = []
+    targets: List[int] = []
+    for positions, disk_difference in corpus:
+        for player1_discs, player2_discs in positions:
+            for own, opp, target in (
+                (player1_discs, player2_discs, disk_difference),
+                (player2_discs, player1_discs, -disk_difference),
+            ):
+                phase_offset: int = get_phase(own, opp, size) * phase_size
+                indexes: List[int] = get_pattern_indexes(own, opp, size)
+                features.append(
+                    [
+                        phase_offset + shape_offsets[shape_index] + index
+                        for (shape_index, _), index in zip(get_patterns(size), indexes)
+                    ]
+                )
+                targets.append(target)
+    feature_array: np.ndarray = np.array(features, dtype=np.int64)
+    target_array: np.ndarray = np.array(targets, dtype=np.float64)
+    num_weights: int = NUM_PHASES * phase_size
+    # Each weight moves by the average error of the positions it appears in, so rare configurations learn as
+    # fast as common ones
+    counts: np.ndarray = np.bincount(feature_array.ravel(), minlength=num_weights)
+    step: np.ndarray = 1.0 / (counts + regularization) / feature_array.shape[1]
+    weights: np.ndarray = np.zeros(num_weights, dtype=np.float64)
+    for _ in range(epochs):
+        errors: np.ndarray = target_array - weights[feature_array].sum(axis=1)
+        gradient: np.ndarray = np.bincount(
+            feature_array.ravel(),
+            weights=np.repeat(errors, feature_array.shape[1]),
+            minlength=num_weights,
+        )
+        weights += gradient * step
+    return [int(round(weight * SCALE)) for weight in weights]
+
+
+def main() -> None:
+    """
+    Fit pattern tables to self-play games from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Fit Reversi pattern evaluation tables to self-play games"
+    )
+    parser.add_argument("--size", type=int, default=8, help="board size")
+    parser.add_argument(
+        "--games", type=int, default=2000, help="number of self-play games"
+    )
+    parser.add_argument(
+        "--difficulty", type=int, default=1, help="AI difficulty to play at"
+    )
+    parser.add_argument(
+        "--random-moves",
+        type=int,
+        default=10,
+        help="number of random moves at the start of each game",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random moves")
+    parser.add_argument(
+        "--epochs", type=int, default=100, help="passes of gradient descent"
+    )
+    parser.add_argument(
+        "--output", help="file to write, defaults to the tables the client loads"
+    )
+    args = parser.parse_args()
+    path: str = args.output or _DEFAULT_PATH.format(size=args.size)
+    corpus: List[Tuple[List[Tuple[int, int]], int]] = play_corpus(
+        args.size, args.games, args.difficulty, args.random_moves, args.seed
+    )
+    weights: List[int] = fit_tables(args.size, corpus, args.epochs)
+    write_tables(path, args.size, weights)
+    print(f"Fit {len(weights)} weights to {len(corpus)} games, wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
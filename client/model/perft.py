@@ -0,0 +1,173 @@
+import argparse
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from client.model.game import Game, Position
+from client.model.standard_rule import StandardRule
+
+# Board sizes the client lets players choose
+SIZES: Tuple[int, ...] = tuple(range(4, 21, 2))
+# Leaf counts from the start position by board size, for depths 1, 2, ... The 8x8 counts are the published
+# Othello perft values; the others were checked against a separate move generator. The edges of boards larger
+# than 8x8 are out of reach within 6 moves, so they share the 8x8 counts that far
+START_COUNTS: Dict[int, Tuple[int, ...]] = {
+    4: (4, 12, 44, 128, 436, 1296),
+    6: (4, 12, 56, 244, 1364, 7604),
+    8: (4, 12, 56, 244, 1396, 8200, 55092, 390216),
+    10: (4, 12, 56, 244, 1396, 8200),
+    12: (4, 12, 56, 244, 1396, 8200),
+    14: (4, 12, 56, 244, 1396, 8200),
+    16: (4, 12, 56, 244, 1396, 8200),
+    18: (4, 12, 56, 244, 1396, 8200),
+    20: (4, 12, 56, 244, 1396, 8200),
+}
+# Depth the fixed positions from get_fixed_positions are counted to
+FIXED_DEPTH: int = 3
+# Leaf counts of the fixed positions by board size, at FIXED_DEPTH
+FIXED_COUNTS: Dict[int, Tuple[int, ...]] = {
+    4: (40, 22, 2),
+    6: (215, 352, 391),
+    8: (152, 456, 1406),
+    10: (368, 531, 3341),
+    12: (363, 787, 3410),
+    14: (187, 1067, 4277),
+    16: (398, 1559, 6037),
+    18: (690, 1609, 6738),
+    20: (1404, 2614, 9018),
+}
+
+
+@dataclass
+class PerftResult:
+    # Number of leaf positions
+    nodes: int
+    # Time taken to count them
+    seconds: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        :return: leaf positions counted per second
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else float("inf")
+
+
+def perft(game: Game, depth: int) -> int:
+    """
+    Count the positions reached by playing every sequence of valid moves, using the same Game.get_valid_moves
+    and Game.place_tile calls as the user interface. A player with no valid move passes as part of the
+    opponent's move, so passing is not counted as a move. A finished game counts as one position however deep
+    it was reached.
+
+    :param game: the game to count from. It is returned to the same position
+    :param depth: number of moves to play
+    :return: the number of positions at the given depth
+    """
+    if depth == 0 or game.is_game_over():
+        return 1
+    nodes: int = 0
+    for x, row in enumerate(game.get_valid_moves()):
+        for y, valid in enumerate(row):
+            if valid:
+                game.place_tile((x, y))
+                nodes += perft(game, depth - 1)
+                game.unmake_move(game.get_move_history()[-1])
+    return nodes
+
+
+def divide(game: Game, depth: int) -> Dict[Tuple[int, int], int]:
+    """
+    Count positions separately after each valid move, to find which move a wrong count comes from.
+
+    :param game: the game to count from. It is returned to the same position
+    :param depth: number of moves to play, including the first one. Must be at least 1
+    :return: the number of positions after each valid move
+    """
+    counts: Dict[Tuple[int, int], int] = {}
+    for posn in sorted(game.get_valid_move_flips()):
+        game.place_tile(posn)
+        counts[posn] = perft(game, depth - 1)
+        game.unmake_move(game.get_move_history()[-1])
+    return counts
+
+
+def run_perft(game: Game, depth: int) -> PerftResult:
+    """
+    Time a perft count.
+
+    :param game: the game to count from. It is returned to the same position
+    :param depth: number of moves to play
+    :return: the count and how long it took
+    """
+    start_time: float = time.perf_counter()
+    nodes: int = perft(game, depth)
+    return PerftResult(nodes, time.perf_counter() - start_time)
+
+
+def get_fixed_positions(size: int) -> List[Position]:
+    """
+    Get midgame positions to count from besides the start position, made by playing seeded random moves so
+    they are the same every run.
+
+    :param size: the length of one side of the board
+    :return: encoded positions, as from Game.get_position
+    """
+    positions: List[Position] = []
+    for num_moves in (size // 2, size, size * 2):
+        rng: random.Random = random.Random(size * 100 + num_moves)
+        game: Game = Game(size, StandardRule())
+        game.play_random_moves(rng, num_moves=num_moves)
+        positions.append(game.get_position())
+    return positions
+
+
+def main() -> None:
+    """
+    Check perft counts against the known values and report the speed of move generation from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Count Reversi move sequences to check and time move generation"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(SIZES), help="board sizes"
+    )
+    parser.add_argument(
+        "--depth", type=int, default=5, help="number of moves from the start position"
+    )
+    args = parser.parse_args()
+    failed: bool = False
+    for size in args.sizes:
+        known: Tuple[int, ...] = START_COUNTS.get(size, ())
+        result: PerftResult = run_perft(Game(size, StandardRule()), args.depth)
+        expected: str = "unknown"
+        if args.depth <= len(known):
+            expected = "ok" if known[args.depth - 1] == result.nodes else "WRONG"
+            failed = failed or known[args.depth - 1] != result.nodes
+        print(
+            f"{size}x{size} start depth {args.depth}: {result.nodes} nodes ({expected}), "
+            f"{result.nodes_per_second:.0f} nodes/s"
+        )
+        fixed_nodes: List[int] = []
+        fixed_seconds: float = 0
+        for position in get_fixed_positions(size):
+            result = run_perft(
+                Game.from_position(position, StandardRule()), FIXED_DEPTH
+            )
+            fixed_nodes.append(result.nodes)
+            fixed_seconds += result.seconds
+        expected = "unknown"
+        if size in FIXED_COUNTS:
+            expected = "ok" if FIXED_COUNTS[size] == tuple(fixed_nodes) else "WRONG"
+            failed = failed or FIXED_COUNTS[size] != tuple(fixed_nodes)
+        print(
+            f"{size}x{size} fixed depth {FIXED_DEPTH}: {fixed_nodes} nodes ({expected}), "
+            f"{sum(fixed_nodes) / fixed_seconds:.0f} nodes/s"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
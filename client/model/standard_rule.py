@@ -1,9 +1,15 @@
-from typing import Tuple, List
+from typing import Dict, Tuple, List
 
 from client.model.abstract_rule import AbstractRule
+from client.model.bit_board import BitBoard
 from client.model.board import Board
 from client.model.cell import CellState
 
+# Offsets used to step from a cell to each of its 8 neighbours
+_DIRECTIONS: Tuple[Tuple[int, int], ...] = tuple(
+    (x, y) for x in [-1, 0, 1] for y in [-1, 0, 1] if (x, y) != (0, 0)
+)
+
 
 class StandardRule(AbstractRule):
     def __init__(self) -> None:
@@ -19,6 +25,10 @@ class StandardRule(AbstractRule):
         :param brd: current board state
         :return: Whether a move was valid, True, or not, False
         """
+        # Bit boards can answer directly with shift-and-mask move generation
+        if isinstance(brd, BitBoard):
+            return brd.is_legal_move(plyr_num, posn[0], posn[1])
+
         # Verify the current cell is unoccupied
         brd_state: List[List[CellState]] = brd.get_state()
         if not brd_state[posn[0]][posn[1]] == CellState.empty:
@@ -50,5 +60,57 @@ class StandardRule(AbstractRule):
                 y += d[1]
         return False
 
+    @staticmethod
+    def get_valid_moves(
+        plyr_num: int, brd: Board
+    ) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
+        """
+        Finds every valid move for a player in a single sweep of the empty cells, along with the disks each move flips
+
+        :param plyr_num: the player number of the player whose moves are being generated
+        :param brd: current board state
+        :return: Dictionary from each valid move to the positions of the disks that move flips
+        """
+        valid_moves: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        if isinstance(brd, BitBoard):
+            for x, y in brd.mask_to_posns(brd.get_move_mask(plyr_num)):
+                valid_moves[(x, y)] = brd.mask_to_posns(
+                    brd.get_flip_mask(plyr_num, x, y)
+                )
+            return valid_moves
+
+        brd_state: List[List[CellState]] = brd.get_state()
+        own: CellState = CellState.player1 if plyr_num == 1 else CellState.player2
+        opp: CellState = CellState.player2 if plyr_num == 1 else CellState.player1
+        for x, y in brd.get_empty_posns():
+            flips: List[Tuple[int, int]] = []
+            for d in _DIRECTIONS:
+                # Walk over opponent disks. They are flipped if a same player disk is reached before the edge of
+                # the board or an empty cell
+                line: List[Tuple[int, int]] = []
+                i, j = x + d[0], y + d[1]
+                while brd.is_valid_posn(i, j) and brd_state[i][j] == opp:
+                    line.append((i, j))
+                    i += d[0]
+                    j += d[1]
+                if line and brd.is_valid_posn(i, j) and brd_state[i][j] == own:
+                    flips.extend(line)
+            if flips:
+                valid_moves[(x, y)] = flips
+        return valid_moves
+
+    @classmethod
+    def has_valid_move(cls, plyr_num: int, brd: Board) -> bool:
+        """
+        Determines if a player has any valid move
+
+        :param plyr_num: the player number of the player being checked
+        :param brd: current board state
+        :return: Whether the player has a valid move, True, or not, False
+        """
+        if isinstance(brd, BitBoard):
+            return brd.get_move_mask(plyr_num) != 0
+        return super().has_valid_move(plyr_num, brd)
+
     def __str__(self) -> str:
         return "StandardRule"
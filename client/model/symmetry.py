@@ -0,0 +1,206 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+from client.model.zobrist import ZobristKeys, get_zobrist_keys
+
+# Number of ways to turn or reflect a square board onto itself
+NUM_SYMMETRIES: int = 8
+
+
+@lru_cache(maxsize=None)
+def get_symmetries(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Get the 8 symmetries of a square board (rotations and reflections) as cell index permutations.
+
+    :param size: the length of one side of the board
+    :return: for each symmetry, the index each cell index is moved to. The first symmetry is the identity
+    """
+    edge: int = size - 1
+    transforms = (
+        lambda x, y: (x, y),
+        lambda x, y: (y, edge - x),
+        lambda x, y: (edge - x, edge - y),
+        lambda x, y: (edge - y, x),
+        lambda x, y: (x, edge - y),
+        lambda x, y: (edge - x, y),
+        lambda x, y: (y, x),
+        lambda x, y: (edge - y, edge - x),
+    )
+    symmetries: List[Tuple[int, ...]] = []
+    for transform in transforms:
+        permutation: List[int] = []
+        for x in range(size):
+            for y in range(size):
+                new_x, new_y = transform(x, y)
+                permutation.append(new_x * size + new_y)
+        symmetries.append(tuple(permutation))
+    return tuple(symmetries)
+
+
+@lru_cache(maxsize=None)
+def _get_inverse_symmetries(size: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    :param size: the length of one side of the board
+    :return: for each symmetry, the index each cell index is moved back from
+    """
+    inverses: List[Tuple[int, ...]] = []
+    for permutation in get_symmetries(size):
+        inverse: List[int] = [0] * (size * size)
+        for index, new_index in enumerate(permutation):
+            inverse[new_index] = index
+        inverses.append(tuple(inverse))
+    return tuple(inverses)
+
+
+def transform_cell(index: int, symmetry: int, size: int) -> int:
+    """
+    :param index: a cell index (x * size + y)
+    :param symmetry: a symmetry from get_symmetries
+    :param size: the length of one side of the board
+    :return: the index the symmetry moves the cell to
+    """
+    return get_symmetries(size)[symmetry][index]
+
+
+def untransform_cell(index: int, symmetry: int, size: int) -> int:
+    """
+    :param index: a cell index (x * size + y) in the transformed board
+    :param symmetry: a symmetry from get_symmetries
+    :param size: the length of one side of the board
+    :return: the index of the cell the symmetry moved there
+    """
+    return _get_inverse_symmetries(size)[symmetry][index]
+
+
+@lru_cache(maxsize=None)
+def _get_byte_tables(size: int) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """
+    :param size: the length of one side of the board
+    :return: per symmetry and per byte of a disk mask, the transformed mask of every value of that byte
+    """
+    num_cells: int = size * size
+    num_bytes: int = (num_cells + 7) // 8
+    tables: List[Tuple[Tuple[int, ...], ...]] = []
+    for permutation in get_symmetries(size):
+        byte_tables: List[Tuple[int, ...]] = []
+        for byte_index in range(num_bytes):
+            table: List[int] = []
+            for byte in range(256):
+                transformed: int = 0
+                for bit in range(8):
+                    index: int = byte_index * 8 + bit
+                    if byte >> bit & 1 and index < num_cells:
+                        transformed |= 1 << permutation[index]
+                table.append(transformed)
+            byte_tables.append(tuple(table))
+        tables.append(tuple(byte_tables))
+    return tuple(tables)
+
+
+def _flip_vertical_8(mask: int) -> int:
+    """
+    :param mask: an 8x8 disk mask
+    :return: the mask with x turned into 7 - x, which reverses the order of its bytes
+    """
+    return int.from_bytes(mask.to_bytes(8, "little"), "big")
+
+
+def _mirror_horizontal_8(mask: int) -> int:
+    """
+    :param mask: an 8x8 disk mask
+    :return: the mask with y turned into 7 - y, which reverses the bits of each byte
+    """
+    mask = ((mask >> 1) & 0x5555555555555555) | ((mask & 0x5555555555555555) << 1)
+    mask = ((mask >> 2) & 0x3333333333333333) | ((mask & 0x3333333333333333) << 2)
+    return ((mask >> 4) & 0x0F0F0F0F0F0F0F0F) | ((mask & 0x0F0F0F0F0F0F0F0F) << 4)
+
+
+def _transpose_8(mask: int) -> int:
+    """
+    :param mask: an 8x8 disk mask
+    :return: the mask with x and y swapped
+    """
+    swap: int = (mask ^ (mask >> 7)) & 0x00AA00AA00AA00AA
+    mask ^= swap ^ (swap << 7)
+    swap = (mask ^ (mask >> 14)) & 0x0000CCCC0000CCCC
+    mask ^= swap ^ (swap << 14)
+    swap = (mask ^ (mask >> 28)) & 0x00000000F0F0F0F0
+    return mask ^ swap ^ (swap << 28)
+
+
+def transform_mask(mask: int, symmetry: int, size: int) -> int:
+    """
+    Move every disk of a mask by a symmetry.
+
+    :param mask: a disk mask, with bit x * size + y set for a disk at x,y
+    :param symmetry: a symmetry from get_symmetries
+    :param size: the length of one side of the board
+    :return: the transformed mask
+    """
+    if size == 8:
+        # Standard boards are turned with a few whole-mask bit operations
+        if symmetry >= 6:
+            mask = _transpose_8(mask)
+            symmetry = (0, 2)[symmetry - 6]
+        elif symmetry in (1, 3):
+            mask = _transpose_8(mask)
+            symmetry = (4, 5)[symmetry == 3]
+        if symmetry in (2, 4):
+            mask = _mirror_horizontal_8(mask)
+        if symmetry in (2, 5):
+            mask = _flip_vertical_8(mask)
+        return mask
+    transformed: int = 0
+    for byte_table, byte in zip(
+        _get_byte_tables(size)[symmetry],
+        mask.to_bytes((size * size + 7) // 8, "little"),
+    ):
+        transformed |= byte_table[byte]
+    return transformed
+
+
+def get_canonical_form(player1: int, player2: int, size: int) -> Tuple[int, int, int]:
+    """
+    Get the form of a position that all 8 of its symmetric versions share: the one whose (player 1, player 2)
+    disk masks are the smallest.
+
+    :param player1: disk mask of player 1
+    :param player2: disk mask of player 2
+    :param size: the length of one side of the board
+    :return: the player 1 and player 2 disk masks of the canonical form, and the symmetry that turns the
+             position into it
+    """
+    best: Tuple[int, int] = (player1, player2)
+    best_symmetry: int = 0
+    for symmetry in range(1, NUM_SYMMETRIES):
+        transformed: Tuple[int, int] = (
+            transform_mask(player1, symmetry, size),
+            transform_mask(player2, symmetry, size),
+        )
+        if transformed < best:
+            best = transformed
+            best_symmetry = symmetry
+    return best[0], best[1], best_symmetry
+
+
+def get_canonical_hash(
+    player1: int, player2: int, player2_to_move: bool, size: int
+) -> Tuple[int, int]:
+    """
+    Get a Zobrist hash of a position that is the same for all 8 symmetric versions of it.
+
+    :param player1: disk mask of player 1
+    :param player2: disk mask of player 2
+    :param player2_to_move: whether player 2 moves next
+    :param size: the length of one side of the board
+    :return: the hash, and the symmetry that turns the position into its canonical form
+    """
+    canonical1, canonical2, symmetry = get_canonical_form(player1, player2, size)
+    keys: ZobristKeys = get_zobrist_keys(size)
+    key: int = keys.player2_to_move if player2_to_move else 0
+    for player, mask in ((1, canonical1), (2, canonical2)):
+        while mask:
+            low_bit: int = mask & -mask
+            key ^= keys.disk_keys[player][low_bit.bit_length() - 1]
+            mask ^= low_bit
+    return key, symmetry
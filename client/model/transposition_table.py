@@ -0,0 +1,113 @@
+from enum import Enum
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class Bound(Enum):
+    exact = 0
+    lower = 1
+    upper = 2
+
+
+class TranspositionEntry(NamedTuple):
+    key: int
+    depth: int
+    bound: Bound
+    score: int
+    best_move: Optional[Tuple[int, int]]
+    generation: int
+
+
+class TranspositionTable:
+    # Rough size of one stored entry plus its slot, used to turn the memory cap into a slot count
+    _ENTRY_BYTES: int = 200
+    DEFAULT_MAX_BYTES: int = 16 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        Fixed-size table of search results keyed by Zobrist hash. Each hash maps to one slot, so the table
+        never grows past its memory cap.
+
+        Replacement policy: a slot left over from an earlier search is always overwritten. Within one search, a slot
+        is only overwritten by a result searched at least as deep, so deep results survive shallow ones.
+
+        :param max_bytes: approximate memory cap for the table
+        """
+        self.max_bytes: int = max_bytes
+        self._num_slots: int = max(1, max_bytes // self._ENTRY_BYTES)
+        self._slots: List[Optional[TranspositionEntry]] = [None] * self._num_slots
+        self._generation: int = 0
+        self.hits: int = 0
+        self.probes: int = 0
+
+    def __len__(self) -> int:
+        """
+        :return: number of slots in use
+        """
+        return sum(1 for entry in self._slots if entry is not None)
+
+    def get_num_slots(self) -> int:
+        """
+        Get the number of entries the table can hold.
+
+        :return: slot count
+        """
+        return self._num_slots
+
+    def new_search(self) -> None:
+        """
+        Mark the start of a new search so entries from earlier searches are replaced first.
+        """
+        self._generation += 1
+
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+        self._slots = [None] * self._num_slots
+        self.hits = 0
+        self.probes = 0
+
+    def probe(self, key: int) -> Optional[TranspositionEntry]:
+        """
+        Look up a position.
+
+        :param key: Zobrist hash of the position
+        :return: the stored entry, or None if the position is not in the table
+        """
+        self.probes += 1
+        entry: Optional[TranspositionEntry] = self._slots[key % self._num_slots]
+        if entry is None or entry.key != key:
+            return None
+        self.hits += 1
+        return entry
+
+    def store(
+        self,
+        key: int,
+        depth: int,
+        bound: Bound,
+        score: int,
+        best_move: Optional[Tuple[int, int]],
+    ) -> None:
+        """
+        Store a search result, subject to the replacement policy.
+
+        :param key: Zobrist hash of the position
+        :param depth: number of moves the position was searched ahead
+        :param bound: whether score is exact, a lower bound or an upper bound
+        :param score: score of the position for the player to move
+        :param best_move: best move found, or None if there was none
+        """
+        index: int = key % self._num_slots
+        entry: Optional[TranspositionEntry] = self._slots[index]
+        if (
+            entry is None
+            or entry.generation != self._generation
+            or depth >= entry.depth
+        ):
+            if best_move is None and entry is not None and entry.key == key:
+                # Keep the old best move for ordering if this search did not find one
+                best_move = entry.best_move
+            self._slots[index] = TranspositionEntry(
+                key, depth, bound, score, best_move, self._generation
+            )
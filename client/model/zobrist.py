@@ -0,0 +1,32 @@
+import random
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+
+class ZobristKeys(NamedTuple):
+    # Random key for each player's disk on each cell, indexed [player][x * size + y]. Player 0 keys are all 0
+    disk_keys: Tuple[Tuple[int, ...], ...]
+    # disk_keys[1][i] ^ disk_keys[2][i], for flipping the disk on cell i
+    flip_keys: Tuple[int, ...]
+    # Mixed into a game's hash when player 2 is the next to play
+    player2_to_move: int
+
+
+@lru_cache(maxsize=None)
+def get_zobrist_keys(size: int) -> ZobristKeys:
+    """
+    Get the Zobrist keys for boards of the given size. The keys are seeded by the size, so every process
+    computes the same hash for the same position.
+
+    :param size: the length of one side of the board
+    :return: the keys for that board size
+    """
+    rng: random.Random = random.Random(size)
+    num_cells: int = size * size
+    player1_keys: Tuple[int, ...] = tuple(rng.getrandbits(64) for _ in range(num_cells))
+    player2_keys: Tuple[int, ...] = tuple(rng.getrandbits(64) for _ in range(num_cells))
+    return ZobristKeys(
+        disk_keys=((0,) * num_cells, player1_keys, player2_keys),
+        flip_keys=tuple(k1 ^ k2 for k1, k2 in zip(player1_keys, player2_keys)),
+        player2_to_move=rng.getrandbits(64),
+    )
@@ -0,0 +1,377 @@
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import re
+import string
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from client.model.ai import AI
+from client.model.game import Game
+from client.model.game_manager import GameManager
+from client.model.mcts_ai import MCTSAI
+from client.model.standard_rule import StandardRule
+
+_MOVE_PATTERN: "re.Pattern[str]" = re.compile(r"([a-z])(\d+)")
+
+
+@dataclass
+class EngineConfig:
+    # Name of the engine in GameManager.AI_ENGINES
+    engine: str
+    # AI difficulty. Alpha-beta searches difficulty + 1 moves ahead
+    difficulty: int = 0
+    # Time budget for each move in seconds, or None to search to the full difficulty
+    time_limit: Optional[float] = None
+    # Playout budget for each move of the Monte Carlo engine, or None for its default
+    playouts: Optional[int] = None
+    use_opening_book: bool = True
+
+    def __str__(self) -> str:
+        return f"{self.engine}:{self.difficulty}"
+
+    def create_ai(self) -> AI:
+        """
+        Create a fresh AI with these settings. AIs in self-play do not ponder, since both players share a process.
+
+        :raises KeyError: when there is no engine with the configured name
+        :return: the AI
+        """
+        ai: AI = GameManager.AI_ENGINES[self.engine]()
+        ai.difficulty = self.difficulty
+        ai.time_limit = self.time_limit
+        ai.use_opening_book = self.use_opening_book
+        ai.ponder = False
+        if isinstance(ai, MCTSAI):
+            ai.playouts = self.playouts
+        return ai
+
+
+@dataclass
+class GameRecord:
+    # Position of the game in the tournament
+    index: int
+    size: int
+    # Index of the engine that played as player 1, and as player 2
+    engines: Tuple[int, int]
+    moves: List[Tuple[int, int]] = field(default_factory=list)
+    # Final disk counts of player 1 and player 2
+    score: Tuple[int, int] = (0, 0)
+    # Per player, the number of moves chosen by its AI rather than at random, the seconds spent choosing them
+    # and the positions the searches visited
+    ai_moves: Tuple[int, int] = (0, 0)
+    seconds: Tuple[float, float] = (0.0, 0.0)
+    nodes: Tuple[int, int] = (0, 0)
+
+    @property
+    def winner(self) -> int:
+        """
+        :return: the player who won, or 0 for a draw
+        """
+        if self.score[0] == self.score[1]:
+            return 0
+        return 1 if self.score[0] > self.score[1] else 2
+
+    def to_json(self) -> str:
+        """
+        Encode the record on one line. Moves are written in the usual Reversi notation, a column letter then a
+        row number, with no separators since each move starts with a letter.
+
+        :return: JSON text
+        """
+        return json.dumps(
+            {
+                "game": self.index,
+                "size": self.size,
+                "engines": self.engines,
+                "moves": "".join(
+                    f"{string.ascii_lowercase[y]}{x + 1}" for x, y in self.moves
+                ),
+                "score": self.score,
+                "ai_moves": self.ai_moves,
+                "seconds": [round(seconds, 4) for seconds in self.seconds],
+                "nodes": self.nodes,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> "GameRecord":
+        """
+        Decode a record written by to_json.
+
+        :param text: JSON text
+        :return: the record
+        """
+        data = json.loads(text)
+        return cls(
+            index=data["game"],
+            size=data["size"],
+            engines=tuple(data["engines"]),
+            moves=[
+                (int(row) - 1, string.ascii_lowercase.index(column))
+                for column, row in _MOVE_PATTERN.findall(data["moves"])
+            ],
+            score=tuple(data["score"]),
+            ai_moves=tuple(data["ai_moves"]),
+            seconds=tuple(data["seconds"]),
+            nodes=tuple(data["nodes"]),
+        )
+
+
+@dataclass
+class EngineStats:
+    wins: int = 0
+    losses: int = 0
+    draws: int = 0
+    # Moves chosen by the engine, the seconds spent choosing them and the positions its searches visited
+    moves: int = 0
+    seconds: float = 0.0
+    nodes: int = 0
+
+    @property
+    def games(self) -> int:
+        """
+        :return: number of games played
+        """
+        return self.wins + self.losses + self.draws
+
+    @property
+    def win_rate(self) -> float:
+        """
+        :return: share of the games won, counting draws as half a win
+        """
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+    @property
+    def average_move_time(self) -> float:
+        """
+        :return: average seconds spent choosing a move
+        """
+        return self.seconds / self.moves if self.moves else 0.0
+
+    @property
+    def nodes_per_second(self) -> float:
+        """
+        :return: positions visited per second of searching. For the Monte Carlo engine these are playouts
+        """
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+def play_game(
+    index: int,
+    size: int,
+    engines: Tuple[EngineConfig, EngineConfig],
+    random_moves: int,
+    seed: int,
+) -> GameRecord:
+    """
+    Play one game between two engines. The engines swap sides every game, and each pair of games starts with
+    the same random moves, so neither engine gets the better side of an opening.
+
+    :param index: position of the game in the tournament
+    :param size: the length of one side of the board
+    :param engines: the two engines playing
+    :param random_moves: number of random moves at the start of the game
+    :param seed: seed of the tournament's random moves
+    :return: the record of the game
+    """
+    order: Tuple[int, int] = (0, 1) if index % 2 == 0 else (1, 0)
+    ais: Tuple[AI, AI] = (
+        engines[order[0]].create_ai(),
+        engines[order[1]].create_ai(),
+    )
+    rng: random.Random = random.Random(f"{seed}:{size}:{index // 2}")
+    game: Game = Game(size, StandardRule())
+    record: GameRecord = GameRecord(index, size, order)
+    ai_moves: List[int] = [0, 0]
+    seconds: List[float] = [0.0, 0.0]
+    nodes: List[int] = [0, 0]
+    while not game.is_game_over():
+        player: int = game.get_curr_player() - 1
+        if len(record.moves) < random_moves:
+            move: Tuple[int, int] = rng.choice(sorted(game.get_valid_move_flips()))
+        else:
+            start_time: float = time.perf_counter()
+            move = ais[player].get_move(game)
+            seconds[player] += time.perf_counter() - start_time
+            nodes[player] += ais[player].nodes_searched
+            ai_moves[player] += 1
+        game.place_tile(move)
+        record.moves.append(move)
+    for ai in ais:
+        ai.close()
+    record.score = game.get_score()
+    record.ai_moves = (ai_moves[0], ai_moves[1])
+    record.seconds = (seconds[0], seconds[1])
+    record.nodes = (nodes[0], nodes[1])
+    return record
+
+
+def run_tournament(
+    sizes: List[int],
+    engines: Tuple[EngineConfig, EngineConfig],
+    num_games: int,
+    random_moves: int = 4,
+    seed: int = 0,
+    workers: int = 1,
+) -> Iterator[GameRecord]:
+    """
+    Play games between two engines on each board size, spread across a process pool.
+
+    :param sizes: board sizes to play on
+    :param engines: the two engines playing
+    :param num_games: number of games on each board size
+    :param random_moves: number of random moves at the start of each game
+    :param seed: seed of the random moves
+    :param workers: number of processes to play in. With 1, games are played in this process
+    :return: the game records, in the order the games were set up
+    """
+    games: List[Tuple[int, int]] = [
+        (index, size) for size in sizes for index in range(num_games)
+    ]
+    play: Callable[[Tuple[int, int]], GameRecord] = lambda args: play_game(
+        args[0], args[1], engines, random_moves, seed
+    )
+    if workers == 1:
+        yield from map(play, games)
+        return
+    # Spawned rather than forked, as forking a process with threads running can deadlock the child
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        yield from executor.map(
+            play_game,
+            [index for index, _ in games],
+            [size for _, size in games],
+            [engines] * len(games),
+            [random_moves] * len(games),
+            [seed] * len(games),
+        )
+
+
+def summarize(records: List[GameRecord]) -> Tuple[EngineStats, EngineStats]:
+    """
+    Total up the results of each engine.
+
+    :param records: records of the games played
+    :return: statistics of the first and the second engine
+    """
+    stats: Tuple[EngineStats, EngineStats] = (EngineStats(), EngineStats())
+    for record in records:
+        for player, engine in enumerate(record.engines):
+            engine_stats: EngineStats = stats[engine]
+            if record.winner == 0:
+                engine_stats.draws += 1
+            elif record.winner == player + 1:
+                engine_stats.wins += 1
+            else:
+                engine_stats.losses += 1
+            engine_stats.moves += record.ai_moves[player]
+            engine_stats.seconds += record.seconds[player]
+            engine_stats.nodes += record.nodes[player]
+    return stats
+
+
+def parse_engine(spec: str) -> EngineConfig:
+    """
+    Read an engine from the command line.
+
+    :param spec: engine name and difficulty, such as alpha_beta:3. The difficulty defaults to 0
+    :raises argparse.ArgumentTypeError: when the engine is unknown or the difficulty is not a number
+    :return: the engine
+    """
+    name, _, difficulty = spec.partition(":")
+    if name not in GameManager.AI_ENGINES or not (difficulty or "0").isdigit():
+        raise argparse.ArgumentTypeError(
+            f"expected one of {', '.join(GameManager.AI_ENGINES)} with an optional :difficulty, got {spec}"
+        )
+    return EngineConfig(name, int(difficulty or "0"))
+
+
+def main() -> None:
+    """
+    Run a self-play tournament from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Play Reversi AI engines against each other without the GUI"
+    )
+    parser.add_argument(
+        "engines",
+        type=parse_engine,
+        nargs=2,
+        help="the two engines to play, as name:difficulty, such as alpha_beta:2 mcts:0",
+    )
+    parser.add_argument(
+        "--games", type=int, default=100, help="number of games on each board size"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[8], help="board sizes to play on"
+    )
+    parser.add_argument(
+        "--time-limit", type=float, help="time budget for each move in seconds"
+    )
+    parser.add_argument(
+        "--playouts", type=int, help="playout budget for each Monte Carlo move"
+    )
+    parser.add_argument(
+        "--no-book", action="store_true", help="do not play opening book moves"
+    )
+    parser.add_argument(
+        "--random-moves",
+        type=int,
+        default=4,
+        help="number of random moves at the start of each game",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random moves")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of processes to play in",
+    )
+    parser.add_argument("--output", help="file to write game records to, one per line")
+    args = parser.parse_args()
+    engines: Tuple[EngineConfig, EngineConfig] = args.engines
+    for engine in engines:
+        engine.time_limit = args.time_limit
+        engine.playouts = args.playouts
+        engine.use_opening_book = not args.no_book
+
+    records: List[GameRecord] = []
+    start_time: float = time.perf_counter()
+    output = open(args.output, "w") if args.output else None
+    try:
+        for record in run_tournament(
+            args.sizes,
+            engines,
+            args.games,
+            args.random_moves,
+            args.seed,
+            args.workers,
+        ):
+            records.append(record)
+            if output is not None:
+                output.write(record.to_json() + "\n")
+    finally:
+        if output is not None:
+            output.close()
+    elapsed: float = time.perf_counter() - start_time
+
+    print(
+        f"{len(records)} games on sizes {args.sizes} in {elapsed:.1f}s "
+        f"with {args.workers} workers"
+    )
+    for engine, stats in zip(engines, summarize(records)):
+        print(
+            f"{engine}: {stats.wins}-{stats.losses}-{stats.draws} (win rate {stats.win_rate:.3f}), "
+            f"{stats.average_move_time * 1000:.1f}ms/move, {stats.nodes_per_second:.0f} nodes/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from abc import ABC
+from concurrent.futures import Future, TimeoutError
 from typing import Dict, Any, Optional
 
 from schema import Schema  # type: ignore
@@ -16,27 +17,53 @@ class BaseServerRequest(ABC):
         self._response_message: Dict[str, Any] = {}
         self._response_success: Optional[bool] = None
         self._response_schema: Schema = Schema({})
+        self._response_future: Future = Future()
 
-    def send(self) -> None:
+    def send(self) -> Future:
         """
-        Sends the current message through the client comms manager, registering response callback in the process
+        Sends the current message through the client comms manager, chaining the response callback onto the request
+        :return: Future completed with whether the server successfully responded, once the response has arrived
         """
+        future: Future = Future()
+        self._response_future = future
+        self._response_success = None
         if "protocol_type" in self._send_message:
-            self._response_success = None
-            ClientCommsManager().send(
+            sent: Future = ClientCommsManager().send(
                 message=self._send_message,
                 response_protocol_type=self._response_schema.schema["protocol_type"],
-                callback=self._response_callback,
             )
+            sent.add_done_callback(lambda done: self._response_callback(done, future))
+        else:
+            self._response_success = False
+            future.set_result(False)
+        return future
 
-    def _response_callback(self, success: bool, response: Dict[str, Any]) -> None:
+    def wait_for_response(self, timeout: Optional[float] = None) -> bool:
         """
-        Callback for the server response
-        :param success: Whether server successfully responded. False would indicate a problem accessing the server
-        :param response: Actual response from the server
+        Blocks until the response to the last send arrives, without using the CPU while waiting
+        :param timeout: Seconds to wait for the response, None to wait forever
+        :return: True if the response arrived in time, False otherwise
         """
-        if success is True and self._response_schema.is_valid(response):
-            self._response_message = response
-            self._response_success = True
-        else:
-            self._response_success = False
+        try:
+            self._response_future.result(timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _response_callback(self, sent: Future, future: Future) -> None:
+        """
+        Callback for the server response to one send
+        :param sent: Future from the client comms manager, completed with the response from the server, or with an
+                     error if there was a problem accessing the server
+        :param future: Future returned by the send
+        """
+        response: Dict[str, Any] = {}
+        if not sent.cancelled() and sent.exception() is None:
+            response = sent.result()
+        success: bool = bool(response) and self._response_schema.is_valid(response)
+        # A late response to an earlier send only completes that send's future
+        if future is self._response_future:
+            if success:
+                self._response_message = response
+            self._response_success = success
+        future.set_result(success)
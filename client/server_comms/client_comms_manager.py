@@ -1,9 +1,27 @@
+from _thread import start_new_thread
+from concurrent.futures import Future
+from itertools import count
 from queue import Queue
 from threading import Lock
-from typing import List, Dict, Callable, Any, Optional
-import json
+from typing import List, Dict, Callable, Any, Optional, Iterator
 import socket
 from client.config.config_reader import ConfigReader, ServerInfo
+from common.framing import (
+    FRAMING_VERSION,
+    HELLO_SIZE,
+    LEGACY_VERSION,
+    REQUEST_ID,
+    Framing,
+    LegacyFraming,
+    create_framing,
+    decode_hello,
+    encode_hello,
+)
+
+# Seconds to wait for the server to answer a framing hello before falling back to legacy frames
+HELLO_TIMEOUT: float = 5.0
+# Most bytes to read from the server at once
+RECV_SIZE: int = 65536
 
 
 class ClientCommsManager:
@@ -16,9 +34,16 @@ class ClientCommsManager:
     _singleton = None
     _lock: Lock = Lock()
     _client: socket.socket = socket.socket()
-    _callback_map: Dict[str, List[Callable[[bool, Any], None]]] = {}
+    # Futures of the requests waiting for a response by request ID, and the IDs by response protocol type
+    _pending: Dict[int, Future] = {}
+    _callback_map: Dict[str, List[int]] = {}
+    _pending_lock: Lock = Lock()
+    _request_ids: Iterator[int] = count(1)
     _send_queue: Queue = Queue()
     _connected_to_server: bool = False
+    _framing: Framing = LegacyFraming()
+    # Whether the server did not answer a framing hello, so only legacy frames are sent to it
+    _legacy_server: bool = False
 
     def __new__(cls):
         """
@@ -42,111 +67,210 @@ class ClientCommsManager:
             # Create a new socket (if old failed, we need a new one)
             self._client = socket.socket()
             self._client.connect((address.server_ip, address.server_port))
-            self._connected_to_server = True
+            self._connected_to_server = self.__negotiate_framing()
+            if not self._connected_to_server:
+                self._client.close()
+                return
         except Exception:
             self._connected_to_server = False
+            return
+        start_new_thread(self.__receive, (self._client, self._framing))
+
+    def __negotiate_framing(self) -> bool:
+        """
+        Ask the server for length-prefixed frames. A server that does not answer gets legacy frames from then on.
+
+        :return: False if the connection has to be reopened to send legacy frames
+        """
+        if self._legacy_server:
+            self._framing = LegacyFraming()
+            return True
+        reply: bytes = b""
+        self._client.settimeout(HELLO_TIMEOUT)
+        try:
+            self._client.sendall(encode_hello())
+            while len(reply) < HELLO_SIZE:
+                data: bytes = self._client.recv(HELLO_SIZE - len(reply))
+                if not data:
+                    break
+                reply += data
+        except socket.error:
+            pass
+        finally:
+            self._client.settimeout(None)
+        version: Optional[int] = decode_hello(reply)
+        if version is None or version > FRAMING_VERSION:
+            self._legacy_server = True
+            return False
+        self._framing = create_framing(version)
+        return True
 
     def send(
         self,
         message: Dict[str, Any],
         response_protocol_type: str,
-        callback: Callable[..., None],
-    ) -> None:
+        callback: Optional[Callable[..., None]] = None,
+    ) -> Future:
         """
         Send out the message to the server for communication and the message will be encapsulated before transmission.
-        After message is sent out, it will wait for response and handle it.
+        Any number of messages can wait for a response at once, and responses are handled in whatever order they
+        arrive.
 
         :param message: the message to be sent to the server in dictionary; it should at least have 'protocol_type'
                         specified
         :param response_protocol_type: expected protocol type from the server to identify which callback to use
-        :param callback: the function to call when you receive a message of a certain 'protocol_type'
+        :param callback: the function to call when you receive a message of a certain 'protocol_type', if any
         :raise ValueError: if the passed in message does not contain a 'protocol_type'
+        :return: a future completed with the response, or with a ConnectionError if the message could not be sent
+                 or the connection was lost before the response arrived
         """
         # check if the message have specified protocol type and throw ValueError if not
         if "protocol_type" not in message:
             raise ValueError("Message must have a protocol_type.")
+        future: Future = Future()
+        if callback is not None:
+            future.add_done_callback(
+                lambda done: self.__run_callback(done, response_protocol_type, callback)
+            )
         # Add sending info to the queue
-        self._send_queue.put((message, response_protocol_type, callback))
+        self._send_queue.put(
+            (next(self._request_ids), message, response_protocol_type, future)
+        )
+        return future
 
     def run(self):
         """
-        Call the __send __handle_receive method in a forever loop
-        so that it will keep sending then listening for the message to/from server.
+        Send messages in a forever loop, reconnecting whenever the connection is lost.
+        Responses are read on a thread of their own, so sending never waits for a response.
         """
         self._client.settimeout(None)
         while True:
             if self._connected_to_server:
                 self.__send()
-                self.__handle_receive()
             else:
                 self.__connect_to_server()
 
     def __send(self) -> None:
         """
         Takes any messages dropped off to send and sends them.
-        This is in own function so all socket operations occur in one thread.
+        This is in own function so all socket writes occur in one thread.
         """
         # Get info from queue
-        message, response_protocol_type, callback = self._send_queue.get()
-        # Add a new key to the _callback_map if passed-in response_protocol_type is not a key in the map yet
-        if response_protocol_type not in self._callback_map:
-            self._callback_map[response_protocol_type] = []
-        self._callback_map[response_protocol_type].append(
-            callback
-        )  # append the callback to the _callback_map
-        # Put '$$' to signify end of message and encapsulate the message
-        json_msg: str = json.dumps(message, ensure_ascii=False) + "$$"
-        # Send the json message to server (let comms manager do its thing with the dropped-off message)
+        request_id: int
+        message: Dict[str, Any]
+        response_protocol_type: str
+        future: Future
+        request_id, message, response_protocol_type, future = self._send_queue.get()
+        # Register the request before sending, as the response may arrive before sendall returns
+        with self._pending_lock:
+            self._pending[request_id] = future
+            self._callback_map.setdefault(response_protocol_type, []).append(request_id)
+        # Servers that negotiate framing echo the request ID in the envelope of the response
+        if self._framing.version != LEGACY_VERSION:
+            message = dict(message)
+            message[REQUEST_ID] = request_id
+        # Encode and frame the message as negotiated with the server
         try:
-            self._client.send(json_msg.encode())
+            self._client.sendall(self._framing.encode_message(message))
         except socket.error as e:
-            self._callback_map[response_protocol_type][0](False, response_protocol_type)
-            self._callback_map[response_protocol_type].pop(0)
+            self.__complete(request_id, response_protocol_type, None)
             self._client.close()
             self._connected_to_server = False
             print(e)
 
-    def __handle_receive(self) -> None:
+    def __receive(self, client: socket.socket, framing: Framing) -> None:
         """
-        This method gets back the message from the server and handles it.
+        Read responses from the server until the connection is lost, then fail the requests still waiting.
+
+        :param client: the connection to read from
+        :param framing: the framing negotiated on the connection
         """
         try:
-            pcg: bytes = self._client.recv(2048)
-            # Parse and deal with the data
-            self.__parse_data(pcg)
-        except socket.error as e:
-            self._client.close()
-            self._connected_to_server = False
+            while True:
+                pcg: bytes = client.recv(RECV_SIZE)
+                if not pcg:
+                    raise ConnectionResetError("Server closed the connection")
+                # Parse and deal with the data
+                self.__parse_data(pcg, framing)
+        except (socket.error, ValueError) as e:
             print(e)
+        client.close()
+        with self._pending_lock:
+            pending: Dict[int, Future] = dict(self._pending)
+            self._pending.clear()
+            self._callback_map.clear()
+        for future in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError("Lost connection to the server"))
+        if client is self._client:
+            self._connected_to_server = False
 
-    def __parse_data(self, pcg: bytes) -> None:
+    def __parse_data(self, pcg: bytes, framing: Framing) -> None:
         """
-        This method decodes and splits the package into protocols. Protocols in the package will be parsed and executed
-        one after another.
+        This method splits the package into protocols. Protocols in the package will be parsed and executed
+        one after another. Part of a protocol at the end of the package is kept until the rest arrives.
 
         :param pcg: the received package directly from the server in bytes
+        :param framing: the framing negotiated on the connection
         """
-        protocols: List[str] = pcg.decode().split("$$")
+        protocols: List[bytes] = framing.feed(pcg)
         # parse all the protocols if multiple are received
-        for str_protocol in protocols[:-1]:
-            protocol: Dict[str, Any] = json.loads(str_protocol)
-            self.__deal_with_data(protocol)
+        for str_protocol in protocols:
+            protocol: Dict[str, Any] = framing.decode_message(str_protocol)
+            request_id: Optional[int] = protocol.pop(REQUEST_ID, None)
+            self.__complete(request_id, protocol["protocol_type"], protocol)
 
-    def __deal_with_data(self, protocol: Dict[str, Any]) -> None:
+    def __complete(
+        self,
+        request_id: Optional[int],
+        response_protocol_type: str,
+        protocol: Optional[Dict[str, Any]],
+    ) -> None:
         """
-        Callback the functions with parsed returned protocol.
+        Complete the future of a request.
 
-        :param protocol: parsed protocol at least includes 'protocol_type' and it might contain more keys and values
+        :param request_id: ID of the request, or None for the oldest request of the protocol type, as a legacy server
+                           answers those in order
+        :param response_protocol_type: protocol type of the response
+        :param protocol: the response, or None if the request failed
         """
-        if protocol.__len__() == 1:
-            self._callback_map[protocol["protocol_type"]][0](False, protocol)
+        with self._pending_lock:
+            request_ids: List[int] = self._callback_map.get(response_protocol_type, [])
+            if request_id is None and request_ids:
+                request_id = request_ids[0]
+            if request_id in request_ids:
+                request_ids.remove(request_id)
+            future: Optional[Future] = (
+                None if request_id is None else self._pending.pop(request_id, None)
+            )
+        # A cancelled request is dropped; otherwise it can no longer be cancelled
+        if future is None or not future.set_running_or_notify_cancel():
+            return
+        if protocol is None:
+            future.set_exception(ConnectionError("Could not send to the server"))
         else:
-            # get the first callable in the list corresponding to 'protocol_type' and run it with corresponding
-            # parameters
-            self._callback_map[protocol["protocol_type"]][0](True, protocol)
-        self._callback_map[protocol["protocol_type"]].pop(
-            0
-        )  # get rid of the first callable in the list
+            future.set_result(protocol)
+
+    @staticmethod
+    def __run_callback(
+        future: Future, response_protocol_type: str, callback: Callable[..., None]
+    ) -> None:
+        """
+        Callback the function of a request with its parsed returned protocol.
+
+        :param future: the completed future of the request
+        :param response_protocol_type: protocol type of the response
+        :param callback: the function to call
+        """
+        # Nobody is waiting for a cancelled request
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            callback(False, response_protocol_type)
+            return
+        protocol: Dict[str, Any] = future.result()
+        # A response with nothing but its protocol type is a failure
+        callback(len(protocol) > 1, protocol)
 
     def close_the_connection(self) -> None:
         """
@@ -2,6 +2,7 @@ from typing import Optional, Union, List, Dict, Any
 
 from client.model.account import Account
 from client.model.ai import AI
+from client.model.bit_board import BitBoard
 from client.model.board import Board
 
 from client.model.game_manager import GameManager
@@ -60,7 +61,7 @@ class GetGameServerRequest(BaseServerRequest):
                 account2: Optional[Dict[str, Any]] = self._response_message["account2"]
             else:
                 account2 = None
-            new_board: Board = Board(size, board_state)
+            new_board: Board = BitBoard(size, board_state)
             ai_difficulty: int = 0
             p1: User = User("Guest")
             p2: User = User("Guest")
@@ -99,7 +100,7 @@ class GetGameServerRequest(BaseServerRequest):
         ):
             board_state = self._response_message["board_state"]
             size = len(board_state[0])
-            new_board = Board(size, board_state)
+            new_board = BitBoard(size, board_state)
             next_turn = self._response_message["next_turn"]
             updated_info: UpdatedGameInfo = UpdatedGameInfo(new_board, next_turn)
             return updated_info
@@ -74,7 +74,7 @@ class PlayGamePageView(BasePageView):
             for row in range(self._size)
         ]
         self._ai_spinbox: tk.Spinbox = self.__ai_spin_box_maker(
-            from_=0, to=4, increment=1
+            from_=0, to=len(AI.LEVEL_TIME_LIMITS) - 1, increment=1
         )
         self._ai_label: tk.Label = tk.Label(
             self._frame,
@@ -201,16 +201,16 @@ class PlayGamePageView(BasePageView):
             from_=from_,
             to=to,
             increment=increment,
-            command=lambda: self._handle_spinbox(self._ai_spinbox.get()),
+            command=lambda: self._handle_spinbox(int(self._ai_spinbox.get())),
         )
 
     def _handle_spinbox(self, difficulty: int):
         """
-        Handles the operations of the board size spinbox.
+        Handles the operations of the AI difficulty spinbox. Each level gives the AI more time per move.
         """
         player: Player = self._game_manager.get_player2()
         if isinstance(player, AI):
-            player.difficulty = difficulty
+            player.set_level(difficulty)
 
     def update_game(self, game: Game):
         self._game = game
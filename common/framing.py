@@ -0,0 +1,214 @@
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from common.wire_encoding import WireEncodingError, pack, unpack
+
+"""
+--- Framing ---
+
+Messages between the client and the server are split into frames. Legacy frames end with '$$', which breaks
+on any message containing '$$'. Version 1 frames start with the length of the message as an unsigned 4 byte big
+endian integer. Version 2 frames are version 1 frames holding messages in the compact wire encoding from
+common.wire_encoding rather than JSON.
+
+A client asks for length-prefixed frames by sending a hello as the first bytes on a connection: HELLO_MAGIC
+followed by one byte, the highest framing version it supports. The server answers with HELLO_MAGIC and the
+version both ends then use. Legacy messages start with '{', so a server reads a connection that does not start
+with HELLO_MAGIC as a legacy client. A client that gets no answer to its hello falls back to legacy frames.
+"""
+
+# First bytes of a framing hello. No JSON message starts with them
+HELLO_MAGIC: bytes = b"\x00RV"
+HELLO_SIZE: int = len(HELLO_MAGIC) + 1
+# Marks the end of a legacy frame
+LEGACY_DELIMITER: bytes = b"$$"
+LEGACY_VERSION: int = 0
+# Highest framing version supported
+FRAMING_VERSION: int = 2
+# Length prefix of a version 1 frame
+_LENGTH: struct.Struct = struct.Struct("!I")
+# Key of the request ID in the envelope of a message. A server echoes it in the response, so responses can be
+# sent in any order. Legacy clients send no request ID and get their responses in order
+REQUEST_ID: str = "request_id"
+# Largest message accepted, so a corrupt length cannot make a reader buffer without bound
+MAX_FRAME_SIZE: int = 16 * 1024 * 1024
+
+
+class FramingError(ValueError):
+    pass
+
+
+def encode_hello(version: int = FRAMING_VERSION) -> bytes:
+    """
+    Encode a framing hello.
+
+    :param version: framing version to offer or accept
+    :return: the hello
+    """
+    return HELLO_MAGIC + bytes((version,))
+
+
+def decode_hello(data: bytes) -> Optional[int]:
+    """
+    Decode a framing hello.
+
+    :param data: the first HELLO_SIZE bytes of a connection
+    :return: the framing version in the hello, or None if the data is not a hello
+    """
+    if len(data) != HELLO_SIZE or not data.startswith(HELLO_MAGIC):
+        return None
+    return data[-1]
+
+
+class Framing(ABC):
+    """
+    Splits the bytes read from a connection into messages, and wraps messages to send.
+    """
+
+    version: int
+
+    @abstractmethod
+    def encode(self, message: bytes) -> bytes:
+        """
+        Wrap a message in a frame.
+
+        :param message: the encoded message
+        :return: bytes to send
+        """
+        pass
+
+    @abstractmethod
+    def feed(self, data: bytes) -> List[bytes]:
+        """
+        Add bytes read from the connection. Bytes of an incomplete frame are kept until the rest arrives.
+
+        :param data: bytes read from the connection
+        :raises FramingError: when the data is not a valid frame
+        :return: the messages completed by the data, in order
+        """
+        pass
+
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        """
+        Encode a message and wrap it in a frame.
+
+        :param message: the message
+        :return: bytes to send
+        """
+        return self.encode(json.dumps(message, ensure_ascii=False).encode())
+
+    def decode_message(self, data: bytes) -> Dict[str, Any]:
+        """
+        Decode a message returned by feed.
+
+        :param data: the encoded message
+        :raises ValueError: when the data is not a valid message
+        :return: the message
+        """
+        return json.loads(data)
+
+
+class LengthPrefixFraming(Framing):
+    version = 1
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        # Length of the frame at the start of the buffer, once its prefix has been read
+        self._frame_size: Optional[int] = None
+
+    def encode(self, message: bytes) -> bytes:
+        if len(message) > MAX_FRAME_SIZE:
+            raise FramingError(f"Message of {len(message)} bytes is too large to send")
+        return _LENGTH.pack(len(message)) + message
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buffer: bytearray = self._buffer
+        buffer += data
+        messages: List[bytes] = []
+        view: memoryview = memoryview(buffer)
+        start: int = 0
+        try:
+            while True:
+                if self._frame_size is None:
+                    if len(buffer) - start < _LENGTH.size:
+                        break
+                    self._frame_size = _LENGTH.unpack_from(buffer, start)[0]
+                    if self._frame_size > MAX_FRAME_SIZE:
+                        raise FramingError(
+                            f"Frame of {self._frame_size} bytes is too large"
+                        )
+                    start += _LENGTH.size
+                # Wait for the rest of the frame without looking at the bytes already buffered
+                end: int = start + self._frame_size
+                if end > len(buffer):
+                    break
+                messages.append(bytes(view[start:end]))
+                self._frame_size = None
+                start = end
+        finally:
+            view.release()
+        # Deleting from the front of a bytearray does not move the bytes left behind
+        del buffer[:start]
+        return messages
+
+
+class CompactFraming(LengthPrefixFraming):
+    version = 2
+
+    def encode_message(self, message: Dict[str, Any]) -> bytes:
+        return self.encode(pack(message))
+
+    def decode_message(self, data: bytes) -> Dict[str, Any]:
+        message: Any = unpack(data)
+        if not isinstance(message, dict):
+            raise WireEncodingError("Message is not a dict")
+        return message
+
+
+class LegacyFraming(Framing):
+    version = LEGACY_VERSION
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        # Where to look for the next delimiter, so buffered bytes are searched once
+        self._search_start: int = 0
+
+    def encode(self, message: bytes) -> bytes:
+        return message + LEGACY_DELIMITER
+
+    def feed(self, data: bytes) -> List[bytes]:
+        buffer: bytearray = self._buffer
+        buffer += data
+        messages: List[bytes] = []
+        start: int = 0
+        while True:
+            end: int = buffer.find(LEGACY_DELIMITER, max(start, self._search_start))
+            if end == -1:
+                break
+            messages.append(bytes(buffer[start:end]))
+            start = end + len(LEGACY_DELIMITER)
+        if len(buffer) - start > MAX_FRAME_SIZE:
+            raise FramingError("Legacy frame is too large")
+        del buffer[:start]
+        # The last byte may be the first half of a delimiter
+        self._search_start = max(len(buffer) - len(LEGACY_DELIMITER) + 1, 0)
+        return messages
+
+
+def create_framing(version: int) -> Framing:
+    """
+    Create the framing for a negotiated version.
+
+    :param version: framing version, LEGACY_VERSION for '$$' frames
+    :raises FramingError: when the version is not supported
+    :return: the framing
+    """
+    if version == LEGACY_VERSION:
+        return LegacyFraming()
+    if version == LengthPrefixFraming.version:
+        return LengthPrefixFraming()
+    if version == CompactFraming.version:
+        return CompactFraming()
+    raise FramingError(f"Unsupported framing version {version}")
@@ -0,0 +1,332 @@
+import struct
+from typing import Any, Callable, Dict, List, Tuple
+
+"""
+--- Compact wire encoding ---
+
+A MessagePack-style binary encoding of protocol messages, used in place of JSON when both ends negotiate it.
+Every value starts with a one byte tag:
+    NONE, FALSE, TRUE
+    INT     a zigzag varint of a signed 64 bit int
+    FLOAT   an 8 byte big endian double
+    STR     a varint byte length, then UTF-8 bytes
+    NAME    a one byte index into NAMES, for field names and protocol types
+    LIST    a varint length, then the items
+    DICT    a varint length, then the keys and values
+    BOARD   varint rows and columns, then the squares at 2 bits each, 4 to a byte with the first square in the
+            low bits
+Boards are lists of equal length lists of ints from 0 to 3, as in board_state, so an 8x8 board takes 19 bytes
+rather than about 200 bytes of JSON.
+"""
+
+_NONE: int = 0
+_FALSE: int = 1
+_TRUE: int = 2
+_INT: int = 3
+_FLOAT: int = 4
+_STR: int = 5
+_NAME: int = 6
+_LIST: int = 7
+_DICT: int = 8
+_BOARD: int = 9
+
+# Field names and protocol types sent as one byte. Both ends must agree on the order, so only append to it
+NAMES: Tuple[str, ...] = (
+    "protocol_type",
+    "success",
+    "create_game",
+    "save_game",
+    "save_preferences",
+    "get_game",
+    "update_elo",
+    "get_top_elos",
+    "login",
+    "create_account",
+    "matchmaker",
+    "cancel_match",
+    "board_state",
+    "rules",
+    "p1_account_id",
+    "p2_account_id",
+    "ai_difficulty",
+    "game_id",
+    "complete",
+    "next_turn",
+    "account_id",
+    "pref_board_length",
+    "pref_board_color",
+    "pref_disk_color",
+    "pref_opp_disk_color",
+    "pref_line_color",
+    "pref_rules",
+    "pref_tile_move_confirmation",
+    "resume_game",
+    "account1",
+    "account2",
+    "p1_username",
+    "p1_elo",
+    "p2_username",
+    "p2_elo",
+    "new_elo",
+    "num_elos",
+    "top_elos",
+    "username",
+    "password",
+    "encrypted_password",
+    "elo",
+    "my_account_id",
+    "pref_rule",
+    "pref_board_size",
+    "opp_username",
+    "opp_elo",
+    "player_term",
+    "request_id",
+)
+_NAME_INDEXES: Dict[str, int] = {name: index for index, name in enumerate(NAMES)}
+_DOUBLE: struct.Struct = struct.Struct("!d")
+# Deepest nesting of lists and dicts accepted, far past any protocol message, so a corrupt or hostile message
+# cannot exhaust the stack
+MAX_DEPTH: int = 32
+# Varints carry 7 bits a byte and are read at most 10 bytes long, enough for 64 bit ints. Decoding longer ones
+# would take time quadratic in their length
+_MAX_VARINT_BITS: int = 70
+# Ints are sent as signed 64 bit values
+_INT_LIMIT: int = 2**63
+# The byte holding each four squares, keyed by the squares read as one native int, and the four squares in
+# each byte
+_PACKED_SQUARES: Dict[int, int] = {
+    memoryview(bytes((a, b, c, d))).cast("I")[0]: a | b << 2 | c << 4 | d << 6
+    for a in range(4)
+    for b in range(4)
+    for c in range(4)
+    for d in range(4)
+}
+_UNPACKED_SQUARES: Tuple[bytes, ...] = tuple(
+    bytes((byte & 3, byte >> 2 & 3, byte >> 4 & 3, byte >> 6)) for byte in range(256)
+)
+
+
+class WireEncodingError(ValueError):
+    pass
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value: int = 0
+    shift: int = 0
+    while shift < _MAX_VARINT_BITS:
+        byte: int = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    raise WireEncodingError(f"Varint longer than {_MAX_VARINT_BITS // 7} bytes")
+
+
+def _write_board(out: bytearray, value: List[Any]) -> bool:
+    """
+    Write a list as a board if it is one: rows of the same length holding only ints from 0 to 3.
+
+    :return: whether the list was written
+    """
+    if not value or type(value[0]) is not list or not value[0]:
+        return False
+    columns: int = len(value[0])
+    for row in value:
+        if type(row) is not list or len(row) != columns:
+            return False
+    squares: List[Any] = [square for row in value for square in row]
+    # Bools would pass as ints below
+    if set(map(type, squares)) != {int}:
+        return False
+    try:
+        # Pad to a whole number of bytes, then look up every 4 squares at once
+        raw: bytes = bytes(squares) + bytes(-len(squares) % 4)
+        packed: bytes = bytes(
+            map(_PACKED_SQUARES.__getitem__, memoryview(raw).cast("I"))
+        )
+    except (ValueError, KeyError):
+        # Squares outside 0 to 3
+        return False
+    out.append(_BOARD)
+    _write_varint(out, len(value))
+    _write_varint(out, columns)
+    out += packed
+    return True
+
+
+def _write(out: bytearray, value: Any, depth: int = 0) -> None:
+    if depth > MAX_DEPTH:
+        raise WireEncodingError(f"Nested deeper than {MAX_DEPTH}")
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        if not -_INT_LIMIT <= value < _INT_LIMIT:
+            raise WireEncodingError(f"{value} does not fit in 64 bits")
+        out.append(_INT)
+        _write_varint(out, value << 1 if value >= 0 else (-value << 1) - 1)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        index = _NAME_INDEXES.get(value)
+        if index is not None:
+            out.append(_NAME)
+            out.append(index)
+        else:
+            encoded: bytes = value.encode()
+            out.append(_STR)
+            _write_varint(out, len(encoded))
+            out += encoded
+    elif isinstance(value, (list, tuple)):
+        if isinstance(value, list) and _write_board(out, value):
+            return
+        out.append(_LIST)
+        _write_varint(out, len(value))
+        for item in value:
+            _write(out, item, depth + 1)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            # Keys that come back as lists cannot be dict keys
+            if isinstance(key, (list, tuple)):
+                raise WireEncodingError(f"Cannot encode a {type(key).__name__} key")
+            _write(out, key, depth + 1)
+            _write(out, item, depth + 1)
+    else:
+        raise WireEncodingError(f"Cannot encode {type(value).__name__}")
+
+
+def _read_none(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    return None, pos
+
+
+def _read_false(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    return False, pos
+
+
+def _read_true(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    return True, pos
+
+
+def _read_int(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    value, pos = _read_varint(data, pos)
+    return (value >> 1) ^ -(value & 1), pos
+
+
+def _read_float(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    return _DOUBLE.unpack_from(data, pos)[0], pos + _DOUBLE.size
+
+
+def _read_str(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    length, pos = _read_varint(data, pos)
+    if pos + length > len(data):
+        raise IndexError("String runs past the end of the message")
+    return bytes(data[pos : pos + length]).decode(), pos + length
+
+
+def _read_name(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    return NAMES[data[pos]], pos + 1
+
+
+def _read_list(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    length, pos = _read_varint(data, pos)
+    items: List[Any] = []
+    for _ in range(length):
+        item, pos = _read(data, pos, depth + 1)
+        items.append(item)
+    return items, pos
+
+
+def _read_dict(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    length, pos = _read_varint(data, pos)
+    items: Dict[Any, Any] = {}
+    for _ in range(length):
+        key, pos = _read(data, pos, depth + 1)
+        if isinstance(key, (list, dict)):
+            raise WireEncodingError(f"Dict key is a {type(key).__name__}")
+        items[key], pos = _read(data, pos, depth + 1)
+    return items, pos
+
+
+def _read_board(data: bytes, pos: int, depth: int) -> Tuple[Any, int]:
+    rows, pos = _read_varint(data, pos)
+    columns, pos = _read_varint(data, pos)
+    num_squares: int = rows * columns
+    end: int = pos + (num_squares + 3) // 4
+    if end > len(data):
+        raise IndexError("Board runs past the end of the message")
+    squares: List[int] = list(
+        b"".join(map(_UNPACKED_SQUARES.__getitem__, data[pos:end]))
+    )
+    return [
+        squares[start : start + columns] for start in range(0, num_squares, columns)
+    ], end
+
+
+_READERS: Tuple[Callable[[bytes, int, int], Tuple[Any, int]], ...] = (
+    _read_none,
+    _read_false,
+    _read_true,
+    _read_int,
+    _read_float,
+    _read_str,
+    _read_name,
+    _read_list,
+    _read_dict,
+    _read_board,
+)
+
+
+def _read(data: bytes, pos: int, depth: int = 0) -> Tuple[Any, int]:
+    if depth > MAX_DEPTH:
+        raise WireEncodingError(f"Nested deeper than {MAX_DEPTH}")
+    tag: int = data[pos]
+    if tag >= len(_READERS):
+        raise WireEncodingError(f"Unknown tag {tag}")
+    return _READERS[tag](data, pos + 1, depth)
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encode a value in the compact wire encoding.
+
+    :param value: None, bools, 64 bit ints, floats, strings, lists, tuples and dicts of them, nested at most
+                  MAX_DEPTH deep. Tuples come back as lists
+    :raises WireEncodingError: when the value holds anything else or is nested too deeply
+    :return: the encoded value
+    """
+    out: bytearray = bytearray()
+    _write(out, value)
+    return bytes(out)
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Decode a value from the compact wire encoding.
+
+    :param data: the encoded value
+    :raises WireEncodingError: when the data is not a single encoded value
+    :return: the value
+    """
+    try:
+        value, pos = _read(data, 0)
+    except WireEncodingError:
+        raise
+    except (IndexError, ValueError, struct.error) as e:
+        raise WireEncodingError(f"Truncated or corrupt message: {e}") from e
+    if pos != len(data):
+        raise WireEncodingError(f"{len(data) - pos} bytes left after the message")
+    return value
@@ -5,12 +5,9 @@ from _thread import start_new_thread
 from server.database_management.database_manager import DatabaseManager
 
 if __name__ == "__main__":
-    server: ServerCommsManager = ServerCommsManager()
-    start_new_thread(server.run, ())
-
     database_manager: DatabaseManager = DatabaseManager()
     start_new_thread(database_manager.run, ())
 
-    # Pause forever
-    while True:
-        pass
+    # Serve clients on this thread's event loop until the server stops
+    server: ServerCommsManager = ServerCommsManager()
+    server.run()
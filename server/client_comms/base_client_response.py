@@ -1,20 +1,41 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Callable
 
 
 class BaseClientResponse(ABC):
     def __init__(self, message: Dict[str, Any]):
         """
         Base client response for all other client responses to build off
-        Constructor ensures client response has a message
+        Constructor ensures client response has a message. Responses must be created on the server's event loop
         :param message: Message sent to the server from the client
         """
         self._sent_message: Dict[str, Any] = message
         self._response_message: Dict[str, Any] = {}
+        self._loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
 
     @abstractmethod
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client once all server-related tasks have completed
         """
         pass
+
+    def _notify(self, event: asyncio.Event) -> None:
+        """
+        Wake the response up from a callback. Callbacks may run on the database manager's thread, so the event is
+        set on the event loop
+        :param event: Event the response is waiting on
+        """
+        self._loop.call_soon_threadsafe(event.set)
+
+    @staticmethod
+    async def _wait_for(event: asyncio.Event, done: Callable[[], bool]) -> None:
+        """
+        Wait for callbacks without blocking the event loop, so other clients are served in the meantime
+        :param event: Event the callbacks notify
+        :param done: Whether the callbacks have set everything the response needs
+        """
+        while not done():
+            await event.wait()
+            event.clear()
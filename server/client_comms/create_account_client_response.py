@@ -1,4 +1,4 @@
-from threading import Condition
+import asyncio
 from typing import Dict, Any, Optional
 
 from schema import Schema  # type: ignore
@@ -21,7 +21,7 @@ class CreateAccountClientResponse(BaseClientResponse):
         super().__init__(message=message)
         self._db_create_account_success: Optional[bool] = None
         self._db_get_account_id_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_dba: Optional[DatabaseAccount] = None
         self._sent_message_schema: Schema = (
             create_account_client_schema  # from client side
@@ -31,7 +31,7 @@ class CreateAccountClientResponse(BaseClientResponse):
             "protocol_type"
         ]
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         """
@@ -65,12 +65,11 @@ class CreateAccountClientResponse(BaseClientResponse):
         )
 
         # Wait for database manager to complete task
-        with self._db_complete_cv:
-            while (
-                self._db_create_account_success is None
-                or self._db_get_account_id_success is None
-            ):
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv,
+            lambda: self._db_create_account_success is not None
+            and self._db_get_account_id_success is not None,
+        )
 
         # Return the response message
         self._response_message.update(
@@ -90,9 +89,8 @@ class CreateAccountClientResponse(BaseClientResponse):
         :param success: Whether game was created successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_create_account_success = success
-            self._db_complete_cv.notify()
+        self._db_create_account_success = success
+        self._notify(self._db_complete_cv)
 
     def __account_retrieved_callback(self, success: bool, dba: DatabaseAccount) -> None:
         """
@@ -100,8 +98,7 @@ class CreateAccountClientResponse(BaseClientResponse):
         :param success: Whether game was updated successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_account_id_success = success
-            if success is True:
-                self._retrieved_dba = dba
-            self._db_complete_cv.notify()
+        self._db_get_account_id_success = success
+        if success is True:
+            self._retrieved_dba = dba
+        self._notify(self._db_complete_cv)
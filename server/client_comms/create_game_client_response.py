@@ -1,5 +1,5 @@
+import asyncio
 from datetime import datetime
-from threading import Condition
 from typing import Dict, Any, Optional
 
 from schema import Schema  # type: ignore
@@ -21,7 +21,7 @@ class CreateGameClientResponse(BaseClientResponse):
         super().__init__(message=message)
         self._db_create_game_success: Optional[bool] = None
         self._db_get_game_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_dbg: Optional[DatabaseGame] = None
         self._sent_message_schema: Schema = create_game_client_schema
         self._response_message_schema: Schema = create_game_server_schema
@@ -29,7 +29,7 @@ class CreateGameClientResponse(BaseClientResponse):
             "protocol_type"
         ]
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         :return Message to send to client
@@ -72,12 +72,11 @@ class CreateGameClientResponse(BaseClientResponse):
         )
 
         # Wait for database to complete tasks
-        with self._db_complete_cv:
-            while (
-                self._db_create_game_success is None
-                or self._db_get_game_success is None
-            ):
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv,
+            lambda: self._db_create_game_success is not None
+            and self._db_get_game_success is not None,
+        )
 
         # Return the response message
         self._response_message.update(
@@ -96,9 +95,8 @@ class CreateGameClientResponse(BaseClientResponse):
         :param success: Whether game was created successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_create_game_success = success
-            self._db_complete_cv.notify()
+        self._db_create_game_success = success
+        self._notify(self._db_complete_cv)
 
     def __game_retrieved_callback(self, success: bool, dbg: DatabaseGame) -> None:
         """
@@ -107,8 +105,7 @@ class CreateGameClientResponse(BaseClientResponse):
         :param dbg: Database game retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_game_success = success
-            if success is True:
-                self._retrieved_dbg = dbg
-            self._db_complete_cv.notify()
+        self._db_get_game_success = success
+        if success is True:
+            self._retrieved_dbg = dbg
+        self._notify(self._db_complete_cv)
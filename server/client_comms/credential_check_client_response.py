@@ -1,4 +1,4 @@
-from threading import Condition
+import asyncio
 from typing import Dict, Any, Optional
 
 from schema import Schema  # type: ignore
@@ -20,7 +20,7 @@ class CredentialCheckClientResponse(BaseClientResponse):
         """
         super().__init__(message=message)
         self._db_credential_check_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_dba: Optional[DatabaseAccount] = None
         self._sent_message_schema: Schema = (
             credential_check_client_schema  # from client side
@@ -30,7 +30,7 @@ class CredentialCheckClientResponse(BaseClientResponse):
             "protocol_type"
         ]
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         """
@@ -56,9 +56,9 @@ class CredentialCheckClientResponse(BaseClientResponse):
         )
 
         # Wait for database manager to complete task
-        with self._db_complete_cv:
-            while self._db_credential_check_success is None:
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv, lambda: self._db_credential_check_success is not None
+        )
 
         # Return the response message
         if self._retrieved_dba is not None:
@@ -104,8 +104,7 @@ class CredentialCheckClientResponse(BaseClientResponse):
         :param success: Whether game was updated successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_credential_check_success = success
-            if success is True:
-                self._retrieved_dba = dba
-            self._db_complete_cv.notify()
+        self._db_credential_check_success = success
+        if success is True:
+            self._retrieved_dba = dba
+        self._notify(self._db_complete_cv)
@@ -1,4 +1,4 @@
-from threading import Condition
+import asyncio
 from typing import Dict, Any, Optional
 
 from common.client_server_protocols import get_game_server_schema
@@ -20,12 +20,12 @@ class GetGameClientResponse(BaseClientResponse):
         self._db_get_game_success: Optional[bool] = None
         self._db_get_p1_success: Optional[bool] = None
         self._db_get_p2_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_dbg: Optional[DatabaseGame] = None
         self._retrieved_p1: Optional[DatabaseAccount] = None
         self._retrieved_p2: Optional[DatabaseAccount] = None
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         """
@@ -51,9 +51,9 @@ class GetGameClientResponse(BaseClientResponse):
         )
 
         # Wait for database to complete task
-        with self._db_complete_cv:
-            while self._db_get_game_success is None:
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv, lambda: self._db_get_game_success is not None
+        )
 
         if (
             "resume_game" in self._sent_message
@@ -76,15 +76,14 @@ class GetGameClientResponse(BaseClientResponse):
                     get_elo=True,
                 )
             # Wait for database to complete task
-            with self._db_complete_cv:
-                while (
-                    self._retrieved_dbg.p1_account_id is not None
-                    and self._db_get_p1_success is None
-                ) or (
-                    self._retrieved_dbg.p2_account_id is not None
-                    and self._db_get_p2_success is None
-                ):
-                    self._db_complete_cv.wait()
+            dbg: DatabaseGame = self._retrieved_dbg
+            await self._wait_for(
+                self._db_complete_cv,
+                lambda: (
+                    dbg.p1_account_id is None or self._db_get_p1_success is not None
+                )
+                and (dbg.p2_account_id is None or self._db_get_p2_success is not None),
+            )
 
         # Return the response message
         self._response_message.update(
@@ -163,11 +162,10 @@ class GetGameClientResponse(BaseClientResponse):
         :param dbg: Database game retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_game_success = success
-            if success is True:
-                self._retrieved_dbg = dbg
-            self._db_complete_cv.notify()
+        self._db_get_game_success = success
+        if success is True:
+            self._retrieved_dbg = dbg
+        self._notify(self._db_complete_cv)
 
     def __p1_retrieved_callback(self, success: bool, dba: DatabaseAccount) -> None:
         """
@@ -176,11 +174,10 @@ class GetGameClientResponse(BaseClientResponse):
         :param dba: Database account retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_p1_success = success
-            if success is True:
-                self._retrieved_p1 = dba
-            self._db_complete_cv.notify()
+        self._db_get_p1_success = success
+        if success is True:
+            self._retrieved_p1 = dba
+        self._notify(self._db_complete_cv)
 
     def __p2_retrieved_callback(self, success: bool, dba: DatabaseAccount) -> None:
         """
@@ -189,8 +186,7 @@ class GetGameClientResponse(BaseClientResponse):
         :param dba: Database account retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_p2_success = success
-            if success is True:
-                self._retrieved_p2 = dba
-            self._db_complete_cv.notify()
+        self._db_get_p2_success = success
+        if success is True:
+            self._retrieved_p2 = dba
+        self._notify(self._db_complete_cv)
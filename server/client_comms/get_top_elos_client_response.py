@@ -1,4 +1,4 @@
-from threading import Condition
+import asyncio
 from typing import Dict, Any, Optional, Tuple, List
 
 from common.client_server_protocols import get_top_elos_client_schema
@@ -14,10 +14,10 @@ class GetTopELOsClientResponse(BaseClientResponse):
         """
         super().__init__(message=message)
         self._db_get_top_elos_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_elos: Optional[List[Tuple[str, int]]] = None
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         """
@@ -29,9 +29,9 @@ class GetTopELOsClientResponse(BaseClientResponse):
         )
 
         # Wait for database to complete task
-        with self._db_complete_cv:
-            while self._db_get_top_elos_success is None:
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv, lambda: self._db_get_top_elos_success is not None
+        )
 
         # Return the response message
         self._response_message.update(
@@ -52,8 +52,7 @@ class GetTopELOsClientResponse(BaseClientResponse):
         :param elos: List of top ELOs and corresponding usernames retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_get_top_elos_success = success
-            if success is True:
-                self._retrieved_elos = elos
-            self._db_complete_cv.notify()
+        self._db_get_top_elos_success = success
+        if success is True:
+            self._retrieved_elos = elos
+        self._notify(self._db_complete_cv)
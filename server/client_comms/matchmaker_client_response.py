@@ -1,5 +1,5 @@
+import asyncio
 from datetime import datetime
-from threading import Condition
 from typing import Dict, Any, Optional, Callable, List
 
 from schema import Schema  # type: ignore
@@ -26,18 +26,18 @@ class MatchmakerClientResponse(BaseClientResponse):
         :param message: Message info from client
         """
         super().__init__(message=message)
-        self._complete_matchmaker: Condition = Condition()
+        self._complete_matchmaker: asyncio.Event = asyncio.Event()
         self._game_id: int = 0
         self._opp_account_id: Optional[int] = None
         self._player_term: Optional[
             int
         ] = None  # whether the player will be the first or second to play
         self._matchmaker_callback: Optional[Callable[..., None]] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._db_matchmaker_create_game_success: Optional[bool] = None
         self._db_matchmaker_retrieve_game_success: Optional[bool] = None
         self._db_game_id: Optional[int] = 0
-        self._db_complete_get_opp_account: Condition = Condition()
+        self._db_complete_get_opp_account: asyncio.Event = asyncio.Event()
         self._db_get_opp_account_success: Optional[bool] = None
         self._sent_message_schema: Schema = matchmaker_client_schema  # from client side
         self._response_message_schema: Schema = matchmaker_server_schema
@@ -45,7 +45,7 @@ class MatchmakerClientResponse(BaseClientResponse):
             "protocol_type"
         ]
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager.
         """
@@ -64,9 +64,9 @@ class MatchmakerClientResponse(BaseClientResponse):
         )
 
         # Wait for matchmaker to complete task
-        with self._complete_matchmaker:
-            while self._opp_account_id is None:
-                self._complete_matchmaker.wait()
+        await self._wait_for(
+            self._complete_matchmaker, lambda: self._opp_account_id is not None
+        )
 
         # Check if an opponent id is returned to retrieve information; return false message directly if it is none
         if (
@@ -99,12 +99,11 @@ class MatchmakerClientResponse(BaseClientResponse):
             )
 
             # Wait for database manager to complete task
-            with self._db_complete_cv:
-                while (
-                    self._db_matchmaker_create_game_success is None
-                    or self._db_matchmaker_retrieve_game_success is None
-                ):
-                    self._db_complete_cv.wait()
+            await self._wait_for(
+                self._db_complete_cv,
+                lambda: self._db_matchmaker_create_game_success is not None
+                and self._db_matchmaker_retrieve_game_success is not None,
+            )
 
             self._matchmaker_callback(
                 self._db_game_id, self._sent_message["my_account_id"], 2, None
@@ -119,9 +118,10 @@ class MatchmakerClientResponse(BaseClientResponse):
             get_elo=True,
         )
 
-        with self._db_complete_get_opp_account:
-            while self._db_get_opp_account_success is None:
-                self._db_complete_get_opp_account.wait()
+        await self._wait_for(
+            self._db_complete_get_opp_account,
+            lambda: self._db_get_opp_account_success is not None,
+        )
 
         # Return the response message
         self._response_message.update(
@@ -158,12 +158,11 @@ class MatchmakerClientResponse(BaseClientResponse):
         :param player_term: the player's term in this online game.
         """
         # Notify class that database has completed its task
-        with self._complete_matchmaker:
-            self._game_id = game_id
-            self._opp_account_id = opp_account_id
-            self._player_term = player_term
-            self._matchmaker_callback = callback
-            self._complete_matchmaker.notify()
+        self._game_id = game_id
+        self._opp_account_id = opp_account_id
+        self._player_term = player_term
+        self._matchmaker_callback = callback
+        self._notify(self._complete_matchmaker)
 
     def __opp_account_retrieved_callback(
         self, success: bool, dba: DatabaseAccount
@@ -173,11 +172,10 @@ class MatchmakerClientResponse(BaseClientResponse):
         :param success: Whether game was updated successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_get_opp_account:
-            self._db_get_opp_account_success = success
-            if success is True:
-                self._retrieved_dba = dba
-            self._db_complete_get_opp_account.notify()
+        self._db_get_opp_account_success = success
+        if success is True:
+            self._retrieved_dba = dba
+        self._notify(self._db_complete_get_opp_account)
 
     def __matchmaker_game_created_callback(self, success: bool) -> None:
         """
@@ -186,9 +184,8 @@ class MatchmakerClientResponse(BaseClientResponse):
         :param success: Whether game was created successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_matchmaker_create_game_success = success
-            self._db_complete_cv.notify()
+        self._db_matchmaker_create_game_success = success
+        self._notify(self._db_complete_cv)
 
     def __matchmaker_game_retrieved_callback(
         self, success: bool, dbg: DatabaseGame
@@ -200,12 +197,11 @@ class MatchmakerClientResponse(BaseClientResponse):
         :param dbg: Database game retrieved from database
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_matchmaker_retrieve_game_success = success
-            if success is True:
-                self._db_game_id = dbg.game_id
-                self._db_game_id = dbg.game_id
-            self._db_complete_cv.notify()
+        self._db_matchmaker_retrieve_game_success = success
+        if success is True:
+            self._db_game_id = dbg.game_id
+            self._db_game_id = dbg.game_id
+        self._notify(self._db_complete_cv)
 
     def __matchmaker_initialize_board(self) -> List[List[int]]:
         size: int = self._sent_message["pref_board_size"]
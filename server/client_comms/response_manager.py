@@ -74,10 +74,11 @@ class ResponseManager:
                     cls._instance = super(ResponseManager, cls).__new__(cls)
         return cls._instance
 
-    def handle_response(self, message: Dict[str, Any]) -> Dict[str, Any]:
+    async def handle_response(self, message: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Adds a response to the queue for future execution based on the protocol type of the given message
+        Creates a response based on the protocol type of the given message and waits for it to complete
         :param message: Message passed from the server comms manager
+        :return: Message to send back to the client, or an empty dict for an unknown protocol type
         """
         # Check prototype type in message is valid
         if "protocol_type" not in message:
@@ -88,4 +89,4 @@ class ResponseManager:
         new_response: BaseClientResponse = globals()[
             self._protocol_type_response_dict[message["protocol_type"]]
         ](message)
-        return new_response.respond()
+        return await new_response.respond()
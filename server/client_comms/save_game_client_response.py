@@ -1,5 +1,5 @@
+import asyncio
 from datetime import datetime
-from threading import Condition
 from typing import Dict, Any, Optional
 
 from schema import Schema  # type: ignore
@@ -20,14 +20,14 @@ class SaveGameClientResponse(BaseClientResponse):
         """
         super().__init__(message=message)
         self._db_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._sent_message_schema: Schema = save_game_client_schema
         self._response_message_schema: Schema = save_game_server_schema
         self._response_message["protocol_type"] = self._response_message_schema.schema[
             "protocol_type"
         ]
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         :return Message to send to client
@@ -51,9 +51,7 @@ class SaveGameClientResponse(BaseClientResponse):
         )
 
         # Wait for database manager to complete task
-        with self._db_complete_cv:
-            while self._db_success is None:
-                self._db_complete_cv.wait()
+        await self._wait_for(self._db_complete_cv, lambda: self._db_success is not None)
 
         # Return the response message
         self._response_message["success"] = self._db_success
@@ -65,6 +63,5 @@ class SaveGameClientResponse(BaseClientResponse):
         :param success: Whether game was updated successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_success = success
-            self._db_complete_cv.notify()
+        self._db_success = success
+        self._notify(self._db_complete_cv)
@@ -1,10 +1,24 @@
 from __future__ import annotations
-import socket
-import json
+import asyncio
 import threading
-from _thread import start_new_thread
-from typing import List, Dict, Any, Tuple, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Tuple, Optional, Set
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
+from common.framing import (
+    FRAMING_VERSION,
+    HELLO_SIZE,
+    REQUEST_ID,
+    Framing,
+    LegacyFraming,
+    create_framing,
+    decode_hello,
+    encode_hello,
+)
 from server.client_comms.response_manager import ResponseManager
 
 """
@@ -69,12 +83,30 @@ Respond to an unrecognized client request:
 
 HOST = "localhost"
 PORT = 7777
+# Connections the OS queues before they are accepted, so bursts of clients are not refused
+BACKLOG = 1024
+# Seconds to hear from a client before dropping its connection
+CLIENT_TIMEOUT = 60.0
+# Most bytes to read from a client at once
+RECV_SIZE = 65536
+
+
+@dataclass
+class _ClientConnection:
+    writer: asyncio.StreamWriter
+    framing: Framing
+    # Responses to requests with a request ID finish in any order, so they take turns writing
+    write_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Responses still being handled
+    tasks: Set["asyncio.Task[None]"] = field(default_factory=set)
 
 
 class ServerCommsManager:
 
     _instance = None
     _lock = threading.Lock()
+    # Number of clients currently connected
+    num_connections: int = 0
 
     def __new__(cls):
         """
@@ -90,75 +122,140 @@ class ServerCommsManager:
         """
         Start the server and listen for client connections and requests. Handle those requests accordingly.
         """
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         try:
-            s.bind((HOST, PORT))
-        except socket.error as e:
+            asyncio.run(self.serve())
+        except OSError as e:
             print(e)
-            return
-        s.listen(2)
+
+    async def serve(self, host: str = HOST, port: int = PORT) -> None:
+        """
+        Serve clients on the running event loop until cancelled.
+
+        :param host: Host to listen on
+        :param port: Port to listen on
+        """
+        server: asyncio.AbstractServer = await self.start(host, port)
         print("Server started, waiting for connections")
-        while True:
+        async with server:
+            await server.serve_forever()
+
+    async def start(self, host: str = HOST, port: int = PORT) -> asyncio.AbstractServer:
+        """
+        Start listening for clients on the running event loop. Every connection is served by a coroutine rather
+        than a thread, so an idle connection costs only its socket and buffers.
+
+        :param host: Host to listen on
+        :param port: Port to listen on, or 0 for any free port
+        :return: The listening server
+        """
+        self.__raise_open_file_limit()
+        return await asyncio.start_server(
+            self.__handle_client, host, port, backlog=BACKLOG
+        )
+
+    @staticmethod
+    def __raise_open_file_limit() -> None:
+        """
+        Raise the soft limit on open files to the hard limit, since every connection holds a file descriptor.
+        """
+        if resource is None:
+            return
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != hard:
             try:
-                conn, addr = s.accept()
-                conn.settimeout(60.0)  # Set timeout to hear from client to 1 minute
-                print("Connected to: ", addr)
-                start_new_thread(self.__threaded_client, (conn, addr))
-            except Exception as e:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+            except (ValueError, OSError) as e:
                 print(e)
 
-    def __send(
-        self, msg: Dict[str, Any], conn: socket.socket, addr: Tuple[int, int]
-    ) -> None:
+    async def __send(self, msg: Dict[str, Any], connection: _ClientConnection) -> None:
         """
         Send the given dict message to the given client connection.
         """
         # check if the message have specified protocol type and throw ValueError if
         if not msg["protocol_type"]:
             raise ValueError("Message must have a protocol_type.")
-        # put '$$' to signify end of message and encapsulate the message
-        message: str = json.dumps(msg, ensure_ascii=False) + "$$"
-        try:
-            conn.sendto(message.encode(), addr)
-        except socket.error as e:
-            print(e)
+        # encode and frame the message as negotiated with the client
+        async with connection.write_lock:
+            connection.writer.write(connection.framing.encode_message(msg))
+            await connection.writer.drain()
 
-    def __threaded_client(self, conn: socket.socket, addr: Tuple[int, int]) -> None:
+    async def __handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
         """
-        Create a client handler within this thread.
+        Serve one client connection until it closes or goes quiet.
         """
-        unparsed_messages: str = ""
-        while True:
-            try:
-                data = conn.recv(2048)
+        addr: Tuple[str, int] = writer.get_extra_info("peername")
+        print("Connected to: ", addr)
+        self.num_connections += 1
+        connection: _ClientConnection = _ClientConnection(writer, LegacyFraming())
+        try:
+            # Drop clients that have not been heard from in a while
+            data: bytes = await asyncio.wait_for(
+                reader.readexactly(HELLO_SIZE), CLIENT_TIMEOUT
+            )
+            version: Optional[int] = decode_hello(data)
+            # Clients that do not start with a hello have sent the start of a legacy message instead
+            if version is not None:
+                connection.framing = create_framing(min(version, FRAMING_VERSION))
+                writer.write(encode_hello(connection.framing.version))
+                data = b""
+            while True:
+                await self.__parse_data(data, connection)
+                data = await asyncio.wait_for(reader.read(RECV_SIZE), CLIENT_TIMEOUT)
                 if not data:
                     break
-                unparsed_messages = self.__parse_data(
-                    data, conn, addr, unparsed_messages
+        except (OSError, EOFError, ValueError, asyncio.TimeoutError):
+            pass
+        finally:
+            for task in connection.tasks:
+                task.cancel()
+            self.num_connections -= 1
+            print(f"Lost connection to: {addr}")
+            writer.close()
+
+    async def __parse_data(self, data: bytes, connection: _ClientConnection) -> None:
+        """
+        Parse JSON data and then handle it accordingly.
+        """
+        # Loop through all messages completed by the data
+        for package in connection.framing.feed(data):
+            msg: Dict[str, Any] = connection.framing.decode_message(package)
+            # Requests are JSON objects. Other values cannot be answered, so they are dropped like unknown requests
+            if not isinstance(msg, dict):
+                continue
+            # Strip the envelope so the message matches its protocol's schema
+            request_id: Optional[int] = msg.pop(REQUEST_ID, None)
+            if request_id is None:
+                # Legacy clients match responses to requests by order, so answer one request at a time
+                await self.__respond(msg, request_id, connection)
+            else:
+                # Keep reading while the response waits, so requests are answered as soon as each is ready
+                task: "asyncio.Task[None]" = asyncio.ensure_future(
+                    self.__respond(msg, request_id, connection)
                 )
-            except socket.error:
-                break
-        print(f"Lost connection to: {addr}")
-        conn.close()
+                connection.tasks.add(task)
+                task.add_done_callback(connection.tasks.discard)
 
-    def __parse_data(
+    async def __respond(
         self,
-        data: bytes,
-        conn: socket.socket,
-        addr: Tuple[int, int],
-        unparsed_messages: str,
-    ) -> str:
+        msg: Dict[str, Any],
+        request_id: Optional[int],
+        connection: _ClientConnection,
+    ) -> None:
         """
-        Parse JSON data and then handle it accordingly.
+        Handle one request, then send the response message back to the client.
+        A request that fails is logged and gets no response, so the client's other requests are still answered.
         """
-        package: List[str] = (unparsed_messages + data.decode()).split("$$")
-        # Loop through all messages before last message end symbol
-        for p in range(len(package) - 1):
-            msg: Dict[str, Any] = json.loads(package[p])
-            # Handle response then send response message back to client
-            response_msg: Dict[str, Any] = ResponseManager().handle_response(msg)
-            self.__send(msg=response_msg, conn=conn, addr=addr)
-        return package[-1]
+        try:
+            response_msg: Dict[str, Any] = await ResponseManager().handle_response(msg)
+            # Unknown requests get no response
+            if response_msg:
+                if request_id is not None:
+                    response_msg[REQUEST_ID] = request_id
+                await self.__send(msg=response_msg, connection=connection)
+        except Exception as e:
+            print(f"Failed to respond to {msg}: {e!r}")
 
     """
     def __handle_data(self, data, conn, addr) -> None:
@@ -1,4 +1,4 @@
-from threading import Condition
+import asyncio
 from typing import Dict, Any, Optional
 
 from common.client_server_protocols import update_elo_server_schema
@@ -14,10 +14,10 @@ class UpdateELOClientResponse(BaseClientResponse):
         """
         super().__init__(message=message)
         self._db_update_elo_success: Optional[bool] = None
-        self._db_complete_cv: Condition = Condition()
+        self._db_complete_cv: asyncio.Event = asyncio.Event()
         self._retrieved_dba: Optional[DatabaseAccount] = None
 
-    def respond(self) -> Dict[str, Any]:
+    async def respond(self) -> Dict[str, Any]:
         """
         Respond to the client through the server comms manager
         """
@@ -37,9 +37,9 @@ class UpdateELOClientResponse(BaseClientResponse):
         )
 
         # Wait for database to complete tasks
-        with self._db_complete_cv:
-            while self._db_update_elo_success is None:
-                self._db_complete_cv.wait()
+        await self._wait_for(
+            self._db_complete_cv, lambda: self._db_update_elo_success is not None
+        )
 
         # Return the response message
         self._response_message.update(
@@ -56,6 +56,5 @@ class UpdateELOClientResponse(BaseClientResponse):
         :param success: Whether elo was updated successfully
         """
         # Notify class that database has completed its task
-        with self._db_complete_cv:
-            self._db_update_elo_success = success
-            self._db_complete_cv.notify()
+        self._db_update_elo_success = success
+        self._notify(self._db_complete_cv)
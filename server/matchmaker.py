@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from threading import Lock, Condition
+from threading import Lock
 from typing import List, Tuple, Callable, Optional, Any
 
 
@@ -18,7 +18,6 @@ class Matchmaker:
     _users: List[MatchmakingUser] = []
     _pref_board_size: Optional[int] = None
     _match_lock: Lock = Lock()
-    _db_complete_cv: Condition = Condition()
     _db_matchmaker_create_game_success: Optional[bool] = None
     _db_matchmaker_retrieve_game_success: Optional[bool] = None
     _db_game_id: int = 0
@@ -0,0 +1,67 @@
+"""
+Times the AI's parallel root-split search at 1, 2, 4 and 8 worker processes on fixed midgame positions.
+The speedup is bounded by the number of cores on the machine.
+
+Run from the top level of the repository with:
+    python test/benchmark_parallel_search.py [difficulty]
+"""
+
+import os
+import random
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from client.model.ai import AI  # noqa: E402
+from client.model.game import Game  # noqa: E402
+from client.model.standard_rule import StandardRule  # noqa: E402
+
+
+def benchmark_positions() -> List[Game]:
+    """
+    Builds the same 8x8 midgame positions every run by playing seeded random moves.
+    """
+    games: List[Game] = []
+    rng = random.Random(9)
+    for num_moves in (10, 16, 22, 28):
+        game = Game(8, StandardRule())
+        for _ in range(num_moves):
+            game.place_tile(rng.choice(sorted(game.get_valid_move_flips())))
+        games.append(game)
+    return games
+
+
+def main() -> None:
+    difficulty: int = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    games: List[Game] = benchmark_positions()
+    warm_up = Game(8, StandardRule())
+    warm_up.place_tile(sorted(warm_up.get_valid_move_flips())[0])
+    print(f"{os.cpu_count()} cores, difficulty {difficulty}")
+    base_time: float = 0
+    for workers in (1, 2, 4, 8):
+        ai = AI()
+        # Book moves would be timed instead of searches
+        ai.use_opening_book = False
+        ai.difficulty = difficulty
+        ai.workers = workers
+        # Start the worker processes before timing, on a position with more than one move to search
+        ai.get_move(warm_up)
+        elapsed: float = 0
+        scores: List[int] = []
+        for game in games:
+            start_time = time.perf_counter()
+            ai.get_move(game)
+            elapsed += time.perf_counter() - start_time
+            scores.append(ai.last_score)
+        ai.close()
+        if workers == 1:
+            base_time = elapsed
+        print(
+            f"{workers} workers: {elapsed:.2f}s, speedup {base_time / elapsed:.2f}x, scores {scores}"
+        )
+
+
+if __name__ == "__main__":
+    main()
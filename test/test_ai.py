@@ -0,0 +1,264 @@
+import random
+import threading
+import time
+import unittest
+from typing import List
+
+from client.model.ai import AI, SearchCancelled
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+
+
+def fixed_positions() -> List[Game]:
+    """
+    Builds the same set of midgame positions every run by playing seeded random moves.
+    """
+    games: List[Game] = []
+    rng = random.Random(11)
+    for size, num_moves in ((8, 6), (8, 16), (8, 26), (6, 10)):
+        game = Game(size, StandardRule())
+        game.play_random_moves(rng, num_moves=num_moves)
+        games.append(game)
+    return games
+
+
+class TestAI(unittest.TestCase):
+    def test_alpha_beta_matches_minimax_with_fewer_nodes(self):
+        for game in fixed_positions():
+            for difficulty in (1, 2, 3):
+                minimax_ai = AI()
+                minimax_ai.alpha_beta = False
+                minimax_ai.difficulty = difficulty
+                alpha_beta_ai = AI()
+                alpha_beta_ai.use_opening_book = False
+                alpha_beta_ai.difficulty = difficulty
+                minimax_ai.get_move(game)
+                move = alpha_beta_ai.get_move(game)
+                self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+                self.assertEqual(alpha_beta_ai.last_score, minimax_ai.last_score)
+                self.assertLess(alpha_beta_ai.nodes_searched, minimax_ai.nodes_searched)
+
+    def test_transposition_table(self):
+        plain_nodes = 0
+        table_nodes = 0
+        for game in fixed_positions():
+            plain_ai = AI()
+            plain_ai.use_opening_book = False
+            plain_ai.transposition_table_size = 0
+            plain_ai.difficulty = 3
+            table_ai = AI()
+            table_ai.use_opening_book = False
+            table_ai.difficulty = 3
+            plain_ai.get_move(game)
+            table_ai.get_move(game)
+            self.assertEqual(table_ai.last_score, plain_ai.last_score)
+            plain_nodes += plain_ai.nodes_searched
+            table_nodes += table_ai.nodes_searched
+            # Searching the same game again reuses the table and is much cheaper
+            first_nodes = table_ai.nodes_searched
+            table_ai.get_move(game)
+            self.assertEqual(table_ai.last_score, plain_ai.last_score)
+            self.assertLess(table_ai.nodes_searched, first_nodes)
+        self.assertLess(table_nodes, plain_nodes)
+
+    def test_move_ordering(self):
+        plain_nodes = 0
+        ordered_nodes = 0
+        for game in fixed_positions():
+            plain_ai = AI()
+            plain_ai.use_opening_book = False
+            plain_ai.difficulty = 3
+            plain_ai.order_corners = False
+            plain_ai.order_killers = False
+            plain_ai.order_history = False
+            ordered_ai = AI()
+            ordered_ai.use_opening_book = False
+            ordered_ai.difficulty = 3
+            root_ordered_ai = AI()
+            root_ordered_ai.use_opening_book = False
+            root_ordered_ai.difficulty = 3
+            root_ordered_ai.root_ordering_depth = 2
+            plain_ai.get_move(game)
+            ordered_ai.get_move(game)
+            root_ordered_ai.get_move(game)
+            # Ordering only changes how much of the tree is searched, never the result
+            self.assertEqual(ordered_ai.last_score, plain_ai.last_score)
+            self.assertEqual(root_ordered_ai.last_score, plain_ai.last_score)
+            plain_nodes += plain_ai.nodes_searched
+            ordered_nodes += ordered_ai.nodes_searched
+            stats = ordered_ai.search_stats
+            self.assertEqual(
+                stats.cutoffs,
+                stats.table_move_cutoffs
+                + stats.corner_cutoffs
+                + stats.killer_cutoffs
+                + stats.history_cutoffs
+                + stats.unordered_cutoffs,
+            )
+        self.assertLess(ordered_nodes, plain_nodes)
+
+    def test_parallel_search(self):
+        serial_ai = AI()
+        serial_ai.use_opening_book = False
+        serial_ai.difficulty = 2
+        parallel_ai = AI()
+        parallel_ai.use_opening_book = False
+        parallel_ai.difficulty = 2
+        parallel_ai.workers = 2
+        try:
+            for game in fixed_positions():
+                move = parallel_ai.get_move(game)
+                serial_ai.get_move(game)
+                self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+                self.assertEqual(parallel_ai.last_score, serial_ai.last_score)
+        finally:
+            parallel_ai.close()
+
+    def test_parallel_search_settings(self):
+        # Workers search with the same evaluation and move ordering as the AI that started them
+        ais: List[AI] = []
+        for workers in (1, 2):
+            ai = AI()
+            ai.use_opening_book = False
+            ai.difficulty = 2
+            ai.use_patterns = False
+            ai.order_corners = False
+            ai.order_history = False
+            ai.transposition_table_size = 1024 * 1024
+            ai.workers = workers
+            ais.append(ai)
+        serial_ai, parallel_ai = ais
+        try:
+            for game in fixed_positions():
+                serial_ai.get_move(game)
+                parallel_ai.get_move(game)
+                self.assertEqual(parallel_ai.last_score, serial_ai.last_score)
+            # Changing a setting restarts the workers with it
+            serial_ai.use_patterns = True
+            parallel_ai.use_patterns = True
+            game = fixed_positions()[2]
+            serial_ai.get_move(game)
+            parallel_ai.get_move(game)
+            self.assertEqual(parallel_ai.last_score, serial_ai.last_score)
+        finally:
+            parallel_ai.close()
+
+    def test_get_move_leaves_game_unchanged(self):
+        game = fixed_positions()[1]
+        state = game.board.get_state()
+        num_moves = len(game.get_move_history())
+        ai = AI()
+        ai.difficulty = 2
+        ai.get_move(game)
+        self.assertEqual(game.board.get_state(), state)
+        self.assertEqual(len(game.get_move_history()), num_moves)
+
+    def test_time_limit(self):
+        game = fixed_positions()[1]
+        ai = AI()
+        ai.difficulty = 30
+        ai.time_limit = 0.2
+        start_time = time.perf_counter()
+        move = ai.get_move(game)
+        self.assertLess(time.perf_counter() - start_time, 1.0)
+        self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+
+    def test_game_clock(self):
+        game = Game(6, StandardRule())
+        ai = AI()
+        ai.game_time = 1.0
+        # The clock is spread over the moves the AI still has to make
+        self.assertAlmostEqual(ai.allocate_time(game), 1.0 / 16)
+        ai.time_limit = 0.01
+        self.assertEqual(ai.allocate_time(game), 0.01)
+        self.assertEqual(ai.allocate_time(game, time_limit=0.02), 0.02)
+        ai.time_limit = None
+        start_time = time.perf_counter()
+        while not game.is_game_over():
+            if game.curr_player == 1:
+                ai.place_tile(game)
+            else:
+                game.place_tile(sorted(game.get_valid_move_flips())[0])
+        self.assertLess(time.perf_counter() - start_time, 1.5)
+        self.assertLess(ai.clock_remaining, 1.0)
+        # A new game restarts the clock
+        ai.get_move(Game(6, StandardRule()))
+        self.assertGreater(ai.clock_remaining, 0.5)
+
+    def test_pondering(self):
+        game = fixed_positions()[1]
+        ai = AI()
+        ai.use_opening_book = False
+        ai.difficulty = 2
+        ai.place_tile(game)
+        ai.start_pondering(game)
+        start_time = time.perf_counter()
+        while ai.is_pondering and time.perf_counter() - start_time < 10:
+            time.sleep(0.01)
+        self.assertFalse(ai.is_pondering)
+        # Every reply was searched in the background, so the answer needs no search
+        game.place_tile(sorted(game.get_valid_move_flips())[0])
+        fresh_ai = AI()
+        fresh_ai.use_opening_book = False
+        fresh_ai.difficulty = 2
+        fresh_ai.get_move(game)
+        move = ai.get_move(game)
+        self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+        self.assertEqual(ai.ponder_hits, 1)
+        self.assertEqual(ai.nodes_searched, 0)
+        self.assertEqual(ai.last_score, fresh_ai.last_score)
+
+    def test_stop_pondering(self):
+        game = Game(8, StandardRule())
+        ai = AI()
+        ai.use_opening_book = False
+        ai.difficulty = 30
+        ai.start_pondering(game)
+        time.sleep(0.1)
+        self.assertTrue(ai.is_pondering)
+        start_time = time.perf_counter()
+        ai.stop_pondering()
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+        self.assertFalse(ai.is_pondering)
+        # A search given up on is not used
+        ai.difficulty = 1
+        ai.get_move(game)
+        self.assertEqual(ai.ponder_hits, 0)
+
+    def test_cancel(self):
+        game = Game(8, StandardRule())
+        ai = AI()
+        ai.use_opening_book = False
+        ai.difficulty = 30
+        results = []
+
+        def search():
+            try:
+                results.append(ai.get_move(game))
+            except SearchCancelled:
+                results.append(None)
+
+        thread = threading.Thread(target=search)
+        thread.start()
+        time.sleep(0.1)
+        start_time = time.perf_counter()
+        ai.cancel()
+        thread.join()
+        self.assertLess(time.perf_counter() - start_time, 0.5)
+        self.assertEqual(results, [None])
+        # The next search is not affected
+        ai.difficulty = 1
+        move = ai.get_move(game)
+        self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+
+    def test_set_level(self):
+        ai = AI()
+        ai.set_level(1)
+        self.assertEqual(ai.difficulty, 1)
+        self.assertEqual(ai.time_limit, AI.LEVEL_TIME_LIMITS[1])
+        ai.set_level(100)
+        self.assertEqual(ai.time_limit, AI.LEVEL_TIME_LIMITS[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
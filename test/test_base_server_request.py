@@ -0,0 +1,80 @@
+import threading
+import time
+import unittest
+from concurrent.futures import Future
+from typing import Tuple
+from unittest import mock
+
+from client.server_comms.base_server_request import BaseServerRequest
+from client.server_comms.client_comms_manager import ClientCommsManager
+from client.server_comms.update_elo_server_request import UpdateELOServerRequest
+
+
+def send(server_request: BaseServerRequest) -> Tuple[Future, Future]:
+    """
+    Send a request without a server.
+
+    :return: the client comms manager's future for the request, for the test to complete, and the request's future
+    """
+    sent: Future = Future()
+    with mock.patch.object(ClientCommsManager, "send", return_value=sent):
+        return sent, server_request.send()
+
+
+class TestBaseServerRequest(unittest.TestCase):
+    def test_response(self):
+        server_request = UpdateELOServerRequest(1, 1000)
+        sent, future = send(server_request)
+        self.assertFalse(future.done())
+        self.assertIsNone(server_request.is_response_success())
+
+        # The response arrives on the comms manager's thread while the caller waits
+        threading.Timer(
+            0.1, sent.set_result, ({"protocol_type": "update_elo", "success": True},)
+        ).start()
+        start_time = time.perf_counter()
+        self.assertTrue(server_request.wait_for_response(5))
+        self.assertLess(time.perf_counter() - start_time, 5)
+        self.assertTrue(future.result())
+        self.assertTrue(server_request.is_response_success())
+
+    def test_failed_response(self):
+        server_request = UpdateELOServerRequest(1, 1000)
+        # Lost connection, then a response that does not match the schema
+        for error, response in (
+            (ConnectionError("Lost connection to the server"), None),
+            (None, {"protocol_type": "update_elo"}),
+        ):
+            sent, future = send(server_request)
+            self.assertFalse(future.done())
+            if error is not None:
+                sent.set_exception(error)
+            else:
+                sent.set_result(response)
+            self.assertTrue(server_request.wait_for_response(0))
+            self.assertFalse(future.result())
+            self.assertFalse(server_request.is_response_success())
+
+    def test_late_response(self):
+        server_request = UpdateELOServerRequest(1, 1000)
+        first_sent, first_future = send(server_request)
+        second_sent, second_future = send(server_request)
+        # The response to the first send does not answer the second
+        first_sent.set_result({"protocol_type": "update_elo", "success": True})
+        self.assertTrue(first_future.result(0))
+        self.assertFalse(second_future.done())
+        self.assertFalse(server_request.wait_for_response(0))
+        self.assertIsNone(server_request.is_response_success())
+        second_sent.set_result({"protocol_type": "update_elo", "success": False})
+        self.assertTrue(server_request.wait_for_response(0))
+        self.assertFalse(server_request.is_response_success())
+
+    def test_timeout(self):
+        server_request = UpdateELOServerRequest(1, 1000)
+        send(server_request)
+        self.assertFalse(server_request.wait_for_response(0.05))
+        self.assertIsNone(server_request.is_response_success())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+
+from client.model.bit_board import BitBoard
+from client.model.board import Board
+from client.model.cell import CellState
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+
+
+class TestBitBoard(unittest.TestCase):
+    def test_init_matches_board(self):
+        for size in (2, 4, 6, 8, 10):
+            self.assertEqual(BitBoard(size).get_state(), Board(size).get_state())
+
+    def test_saved_state(self):
+        saved_state = [[0, 1, 2, 0], [2, 2, 1, 0], [0, 1, 1, 0], [0, 0, 0, 2]]
+        self.assertEqual(
+            BitBoard(4, saved_state).get_state(), Board(4, saved_state).get_state()
+        )
+
+    def test_get_num_type(self):
+        board_4 = BitBoard(4)
+        self.assertEqual(board_4.get_num_type(CellState.empty), 12)
+        self.assertEqual(board_4.get_num_type(CellState.player1), 2)
+        self.assertEqual(board_4.get_num_type(CellState.player2), 2)
+
+    def test_cells_view(self):
+        board = BitBoard(4)
+        self.assertEqual(board.cells[1][2].state, CellState.player1)
+        board.cells[0][0].fill(2)
+        self.assertEqual(board.get_cell_state(0, 0), CellState.player2)
+        board.cells[1][2].flip()
+        self.assertEqual(board.get_cell_state(1, 2), CellState.player2)
+        self.assertEqual(board.get_num_type(CellState.player2), 4)
+
+    def test_board_methods(self):
+        # Methods BitBoard inherits from Board work on the disk masks, not Board's state bytes
+        board = BitBoard(4)
+        Board.apply_move(board, 1, (0, 1), [(1, 1)])
+        expected = Board(4)
+        expected.apply_move(1, (0, 1), [(1, 1)])
+        self.assertEqual(board.get_state(), expected.get_state())
+        self.assertEqual(board.get_num_type(CellState.player1), 4)
+        self.assertEqual(board.zobrist_hash, expected.zobrist_hash)
+        self.assertEqual(board.zobrist_hash, board.compute_hash())
+
+    def test_games_match_board(self):
+        # Play random games on both board types and check move generation and flipping always agree
+        rng = random.Random(7)
+        for size in (4, 6, 8):
+            for _ in range(2):
+                game = Game(size, StandardRule())
+                bit_game = Game(size, StandardRule())
+                game.board = Board(size)
+                self.assertIsInstance(bit_game.board, BitBoard)
+                while not game.is_game_over():
+                    self.assertEqual(game.get_valid_moves(), bit_game.get_valid_moves())
+                    moves = [
+                        (x, y)
+                        for x in range(size)
+                        for y in range(size)
+                        if game.get_valid_moves()[x][y]
+                    ]
+                    move = rng.choice(moves)
+                    self.assertTrue(game.place_tile(move))
+                    self.assertTrue(bit_game.place_tile(move))
+                    self.assertEqual(game.board.get_state(), bit_game.board.get_state())
+                    self.assertEqual(
+                        game.board.get_empty_posns(), bit_game.board.get_empty_posns()
+                    )
+                    for state in CellState:
+                        self.assertEqual(
+                            game.board.get_num_type(state),
+                            bit_game.board.get_num_type(state),
+                        )
+                    self.assertEqual(game.curr_player, bit_game.curr_player)
+                self.assertTrue(bit_game.is_game_over())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+from client.model.bit_board import BitBoard
 from client.model.board import Board
 from client.model.cell import CellState
 
@@ -57,6 +58,59 @@ class TestBoard(unittest.TestCase):
         self.assertEqual(board_2.get_num_type(CellState.player1), 2)
         self.assertEqual(board_2.get_num_type(CellState.player2), 2)
 
+    def test_counts_follow_cells(self):
+        board_4 = Board(4)
+        board_4.cells[0][0].fill(1)
+        board_4.cells[1][1].flip()
+        self.assertEqual(board_4.get_num_type(CellState.empty), 11)
+        self.assertEqual(board_4.get_num_type(CellState.player1), 4)
+        self.assertEqual(board_4.get_num_type(CellState.player2), 1)
+        self.assertNotIn((0, 0), board_4.get_empty_posns())
+        board_4.undo_move(1, (0, 0), [(1, 1)])
+        self.assertEqual(board_4.get_num_type(CellState.empty), 12)
+        self.assertEqual(board_4.get_num_type(CellState.player2), 2)
+        self.assertEqual(
+            board_4.get_empty_posns(),
+            [
+                (x, y)
+                for x in range(4)
+                for y in range(4)
+                if board_4.cells[x][y].state == CellState.empty
+            ],
+        )
+
+    def test_saved_state_counts(self):
+        board_4 = Board(4, [[0, 1, 2, 0], [2, 2, 1, 0], [0, 1, 1, 0], [0, 0, 0, 2]])
+        self.assertEqual(board_4.get_num_type(CellState.empty), 8)
+        self.assertEqual(board_4.get_num_type(CellState.player1), 4)
+        self.assertEqual(board_4.get_num_type(CellState.player2), 4)
+        self.assertEqual(board_4.get_empty_posns()[:3], [(0, 0), (0, 3), (1, 3)])
+
+    def test_compact_storage(self):
+        board_4 = Board(4)
+        self.assertFalse(hasattr(board_4, "__dict__"))
+        self.assertEqual(len(board_4._states), 16)
+        # Cells are views, so changing one changes the board. They are built once
+        self.assertIs(board_4.cells, board_4.cells)
+        board_4.cells[3][3].fill(2)
+        self.assertEqual(board_4.get_cell_state(3, 3), CellState.player2)
+        self.assertEqual(board_4.get_discs(2), 1 << 5 | 1 << 10 | 1 << 15)
+        board_4.cells = Board(4).cells
+        self.assertEqual(board_4.get_state(), Board(4).get_state())
+
+    def test_hash_follows_cells(self):
+        # Board and BitBoard keep the same hash however their cells are changed
+        for board_4 in (Board(4), BitBoard(4)):
+            board_4.set_cell_state(0, 0, CellState.player1)
+            board_4.cells[1][1].flip()
+            board_4.cells[2][1].state = CellState.empty
+            self.assertEqual(board_4.zobrist_hash, board_4.compute_hash())
+            self.assertEqual(
+                board_4.zobrist_hash, Board(4, board_4.get_state()).zobrist_hash
+            )
+            board_4.cells = Board(4).cells
+            self.assertEqual(board_4.zobrist_hash, Board(4).zobrist_hash)
+
 
 if __name__ == "__main__":
     unittest.main()
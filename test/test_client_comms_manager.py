@@ -0,0 +1,147 @@
+import socket
+import threading
+import unittest
+from concurrent.futures import Future
+from queue import Queue
+from typing import Any, Dict, List, Tuple
+
+from client.server_comms.client_comms_manager import ClientCommsManager
+from common.framing import (
+    FRAMING_VERSION,
+    LEGACY_VERSION,
+    REQUEST_ID,
+    Framing,
+    create_framing,
+)
+
+
+class TestClientCommsManager(unittest.TestCase):
+    def setUp(self):
+        # A manager of its own rather than the singleton, which other tests leave running, with its own connection
+        # and request state
+        self.manager = object.__new__(ClientCommsManager)
+        self.client, self.server = socket.socketpair()
+        self.server.settimeout(5)
+        self.callbacks: List[Tuple[bool, Any]] = []
+        self.callback_cv: threading.Condition = threading.Condition()
+        self.manager._client = self.client
+        self.manager._pending = {}
+        self.manager._callback_map = {}
+        self.manager._send_queue = Queue()
+        self.manager._connected_to_server = True
+
+    def tearDown(self):
+        self.client.close()
+        self.server.close()
+
+    def connect(self, version: int) -> Framing:
+        """
+        Start reading responses on the connection as the client would after negotiating the framing version.
+
+        :return: framing for the server's end of the connection
+        """
+        self.manager._framing = create_framing(version)
+        self.reader = threading.Thread(
+            target=self.manager._ClientCommsManager__receive,
+            args=(self.client, self.manager._framing),
+            daemon=True,
+        )
+        self.reader.start()
+        return create_framing(version)
+
+    def send(self, message: Dict[str, Any], response_protocol_type: str) -> Future:
+        future: Future = self.manager.send(
+            message, response_protocol_type, self.callback
+        )
+        self.manager._ClientCommsManager__send()
+        return future
+
+    def callback(self, success: bool, response: Any) -> None:
+        with self.callback_cv:
+            self.callbacks.append((success, response))
+            self.callback_cv.notify_all()
+
+    def wait_for_callbacks(self, count: int) -> List[Tuple[bool, Any]]:
+        """
+        Callbacks run on the reader thread once a future is done, so wait for them to finish.
+        """
+        with self.callback_cv:
+            self.callback_cv.wait_for(lambda: len(self.callbacks) >= count, 5)
+            return list(self.callbacks)
+
+    def receive(self, framing: Framing, count: int) -> List[Dict[str, Any]]:
+        """
+        Read requests at the server's end of the connection.
+        """
+        requests: List[bytes] = []
+        while len(requests) < count:
+            requests += framing.feed(self.server.recv(1024))
+        return [framing.decode_message(request) for request in requests]
+
+    def test_responses_out_of_order(self):
+        framing = self.connect(FRAMING_VERSION)
+        futures = [
+            self.send({"protocol_type": "get_game", "game_id": game_id}, "get_game")
+            for game_id in range(3)
+        ]
+        requests = self.receive(framing, 3)
+        self.assertEqual(len({request[REQUEST_ID] for request in requests}), 3)
+        # Answer the last request first. Each response completes the request with its ID
+        for request in reversed(requests):
+            self.server.sendall(
+                framing.encode_message(
+                    {
+                        "protocol_type": "get_game",
+                        "game_id": request["game_id"],
+                        REQUEST_ID: request[REQUEST_ID],
+                    }
+                )
+            )
+            future = futures[request["game_id"]]
+            self.assertEqual(
+                future.result(5),
+                {"protocol_type": "get_game", "game_id": request["game_id"]},
+            )
+        self.assertEqual(
+            [response["game_id"] for _, response in self.wait_for_callbacks(3)],
+            [2, 1, 0],
+        )
+
+    def test_legacy_responses(self):
+        framing = self.connect(LEGACY_VERSION)
+        first = self.send({"protocol_type": "get_game", "game_id": 1}, "get_game")
+        second = self.send({"protocol_type": "get_game", "game_id": 2}, "get_game")
+        elos = self.send({"protocol_type": "get_top_elos"}, "get_top_elos")
+        # Legacy servers get no request IDs
+        for request in self.receive(framing, 3):
+            self.assertNotIn(REQUEST_ID, request)
+        # Responses without an ID complete the oldest request of their protocol type
+        for response in (
+            {"protocol_type": "get_top_elos", "top_elos": []},
+            {"protocol_type": "get_game", "game_id": 1},
+            {"protocol_type": "get_game", "game_id": 2},
+        ):
+            self.server.sendall(framing.encode_message(response))
+        self.assertEqual(elos.result(5)["top_elos"], [])
+        self.assertEqual(first.result(5)["game_id"], 1)
+        self.assertEqual(second.result(5)["game_id"], 2)
+
+    def test_connection_lost(self):
+        framing = self.connect(FRAMING_VERSION)
+        waiting = self.send({"protocol_type": "get_game"}, "get_game")
+        cancelled = self.send({"protocol_type": "get_game"}, "get_game")
+        self.receive(framing, 2)
+        self.assertTrue(cancelled.cancel())
+        self.server.close()
+        with self.assertRaises(ConnectionError):
+            waiting.result(5)
+        self.reader.join(5)
+        self.assertTrue(cancelled.cancelled())
+        # Only the request still waiting is told it failed
+        self.assertEqual(self.wait_for_callbacks(1), [(False, "get_game")])
+        self.assertFalse(self.manager._connected_to_server)
+        self.assertEqual(self.manager._pending, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import random
+import time
+import unittest
+from typing import List
+
+from client.model.ai import AI
+from client.model.board import Board
+from client.model.endgame import EndgameSolver, SolverTimeout
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+
+
+def solve_slowly(game: Game) -> int:
+    """
+    Final disk difference for the player to move with perfect play, by plain negamax over Game moves.
+    """
+    moves = game.get_valid_move_flips()
+    if len(moves) == 0:
+        player1_score, player2_score = game.get_score()
+        if game.curr_player == 1:
+            return player1_score - player2_score
+        return player2_score - player1_score
+    best_score = -game.board.size**2
+    for posn, flips in moves.items():
+        player = game.curr_player
+        record = game.make_move(posn, flips)
+        assert record is not None
+        score = solve_slowly(game)
+        if game.curr_player != player:
+            score = -score
+        game.unmake_move(record)
+        best_score = max(best_score, score)
+    return best_score
+
+
+def endgame_positions(num_empty: int) -> List[Game]:
+    """
+    Builds the same set of positions with num_empty empty cells every run by playing seeded random moves.
+    """
+    games: List[Game] = []
+    rng = random.Random(num_empty)
+    for size in (4, 6, 8, 8):
+        game = Game(size, StandardRule())
+        game.play_random_moves(rng, num_empty=num_empty)
+        if not game.is_game_over():
+            games.append(game)
+    return games
+
+
+class TestEndgameSolver(unittest.TestCase):
+    def test_solve_matches_negamax(self):
+        for game in endgame_positions(7):
+            solver = EndgameSolver(game.board.size)
+            expected = solve_slowly(game)
+            score, move = solver.solve(game)
+            self.assertEqual(score, expected)
+            self.assertEqual(
+                solver.solve(game, exact=False)[0], (expected > 0) - (expected < 0)
+            )
+            # The move found gets the solved result
+            player = game.curr_player
+            game.place_tile(move)
+            after = solve_slowly(game)
+            self.assertEqual(after if game.curr_player == player else -after, score)
+
+    def test_table_size(self):
+        game = endgame_positions(12)[0]
+        expected = EndgameSolver(game.board.size).solve(game)
+        # A table that holds only a few positions is emptied as it fills, without changing the result
+        solver = EndgameSolver(
+            game.board.size, max_bytes=10 * EndgameSolver._ENTRY_BYTES
+        )
+        self.assertEqual(solver.solve(game), expected)
+        self.assertLessEqual(len(solver._table), 10)
+
+    def test_solve_list_board(self):
+        game = endgame_positions(6)[2]
+        list_game = Game(game.board.size, StandardRule())
+        list_game.board = Board(game.board.size, game.board.get_state())
+        list_game.curr_player = game.curr_player
+        solver = EndgameSolver(game.board.size)
+        self.assertEqual(solver.solve(list_game), solver.solve(game))
+
+    def test_deadline(self):
+        game = endgame_positions(24)[-1]
+        with self.assertRaises(SolverTimeout):
+            EndgameSolver(8).solve(game, deadline=time.perf_counter() + 0.05)
+
+    def test_ai_plays_solved_move(self):
+        for game in endgame_positions(8):
+            ai = AI()
+            ai.difficulty = 0
+            ai.endgame_empties = 8
+            move = ai.get_move(game)
+            expected = solve_slowly(game)
+            self.assertEqual(ai.last_score > 0, expected > 0)
+            player = game.curr_player
+            game.place_tile(move)
+            after = solve_slowly(game)
+            self.assertEqual(after if game.curr_player == player else -after, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import unittest
+
+from client.model.evaluation import (
+    evaluate_batch,
+    evaluate_masks,
+    get_weight_classes,
+    get_weight_table,
+)
+
+
+class TestEvaluation(unittest.TestCase):
+    def test_weight_table(self):
+        table = get_weight_table(8)
+        self.assertEqual(len(table), 64)
+        weights = {
+            (0, 0): 1000,
+            (7, 7): 1000,
+            (0, 1): -1000,
+            (1, 1): -1000,
+            (6, 7): -1000,
+            (0, 2): 50,
+            (5, 0): 50,
+            (3, 3): 20,
+            (4, 4): 20,
+            (2, 2): 1,
+            (1, 4): 1,
+        }
+        for (x, y), weight in weights.items():
+            self.assertEqual(table[x * 8 + y], weight)
+        # Every cell is in exactly one weight class
+        masks = [mask for _, mask in get_weight_classes(8)]
+        self.assertEqual(sum(masks), (1 << 64) - 1)
+
+    def test_evaluate_masks_and_batch(self):
+        rng = random.Random(8)
+        for size in (4, 6, 8, 10):
+            table = get_weight_table(size)
+            own_masks = []
+            opp_masks = []
+            expected = []
+            for _ in range(20):
+                own = 0
+                opp = 0
+                score = 0
+                for index in range(size * size):
+                    owner = rng.randrange(3)
+                    if owner == 1:
+                        own |= 1 << index
+                        score += table[index]
+                    elif owner == 2:
+                        opp |= 1 << index
+                        score -= table[index]
+                own_masks.append(own)
+                opp_masks.append(opp)
+                expected.append(score)
+                self.assertEqual(evaluate_masks(own, opp, size), score)
+            self.assertEqual(
+                evaluate_batch(own_masks, opp_masks, size).tolist(), expected
+            )
+        self.assertEqual(len(evaluate_batch([], [], 8)), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import json
+import unittest
+
+from common.framing import (
+    FRAMING_VERSION,
+    CompactFraming,
+    MAX_FRAME_SIZE,
+    FramingError,
+    LegacyFraming,
+    LengthPrefixFraming,
+    create_framing,
+    decode_hello,
+    encode_hello,
+)
+
+
+class TestFraming(unittest.TestCase):
+    def test_hello(self):
+        self.assertEqual(decode_hello(encode_hello()), FRAMING_VERSION)
+        self.assertEqual(decode_hello(encode_hello(0)), 0)
+        # Legacy messages are not hellos
+        self.assertIsNone(decode_hello(b'{"pr'))
+        self.assertIsNone(decode_hello(encode_hello()[:-1]))
+
+    def test_create_framing(self):
+        self.assertIsInstance(create_framing(0), LegacyFraming)
+        self.assertIsInstance(create_framing(1), LengthPrefixFraming)
+        self.assertIsInstance(create_framing(2), CompactFraming)
+        with self.assertRaises(FramingError):
+            create_framing(FRAMING_VERSION + 1)
+
+    def test_split_reads(self):
+        messages = [
+            json.dumps({"protocol_type": "save_game", "board_state": [[0] * 20] * 20}),
+            json.dumps({"protocol_type": "get_game", "username": "é$"}),
+            "{}",
+        ]
+        payloads = [message.encode() for message in messages]
+        for framing_type in (LengthPrefixFraming, LegacyFraming):
+            data = b"".join(framing_type().encode(payload) for payload in payloads)
+            # All at once, byte by byte, and in uneven reads
+            for read_size in (len(data), 1, 7, 2048):
+                framing = framing_type()
+                received = []
+                for start in range(0, len(data), read_size):
+                    received += framing.feed(data[start : start + read_size])
+                self.assertEqual(received, payloads, (framing_type, read_size))
+
+    def test_delimiter_in_message(self):
+        payload = json.dumps({"username": "a$$b"}).encode()
+        framing = LengthPrefixFraming()
+        self.assertEqual(framing.feed(framing.encode(payload)), [payload])
+        # The reason for length-prefixed frames
+        framing = LegacyFraming()
+        self.assertNotEqual(framing.feed(framing.encode(payload)), [payload])
+
+    def test_messages(self):
+        message = {"protocol_type": "get_game", "board_state": [[0, 1], [2, 0]]}
+        for version in range(FRAMING_VERSION + 1):
+            framing = create_framing(version)
+            encoded = framing.encode_message(message)
+            self.assertEqual(
+                [framing.decode_message(data) for data in framing.feed(encoded)],
+                [message],
+            )
+        # Compact messages are smaller
+        self.assertLess(
+            len(CompactFraming().encode_message(message)),
+            len(LengthPrefixFraming().encode_message(message)),
+        )
+        with self.assertRaises(ValueError):
+            CompactFraming().decode_message(b"\x03\x02")
+
+    def test_frame_too_large(self):
+        framing = LengthPrefixFraming()
+        with self.assertRaises(FramingError):
+            framing.feed((MAX_FRAME_SIZE + 1).to_bytes(4, "big"))
+        with self.assertRaises(FramingError):
+            framing.encode(bytes(MAX_FRAME_SIZE + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+from client.model.board import Board
+from client.model.cell import CellState
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+
+
+class TestGame(unittest.TestCase):
+    def test_make_unmake_move(self):
+        rng = random.Random(5)
+        for size in (4, 6, 8):
+            for list_board in (False, True):
+                game = Game(size, StandardRule())
+                if list_board:
+                    game.board = Board(size)
+                records = []
+                states = []
+                while not game.is_game_over():
+                    states.append(
+                        (game.board.get_state(), game.curr_player, game.get_hash())
+                    )
+                    move = rng.choice(sorted(game.get_valid_move_flips()))
+                    record = game.make_move(move)
+                    self.assertIsNotNone(record)
+                    records.append(record)
+                    # The incrementally updated hash matches one computed from scratch
+                    self.assertEqual(game.board.zobrist_hash, game.board.compute_hash())
+                self.assertEqual(game.get_move_history(), records)
+                # Undo the whole game and check every earlier position is restored exactly
+                while records:
+                    game.unmake_move(records.pop())
+                    self.assertEqual(
+                        (game.board.get_state(), game.curr_player, game.get_hash()),
+                        states.pop(),
+                    )
+                self.assertEqual(game.board.get_state(), Board(size).get_state())
+
+    def test_get_hash(self):
+        game = Game(8, StandardRule())
+        self.assertEqual(game.get_hash(), Game(8, StandardRule()).get_hash())
+        self.assertEqual(
+            game.board.zobrist_hash, Board(8, game.board.get_state()).zobrist_hash
+        )
+        # The same disks with a different player to move hash differently
+        start_hash = game.get_hash()
+        game.curr_player = 2
+        self.assertNotEqual(game.get_hash(), start_hash)
+        # The same position reached by different move orders hashes the same
+        first = Game(8, StandardRule())
+        second = Game(8, StandardRule())
+        for move in ((2, 3), (2, 2), (3, 2), (4, 5)):
+            first.place_tile(move)
+        for move in ((3, 2), (2, 2), (2, 3), (4, 5)):
+            second.place_tile(move)
+        self.assertEqual(first.board.get_state(), second.board.get_state())
+        self.assertEqual(first.get_hash(), second.get_hash())
+
+    def test_position_round_trip(self):
+        game = Game(6, StandardRule())
+        for move in ((1, 2), (1, 1), (1, 0)):
+            game.place_tile(move)
+        copy = Game.from_position(game.get_position(), StandardRule())
+        self.assertEqual(copy.board.get_state(), game.board.get_state())
+        self.assertEqual(copy.curr_player, game.curr_player)
+        self.assertEqual(copy.get_hash(), game.get_hash())
+
+    def test_make_move_invalid(self):
+        game = Game(4, StandardRule())
+        self.assertIsNone(game.make_move((0, 0)))
+        self.assertEqual(game.get_move_history(), [])
+        with self.assertRaises(Exception):
+            game.make_move((4, 0))
+
+    def test_unmake_move_out_of_order(self):
+        game = Game(8, StandardRule())
+        first = game.make_move((2, 3))
+        self.assertIsNotNone(first)
+        self.assertIsNotNone(game.make_move(sorted(game.get_valid_move_flips())[0]))
+        with self.assertRaises(Exception):
+            game.unmake_move(first)
+
+    def test_play_random_moves(self):
+        games = [Game(8, StandardRule()) for _ in range(2)]
+        for game in games:
+            game.play_random_moves(random.Random(3), num_moves=10)
+        self.assertEqual(len(games[0].get_move_history()), 10)
+        self.assertEqual(games[0].board.get_state(), games[1].board.get_state())
+        game = Game(8, StandardRule())
+        game.play_random_moves(random.Random(3), num_empty=20)
+        self.assertEqual(game.board.get_num_type(CellState.empty), 20)
+        # Stops when the game ends rather than looking for a move that does not exist
+        for seed in range(20):
+            game = Game(4, StandardRule())
+            game.play_random_moves(random.Random(seed), num_moves=100)
+            self.assertTrue(game.is_game_over())
+
+
+if __name__ == "__main__":
+    unittest.main()
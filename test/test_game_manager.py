@@ -0,0 +1,23 @@
+import unittest
+
+from client.model.game_manager import GameManager
+from client.model.player import Player
+from client.model.user import User
+
+
+class TestGameManager(unittest.TestCase):
+    def test_close(self):
+        ai = GameManager.create_ai()
+        ai.use_opening_book = False
+        ai.workers = 2
+        user = User("user")
+        # The AI moves first, starting its worker processes
+        game_manager = GameManager(ai, Player(user), user)
+        self.assertEqual(len(game_manager.game.get_move_history()), 1)
+        self.assertIsNotNone(ai._AI__parallel_searcher)
+        game_manager.close()
+        self.assertIsNone(ai._AI__parallel_searcher)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import random
+import unittest
+
+import numpy as np
+
+from client.model.endgame import EndgameSolver
+from client.model.game import Game
+from client.model.game_manager import GameManager
+from client.model.mcts_ai import MCTSAI, batch_playouts, random_playout
+from client.model.standard_rule import StandardRule
+
+
+def position_with_empties(size: int, num_empty: int, seed: int) -> Game:
+    """
+    Plays seeded random moves until the board has num_empty empty cells.
+    """
+    game = Game(size, StandardRule())
+    game.play_random_moves(random.Random(seed), num_empty=num_empty)
+    if game.is_game_over():
+        raise ValueError(f"Game with seed {seed} ended before {num_empty} empties")
+    return game
+
+
+class TestMCTSAI(unittest.TestCase):
+    def test_playouts_with_one_empty_cell(self):
+        # With one empty cell the game has only one way to end, so every playout must give the solved result
+        for size, seed in ((4, 1), (6, 2), (8, 3), (8, 4)):
+            game = position_with_empties(size, 1, seed)
+            _, player1_discs, player2_discs, player = game.get_position()
+            solved = EndgameSolver(size).solve(game)[0]
+            expected = solved if player == 1 else -solved
+            self.assertEqual(
+                random_playout(
+                    player1_discs, player2_discs, player, size, random.Random(0)
+                ),
+                expected,
+            )
+            self.assertEqual(
+                batch_playouts(
+                    player1_discs,
+                    player2_discs,
+                    player,
+                    size,
+                    4,
+                    np.random.default_rng(0),
+                ).tolist(),
+                [expected] * 4,
+            )
+
+    def test_batch_playouts_match_random_playouts(self):
+        game = position_with_empties(8, 5, 5)
+        _, player1_discs, player2_discs, player = game.get_position()
+        rng = random.Random(0)
+        scalar_results = {
+            random_playout(player1_discs, player2_discs, player, 8, rng)
+            for _ in range(500)
+        }
+        batch_results = set(
+            batch_playouts(
+                player1_discs, player2_discs, player, 8, 500, np.random.default_rng(0)
+            ).tolist()
+        )
+        self.assertEqual(batch_results, scalar_results)
+
+    def test_get_move(self):
+        for batch_size in (1, 16):
+            game = position_with_empties(6, 20, 6)
+            ai = MCTSAI()
+            ai.seed(1)
+            ai.playouts = 200
+            ai.batch_size = batch_size
+            move = ai.get_move(game)
+            self.assertTrue(game.get_valid_moves()[move[0]][move[1]])
+            self.assertGreaterEqual(ai.playouts_run, 200)
+            self.assertLess(ai.playouts_run, 200 + batch_size)
+
+    def test_forced_move_not_searched(self):
+        ai = MCTSAI()
+        ai.seed(1)
+        ai.playouts = 200
+        ai.get_move(position_with_empties(6, 20, 6))
+        self.assertGreater(ai.nodes_searched, 0)
+        # The only valid move is played without a search
+        game = position_with_empties(6, 6, 0)
+        self.assertEqual(len(game.get_valid_move_flips()), 1)
+        ai.get_move(game)
+        self.assertEqual(ai.playouts_run, 0)
+        self.assertEqual(ai.nodes_searched, 0)
+
+    def test_finds_solved_move(self):
+        for seed in (7, 8, 9):
+            game = position_with_empties(6, 6, seed)
+            if len(game.get_valid_move_flips()) < 2:
+                continue
+            best_score = EndgameSolver(6).solve(game)[0]
+            ai = MCTSAI()
+            ai.seed(seed)
+            ai.playouts = 3000
+            move = ai.get_move(game)
+            player = game.curr_player
+            game.place_tile(move)
+            score = EndgameSolver(6).solve(game)[0]
+            if game.curr_player != player:
+                score = -score
+            # MCTS plays for the win, not for the biggest disk difference
+            self.assertEqual(
+                (score > 0) - (score < 0), (best_score > 0) - (best_score < 0)
+            )
+
+    def test_game_manager_engines(self):
+        self.assertIsInstance(GameManager.create_ai("mcts", 2), MCTSAI)
+        self.assertNotIsInstance(GameManager.create_ai(), MCTSAI)
+        with self.assertRaises(KeyError):
+            GameManager.create_ai("unknown")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+from client.model.ai import AI
+from client.model.game import Game
+from client.model.opening_book import OpeningBook, build_book, write_book
+from client.model.standard_rule import StandardRule
+from client.model.symmetry import get_symmetries
+
+
+def symmetric_games(game: Game):
+    """
+    Builds the 8 symmetric versions of a game's position.
+    """
+    size = game.board.size
+    games = []
+    for permutation in get_symmetries(size):
+        discs = []
+        for player in (1, 2):
+            mask = game.board.get_discs(player)
+            discs.append(
+                sum(1 << permutation[i] for i in range(size * size) if mask >> i & 1)
+            )
+        games.append(
+            Game.from_position(
+                (size, discs[0], discs[1], game.curr_player), StandardRule()
+            )
+        )
+    return games
+
+
+class TestOpeningBook(unittest.TestCase):
+    def test_write_and_lookup(self):
+        entries = build_book(6, 4, 1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.bin")
+            write_book(path, 6, entries)
+            book = OpeningBook(path)
+            try:
+                self.assertEqual(len(book), len(entries))
+                game = Game(6, StandardRule())
+                for move in ((1, 2), (1, 1)):
+                    game.place_tile(move)
+                # Every symmetric version of a book position gets a valid move from the book
+                for symmetric_game in symmetric_games(game):
+                    book_move = book.lookup(symmetric_game)
+                    self.assertIsNotNone(book_move)
+                    self.assertIn(book_move[0], symmetric_game.get_valid_move_flips())
+                self.assertIsNone(book.lookup(Game(8, StandardRule())))
+            finally:
+                book.close()
+
+    def test_not_a_book(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "book.bin")
+            with open(path, "wb") as book_file:
+                book_file.write(b"not a book file")
+            with self.assertRaises(ValueError):
+                OpeningBook(path)
+
+    def test_ai_uses_default_book(self):
+        ai = AI()
+        ai.difficulty = 3
+        game = Game(8, StandardRule())
+        ai.get_move(game)
+        self.assertEqual(ai.nodes_searched, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
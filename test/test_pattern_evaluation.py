@@ -0,0 +1,107 @@
+import os
+import random
+import tempfile
+import unittest
+
+from client.model.pattern_evaluation import (
+    NUM_PHASES,
+    SCALE,
+    PatternTables,
+    fit_tables,
+    get_default_tables,
+    get_pattern_indexes,
+    get_patterns,
+    get_phase,
+    get_table_sizes,
+    play_corpus,
+    write_tables,
+)
+
+
+def random_position(size, rng):
+    own = 0
+    opp = 0
+    for index in range(size * size):
+        owner = rng.randrange(3)
+        if owner == 1:
+            own |= 1 << index
+        elif owner == 2:
+            opp |= 1 << index
+    return own, opp
+
+
+class TestPatternEvaluation(unittest.TestCase):
+    def test_patterns(self):
+        for size in (4, 6, 8, 10):
+            patterns = get_patterns(size)
+            table_sizes = get_table_sizes(size)
+            for shape_index, cells in patterns:
+                self.assertEqual(3 ** len(cells), table_sizes[shape_index])
+                self.assertTrue(all(0 <= cell < size * size for cell in cells))
+        # 4 corners, 4 edges, 4 rows next to an edge and 2 diagonals
+        self.assertEqual(len(get_patterns(8)), 14)
+
+    def test_pattern_indexes(self):
+        rng = random.Random(3)
+        for size in (4, 6, 8, 10):
+            for _ in range(20):
+                own, opp = random_position(size, rng)
+                indexes = get_pattern_indexes(own, opp, size)
+                for (_, cells), index in zip(get_patterns(size), indexes):
+                    expected = 0
+                    for digit, cell in enumerate(cells):
+                        if own >> cell & 1:
+                            expected += 3**digit
+                        elif opp >> cell & 1:
+                            expected += 2 * 3**digit
+                    self.assertEqual(index, expected)
+
+    def test_write_and_load(self):
+        rng = random.Random(4)
+        size = 6
+        weights = [
+            rng.randrange(-1000, 1000)
+            for _ in range(NUM_PHASES * sum(get_table_sizes(size)))
+        ]
+        path = os.path.join(tempfile.mkdtemp(), "patterns.bin")
+        write_tables(path, size, weights)
+        tables = PatternTables.load(path)
+        self.assertEqual(tables.size, size)
+        offsets = [0]
+        for table_size in get_table_sizes(size):
+            offsets.append(offsets[-1] + table_size)
+        for _ in range(20):
+            own, opp = random_position(size, rng)
+            phase_offset = get_phase(own, opp, size) * offsets[-1]
+            expected = sum(
+                weights[phase_offset + offsets[shape_index] + index]
+                for (shape_index, _), index in zip(
+                    get_patterns(size), get_pattern_indexes(own, opp, size)
+                )
+            )
+            self.assertEqual(tables.evaluate(own, opp), expected)
+        with self.assertRaises(ValueError):
+            PatternTables(size, weights[:-1])
+
+    def test_fit_tables(self):
+        size = 6
+        corpus = play_corpus(size, 20, 0, 4, seed=1)
+        tables = PatternTables(size, fit_tables(size, corpus, epochs=50))
+        fitted_error = 0.0
+        zero_error = 0.0
+        for positions, disk_difference in corpus:
+            for player1_discs, player2_discs in positions:
+                prediction = tables.evaluate(player1_discs, player2_discs) / SCALE
+                fitted_error += (prediction - disk_difference) ** 2
+                zero_error += disk_difference**2
+        self.assertLess(fitted_error, zero_error / 2)
+
+    def test_default_tables(self):
+        tables = get_default_tables(8)
+        self.assertIsNotNone(tables)
+        self.assertEqual(tables.size, 8)
+        self.assertIsNone(get_default_tables(5))
+
+
+if __name__ == "__main__":
+    unittest.main()
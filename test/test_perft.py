@@ -0,0 +1,50 @@
+import unittest
+
+from client.model.game import Game
+from client.model.perft import (
+    FIXED_COUNTS,
+    FIXED_DEPTH,
+    SIZES,
+    START_COUNTS,
+    divide,
+    get_fixed_positions,
+    perft,
+    run_perft,
+)
+from client.model.standard_rule import StandardRule
+
+
+class TestPerft(unittest.TestCase):
+    def test_start_counts(self):
+        for size in SIZES:
+            game = Game(size, StandardRule())
+            for depth in range(1, 5):
+                self.assertEqual(
+                    perft(game, depth), START_COUNTS[size][depth - 1], (size, depth)
+                )
+        result = run_perft(Game(8, StandardRule()), 5)
+        self.assertEqual(result.nodes, START_COUNTS[8][4])
+        self.assertGreater(result.nodes_per_second, 0)
+
+    def test_fixed_counts(self):
+        # The larger boards are left to python -m client.model.perft to keep the tests quick
+        for size in (4, 6, 8, 10):
+            counts = tuple(
+                perft(Game.from_position(position, StandardRule()), FIXED_DEPTH)
+                for position in get_fixed_positions(size)
+            )
+            self.assertEqual(counts, FIXED_COUNTS[size], size)
+
+    def test_divide(self):
+        game = Game(6, StandardRule())
+        game.place_tile((1, 2))
+        position = game.get_position()
+        counts = divide(game, 4)
+        self.assertEqual(set(counts), set(game.get_valid_move_flips()))
+        self.assertEqual(sum(counts.values()), perft(game, 4))
+        self.assertEqual(game.get_position(), position)
+        self.assertEqual(len(game.get_move_history()), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
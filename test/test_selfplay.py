@@ -0,0 +1,59 @@
+import argparse
+import unittest
+
+from client.selfplay import (
+    EngineConfig,
+    GameRecord,
+    parse_engine,
+    run_tournament,
+    summarize,
+)
+
+
+class TestSelfPlay(unittest.TestCase):
+    def test_tournament(self):
+        engines = (EngineConfig("alpha_beta", 1), EngineConfig("alpha_beta", 0))
+        records = list(run_tournament([4, 6], engines, 4, random_moves=2))
+        self.assertEqual(len(records), 8)
+        for record in records:
+            # Engines swap sides every game
+            self.assertEqual(
+                record.engines, (0, 1) if record.index % 2 == 0 else (1, 0)
+            )
+            self.assertLessEqual(sum(record.score), record.size * record.size)
+            self.assertEqual(sum(record.ai_moves) + 2, len(record.moves))
+            self.assertEqual(GameRecord.from_json(record.to_json()).moves, record.moves)
+        # Each pair of games starts with the same random moves
+        self.assertEqual(records[0].moves[:2], records[1].moves[:2])
+
+        stats = summarize(records)
+        for engine_stats in stats:
+            self.assertEqual(engine_stats.games, len(records))
+            self.assertGreater(engine_stats.moves, 0)
+        self.assertEqual(
+            stats[0].wins + stats[0].draws, stats[1].losses + stats[1].draws
+        )
+        self.assertAlmostEqual(stats[0].win_rate + stats[1].win_rate, 1)
+
+    def test_workers(self):
+        engines = (EngineConfig("alpha_beta", 1), EngineConfig("alpha_beta", 0))
+        records = list(run_tournament([6], engines, 4, random_moves=1, workers=2))
+        self.assertEqual([record.index for record in records], [0, 1, 2, 3])
+        # The same games are played in worker processes as in this one
+        self.assertEqual(
+            [record.moves for record in records],
+            [record.moves for record in run_tournament([6], engines, 4, 1)],
+        )
+
+    def test_parse_engine(self):
+        self.assertEqual(str(parse_engine("mcts:2")), "mcts:2")
+        self.assertEqual(parse_engine("alpha_beta").difficulty, 0)
+        engine = parse_engine("mcts:0")
+        engine.playouts = 50
+        self.assertEqual(engine.create_ai().playouts, 50)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            parse_engine("unknown:1")
+
+
+if __name__ == "__main__":
+    unittest.main()
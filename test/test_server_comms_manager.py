@@ -0,0 +1,208 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from typing import Any, Dict, List, Tuple
+from unittest import mock
+
+import server.client_comms.response_manager as response_manager
+from common.framing import FRAMING_VERSION, REQUEST_ID, create_framing, encode_hello
+from server.client_comms.base_client_response import BaseClientResponse
+from server.client_comms.server_comms_manager import ServerCommsManager
+
+
+class DelayedClientResponse(BaseClientResponse):
+    def __init__(self, message: Dict[str, Any]) -> None:
+        super().__init__(message=message)
+        self._result: Any = None
+        self._complete: asyncio.Event = asyncio.Event()
+
+    async def respond(self) -> Dict[str, Any]:
+        # Answer from another thread, as the database manager does
+        threading.Timer(
+            self._sent_message.get("delay", 0.2),
+            self.__callback,
+            (self._sent_message["value"],),
+        ).start()
+        await self._wait_for(self._complete, lambda: self._result is not None)
+        self._response_message.update(
+            {
+                "protocol_type": "delayed",
+                "value": self._result,
+                "keys": len(self._sent_message),
+            }
+        )
+        return self._response_message
+
+    def __callback(self, result: Any) -> None:
+        self._result = result
+        self._notify(self._complete)
+
+
+class TestServerCommsManager(unittest.IsolatedAsyncioTestCase):
+    async def test_idle_connections(self):
+        server_comms_manager = ServerCommsManager()
+        server = await server_comms_manager.start("localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        connections: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        try:
+            for _ in range(1000):
+                connections.append(await asyncio.open_connection("localhost", port))
+            while server_comms_manager.num_connections < len(connections):
+                await asyncio.sleep(0.01)
+
+            # Clients are still served while the others sit idle. An invalid message needs no database
+            reader, writer = connections[-1]
+            writer.write(b'{"protocol_type": "create_game"}$$')
+            response = await asyncio.wait_for(reader.readuntil(b"$$"), 5)
+            self.assertEqual(
+                json.loads(response[:-2]),
+                {"protocol_type": "create_game", "success": False, "game_id": 0},
+            )
+        finally:
+            for _, writer in connections:
+                writer.close()
+            server.close()
+            await server.wait_closed()
+        while server_comms_manager.num_connections > 0:
+            await asyncio.sleep(0.01)
+
+    async def test_length_prefix_framing(self):
+        server = await ServerCommsManager().start("localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            # The server uses the highest version both ends support
+            for offered, version in (
+                (1, 1),
+                (FRAMING_VERSION, FRAMING_VERSION),
+                (99, 2),
+            ):
+                reader, writer = await asyncio.open_connection("localhost", port)
+                writer.write(encode_hello(offered))
+                self.assertEqual(await reader.readexactly(4), encode_hello(version))
+                framing = create_framing(version)
+                # Two requests in one write, the second containing the legacy delimiter
+                writer.write(
+                    framing.encode_message({"protocol_type": "create_game"})
+                    + framing.encode_message(
+                        {"protocol_type": "create_game", "rules": "$$"}
+                    )
+                )
+                responses = []
+                while len(responses) < 2:
+                    responses += framing.feed(await asyncio.wait_for(reader.read(1), 5))
+                for response in responses:
+                    self.assertEqual(
+                        framing.decode_message(response),
+                        {
+                            "protocol_type": "create_game",
+                            "success": False,
+                            "game_id": 0,
+                        },
+                    )
+                writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    async def test_pipelining(self):
+        server = await ServerCommsManager().start("localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("localhost", port)
+        with mock.patch.dict(
+            response_manager.ResponseManager._protocol_type_response_dict,
+            {"delayed": DelayedClientResponse.__name__},
+        ), mock.patch.dict(
+            vars(response_manager),
+            {DelayedClientResponse.__name__: DelayedClientResponse},
+        ):
+            try:
+                writer.write(encode_hello())
+                self.assertEqual(await reader.readexactly(4), encode_hello())
+                framing = create_framing(FRAMING_VERSION)
+                # Requests sent together are answered as each is ready
+                for request_id, delay in ((1, 0.6), (2, 0.3), (3, 0.0)):
+                    message = {"protocol_type": "delayed", "value": request_id * 10}
+                    message.update({"delay": delay, REQUEST_ID: request_id})
+                    writer.write(framing.encode_message(message))
+                start_time = time.perf_counter()
+                responses = []
+                while len(responses) < 3:
+                    responses += framing.feed(
+                        await asyncio.wait_for(reader.read(1024), 5)
+                    )
+                self.assertLess(time.perf_counter() - start_time, 0.6 + 0.3)
+                self.assertEqual(
+                    [framing.decode_message(response) for response in responses],
+                    [
+                        # The envelope is stripped before the request is handled, and the ID is echoed
+                        {
+                            "protocol_type": "delayed",
+                            "value": value,
+                            "keys": 3,
+                            REQUEST_ID: request_id,
+                        }
+                        for request_id, value in ((3, 30), (2, 20), (1, 10))
+                    ],
+                )
+            finally:
+                writer.close()
+                server.close()
+                await server.wait_closed()
+
+    async def test_bad_requests(self):
+        server = await ServerCommsManager().start("localhost", 0)
+        port = server.sockets[0].getsockname()[1]
+        invalid_response = {
+            "protocol_type": "create_game",
+            "success": False,
+            "game_id": 0,
+        }
+        try:
+            # A legacy message that is not an object is dropped
+            reader, writer = await asyncio.open_connection("localhost", port)
+            writer.write(b"[1]$$" + b'{"protocol_type": "create_game"}$$')
+            response = await asyncio.wait_for(reader.readuntil(b"$$"), 5)
+            self.assertEqual(json.loads(response[:-2]), invalid_response)
+            writer.close()
+
+            reader, writer = await asyncio.open_connection("localhost", port)
+            writer.write(encode_hello(1))
+            self.assertEqual(await reader.readexactly(4), encode_hello(1))
+            framing = create_framing(1)
+            # A request that fails while being handled gets no response, and the connection is still served
+            with mock.patch("builtins.print") as mock_print:
+                for message in (
+                    [1],
+                    {"protocol_type": ["create_game"], REQUEST_ID: 1},
+                    {"protocol_type": "create_game", REQUEST_ID: 2},
+                ):
+                    writer.write(framing.encode_message(message))
+                responses = []
+                while not responses:
+                    data = await asyncio.wait_for(reader.read(1), 5)
+                    self.assertTrue(data, "Connection closed")
+                    responses += framing.feed(data)
+            self.assertEqual(
+                framing.decode_message(responses[0]),
+                dict(invalid_response, **{REQUEST_ID: 2}),
+            )
+            self.assertIn("Failed to respond", str(mock_print.call_args_list))
+            writer.close()
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    async def test_callback_from_thread(self):
+        start_time = time.perf_counter()
+        responses = await asyncio.gather(
+            *(DelayedClientResponse({"value": value}).respond() for value in range(5))
+        )
+        # The responses wait for their callbacks at the same time
+        self.assertLess(time.perf_counter() - start_time, 0.2 * 5)
+        self.assertEqual([response["value"] for response in responses], list(range(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import random
+import unittest
+
+from client.model.board import Board
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+
+
+class TestStandardRule(unittest.TestCase):
+    def test_get_valid_moves_matches_is_valid_move(self):
+        rng = random.Random(3)
+        for size in (4, 6, 8):
+            game = Game(size, StandardRule())
+            game.board = Board(size)
+            while not game.is_game_over():
+                for player in (1, 2):
+                    valid_moves = StandardRule.get_valid_moves(player, game.board)
+                    self.assertEqual(
+                        sorted(valid_moves),
+                        [
+                            (x, y)
+                            for x in range(size)
+                            for y in range(size)
+                            if StandardRule.is_valid_move(player, (x, y), game.board)
+                        ],
+                    )
+                    self.assertEqual(
+                        StandardRule.has_valid_move(player, game.board),
+                        len(valid_moves) > 0,
+                    )
+                game.place_tile(rng.choice(sorted(game.get_valid_move_flips())))
+
+    def test_get_valid_moves_flips(self):
+        board = Board(4)
+        self.assertEqual(
+            StandardRule.get_valid_moves(1, board),
+            {(0, 1): [(1, 1)], (1, 0): [(1, 1)], (2, 3): [(2, 2)], (3, 2): [(2, 2)]},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
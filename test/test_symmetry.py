@@ -0,0 +1,75 @@
+import random
+import unittest
+
+from client.model.bit_board import BitBoard
+from client.model.board import Board
+from client.model.game import Game
+from client.model.standard_rule import StandardRule
+from client.model.symmetry import (
+    NUM_SYMMETRIES,
+    get_canonical_form,
+    get_symmetries,
+    transform_cell,
+    transform_mask,
+    untransform_cell,
+)
+
+
+class TestSymmetry(unittest.TestCase):
+    def test_symmetries(self):
+        for size in (4, 6, 8):
+            symmetries = get_symmetries(size)
+            self.assertEqual(len(set(symmetries)), NUM_SYMMETRIES)
+            for permutation in symmetries:
+                self.assertEqual(sorted(permutation), list(range(size * size)))
+
+    def test_transform_cell(self):
+        for size in (4, 8):
+            for symmetry in range(NUM_SYMMETRIES):
+                for index in range(size * size):
+                    moved = transform_cell(index, symmetry, size)
+                    self.assertEqual(untransform_cell(moved, symmetry, size), index)
+
+    def test_transform_mask(self):
+        rng = random.Random(0)
+        for size in (4, 5, 6, 8, 10):
+            for _ in range(20):
+                mask = rng.getrandbits(size * size)
+                for symmetry, permutation in enumerate(get_symmetries(size)):
+                    expected = sum(
+                        1 << permutation[i] for i in range(size * size) if mask >> i & 1
+                    )
+                    self.assertEqual(transform_mask(mask, symmetry, size), expected)
+
+    def test_canonical_form(self):
+        game = Game(8, StandardRule())
+        for move in ((2, 3), (2, 2), (2, 1)):
+            game.place_tile(move)
+        player1 = game.board.get_discs(1)
+        player2 = game.board.get_discs(2)
+        canonical1, canonical2, symmetry = game.board.get_canonical_form()
+        self.assertEqual(transform_mask(player1, symmetry, 8), canonical1)
+        self.assertEqual(transform_mask(player2, symmetry, 8), canonical2)
+        key = game.get_canonical_hash()[0]
+        for symmetry in range(NUM_SYMMETRIES):
+            symmetric1 = transform_mask(player1, symmetry, 8)
+            symmetric2 = transform_mask(player2, symmetry, 8)
+            self.assertEqual(
+                get_canonical_form(symmetric1, symmetric2, 8)[:2],
+                (canonical1, canonical2),
+            )
+            symmetric_game = Game.from_position(
+                (8, symmetric1, symmetric2, game.curr_player), StandardRule()
+            )
+            self.assertEqual(symmetric_game.get_canonical_hash()[0], key)
+        game.curr_player = 3 - game.curr_player
+        self.assertNotEqual(game.get_canonical_hash()[0], key)
+
+    def test_boards_agree(self):
+        board = Board(6)
+        bit_board = BitBoard(6)
+        self.assertEqual(board.get_canonical_form(), bit_board.get_canonical_form())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from client.model.transposition_table import Bound, TranspositionTable
+
+
+class TestTranspositionTable(unittest.TestCase):
+    def test_store_and_probe(self):
+        table = TranspositionTable()
+        self.assertIsNone(table.probe(12345))
+        table.store(12345, 3, Bound.exact, 40, (2, 3))
+        entry = table.probe(12345)
+        self.assertIsNotNone(entry)
+        self.assertEqual(
+            (entry.depth, entry.bound, entry.score, entry.best_move),
+            (3, Bound.exact, 40, (2, 3)),
+        )
+        self.assertEqual((table.hits, table.probes), (1, 2))
+        table.clear()
+        self.assertIsNone(table.probe(12345))
+
+    def test_memory_cap(self):
+        table = TranspositionTable(max_bytes=10 * TranspositionTable._ENTRY_BYTES)
+        self.assertEqual(table.get_num_slots(), 10)
+        for key in range(1000):
+            table.store(key, 1, Bound.exact, key, None)
+        self.assertEqual(len(table), 10)
+
+    def test_replacement_policy(self):
+        table = TranspositionTable(max_bytes=TranspositionTable._ENTRY_BYTES)
+        table.store(1, 5, Bound.exact, 10, (0, 0))
+        # A shallower result from the same search does not replace a deeper one
+        table.store(2, 2, Bound.lower, 20, (1, 1))
+        self.assertIsNotNone(table.probe(1))
+        self.assertIsNone(table.probe(2))
+        # A result at least as deep does
+        table.store(2, 5, Bound.lower, 20, (1, 1))
+        self.assertIsNone(table.probe(1))
+        self.assertEqual(table.probe(2).score, 20)
+        # Anything replaces a result from an earlier search
+        table.new_search()
+        table.store(3, 1, Bound.upper, 30, None)
+        self.assertEqual(table.probe(3).score, 30)
+        # A result without a best move keeps the old one for move ordering
+        table.store(3, 2, Bound.exact, 35, None)
+        table.store(3, 3, Bound.exact, 36, (4, 4))
+        table.store(3, 4, Bound.exact, 37, None)
+        self.assertEqual(table.probe(3).best_move, (4, 4))
+
+
+if __name__ == "__main__":
+    unittest.main()
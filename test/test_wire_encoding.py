@@ -0,0 +1,99 @@
+import json
+import random
+import unittest
+
+from schema import Optional, Or  # type: ignore
+
+import common.client_server_protocols as protocols
+from common.wire_encoding import MAX_DEPTH, NAMES, WireEncodingError, pack, unpack
+
+
+class TestWireEncoding(unittest.TestCase):
+    def test_round_trip(self):
+        values = [
+            None,
+            True,
+            False,
+            0,
+            -1,
+            2**63 - 1,
+            -(2**63),
+            1.5,
+            "",
+            "é$$",
+            "protocol_type",
+            [],
+            [[]],
+            {"a": [1, "b"], 3: None},
+            # Not boards
+            [[0, 1], [2]],
+            [[0, 4]],
+            [[0, -1]],
+            [[True, 1]],
+            [[1.0, 0]],
+            [["a", 1]],
+        ]
+        for value in values:
+            decoded = unpack(pack(value))
+            self.assertEqual(decoded, value)
+            self.assertEqual(json.dumps(decoded), json.dumps(value))
+        self.assertEqual(unpack(pack((1, (2,)))), [1, [2]])
+
+    def test_boards(self):
+        rng = random.Random(0)
+        for rows, columns in ((1, 1), (1, 5), (3, 7), (4, 4), (8, 8), (20, 20)):
+            board = [[rng.randrange(4) for _ in range(columns)] for _ in range(rows)]
+            message = {"protocol_type": "save_game", "board_state": board}
+            encoded = pack(message)
+            self.assertEqual(unpack(encoded), message)
+            # 2 bits per square, plus the tags, the names and the board's size
+            self.assertEqual(len(encoded), 11 + (rows * columns + 3) // 4)
+
+    def test_names(self):
+        # Every field name and protocol type is sent as one byte
+        self.assertEqual(len(set(NAMES)), len(NAMES))
+        self.assertLessEqual(len(NAMES), 256)
+        for name in dir(protocols):
+            if name.endswith("_schema"):
+                for key, value in getattr(protocols, name).schema.items():
+                    if isinstance(key, (Optional, Or)):
+                        keys = key.args if isinstance(key, Or) else [key.schema]
+                    else:
+                        keys = [key]
+                    for key_name in keys:
+                        self.assertIn(key_name, NAMES)
+                    if key == "protocol_type":
+                        self.assertIn(value, NAMES)
+
+    def test_corrupt(self):
+        encoded = pack({"protocol_type": "login", "username": "name"})
+        for data in (
+            b"",
+            encoded[:-1],
+            encoded + b"\x00",
+            b"\xff",
+            b"\x09\x02\x02",
+            # A float cut short
+            b"\x04\x00",
+            # A dict keyed by a list
+            bytes([8, 1, 7, 0, 0]),
+            # Lists nested far too deeply
+            b"\x07\x01" * 5000 + b"\x00",
+            # A varint that never ends, which would take quadratic time to decode
+            b"\x03" + b"\xff" * 1000000,
+            # A varint past 64 bits
+            b"\x03" + b"\xff" * 10 + b"\x01",
+        ):
+            with self.assertRaises(WireEncodingError):
+                unpack(data)
+        nested: list = []
+        for _ in range(MAX_DEPTH):
+            nested = [nested]
+        self.assertEqual(unpack(pack(nested)), nested)
+        for value in ({"value": object()}, {(1, 2): 0}, [nested], 2**63, -(2**63) - 1):
+            with self.assertRaises(WireEncodingError):
+                pack(value)
+
+
+if __name__ == "__main__":
+    unittest.main()